@@ -1,10 +1,20 @@
+## Time every phase of the boot; reported by index.py once the pages are set up
+from startup import profile as startup
+
+## dash, then pandas and plotly, which utils uses
+startup.import_modules(['dash', 'pandas', 'plotly.graph_objs'])
 import dash
-import pandas as pd
 import os
-import base64
-import time
 
-start_time = time.time()
+from dataset_manager import DatasetManager
+from figure_cache import FigureCache
+from static_assets import StaticAssets, fingerprint
+from conditional_get import ConditionalResponses, DASH_ENDPOINTS, build_fingerprint
+from compressed_responses import CompressedResponses
+from flask_compress import Compress
+
+# link preview image for og:image and twitter:image, served from assets/ under a fingerprinted URL
+preview_image = 'https://da2i-dashboards.org/assets/DA2I-2019-logo.jpg?v=' + fingerprint('./assets/DA2I-2019-logo.jpg')
 external_stylesheets = ["https://fonts.googleapis.com/css?family=Raleway:300,400,600&display=swap",
     "https://maxcdn.bootstrapcdn.com/font-awesome/4.7.0/css/font-awesome.min.css",
     "https://stackpath.bootstrapcdn.com/bootstrap/4.4.1/css/bootstrap.min.css", 
@@ -33,7 +43,7 @@ app = dash.Dash(__name__, external_stylesheets=external_stylesheets, meta_tags=[
     },
     {
         'name': 'og:image',
-        'content': 'data:image/png;base64,/9j/4AAQSkZJRgABAgECWAJYAAD/7QAsUGhvdG9zaG9wIDMuMAA4QklNA+0AAAAAABACWAAAAAEAAQJYAAAAAQAB/+IMWElDQ19QUk9GSUxFAAEBAAAMSExpbm8CEAAAbW50clJHQiBYWVogB84AAgAJAAYAMQAAYWNzcE1TRlQAAAAASUVDIHNSR0IAAAAAAAAAAAAAAAAAAPbWAAEAAAAA0y1IUCAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARY3BydAAAAVAAAAAzZGVzYwAAAYQAAABsd3RwdAAAAfAAAAAUYmtwdAAAAgQAAAAUclhZWgAAAhgAAAAUZ1hZWgAAAiwAAAAUYlhZWgAAAkAAAAAUZG1uZAAAAlQAAABwZG1kZAAAAsQAAACIdnVlZAAAA0wAAACGdmlldwAAA9QAAAAkbHVtaQAAA/gAAAAUbWVhcwAABAwAAAAkdGVjaAAABDAAAAAMclRSQwAABDwAAAgMZ1RSQwAABDwAAAgMYlRSQwAABDwAAAgMdGV4dAAAAABDb3B5cmlnaHQgKGMpIDE5OTggSGV3bGV0dC1QYWNrYXJkIENvbXBhbnkAAGRlc2MAAAAAAAAAEnNSR0IgSUVDNjE5NjYtMi4xAAAAAAAAAAAAAAASc1JHQiBJRUM2MTk2Ni0yLjEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFhZWiAAAAAAAADzUQABAAAAARbMWFlaIAAAAAAAAAAAAAAAAAAAAABYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9kZXNjAAAAAAAAABZJRUMgaHR0cDovL3d3dy5pZWMuY2gAAAAAAAAAAAAAABZJRUMgaHR0cDovL3d3dy5pZWMuY2gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAZGVzYwAAAAAAAAAuSUVDIDYxOTY2LTIuMSBEZWZhdWx0IFJHQiBjb2xvdXIgc3BhY2UgLSBzUkdCAAAAAAAAAAAAAAAuSUVDIDYxOTY2LTIuMSBEZWZhdWx0IFJHQiBjb2xvdXIgc3BhY2UgLSBzUkdCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGRlc2MAAAAAAAAALFJlZmVyZW5jZSBWaWV3aW5nIENvbmRpdGlvbiBpbiBJRUM2MTk2Ni0yLjEAAAAAAAAAAAAAACxSZWZlcmVuY2UgVmlld2luZyBDb25kaXRpb24gaW4gSUVDNjE5NjYtMi4xAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB2aWV3AAAAAAATpP4AFF8uABDPFAAD7cwABBMLAANcngAAAAFYWVogAAAAAABMCVYAUAAAAFcf521lYXMAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAKPAAAAAnNpZyAAAAAAQ1JUIGN1cnYAAAAAAAAEAAAAAAUACgAPABQAGQAeACMAKAAtADIANwA7AEAARQBKAE8AVABZAF4AYwBoAG0AcgB3AHwAgQCGAIsAkACVAJoAnwCkAKkArgCyALcAvADBAMYAywDQANUA2wDgAOUA6wDwAPYA+wEBAQcBDQETARkBHwElASsBMgE4AT4BRQFMAVIBWQFgAWcBbgF1AXwBgwGLAZIBmgGhAakBsQG5AcEByQHRAdkB4QHpAfIB+gIDAgwCFAIdAiYCLwI4AkECSwJUAl0CZwJxAnoChAKOApgCogKsArYCwQLLAtUC4ALrAvUDAAMLAxYDIQMtAzgDQwNPA1oDZgNyA34DigOWA6IDrgO6A8cD0wPgA+wD+QQGBBMEIAQtBDsESARVBGMEcQR+BIwEmgSoBLYExATTBOEE8AT+BQ0FHAUrBToFSQVYBWcFdwWGBZYFpgW1BcUF1QXlBfYGBgYWBicGNwZIBlkGagZ7BowGnQavBsAG0QbjBvUHBwcZBysHPQdPB2EHdAeGB5kHrAe/B9IH5Qf4CAsIHwgyCEYIWghuCIIIlgiqCL4I0gjnCPsJEAklCToJTwlkCXkJjwmkCboJzwnlCfsKEQonCj0KVApqCoEKmAquCsUK3ArzCwsLIgs5C1ELaQuAC5gLsAvIC+EL+QwSDCoMQwxcDHUMjgynDMAM2QzzDQ0NJg1ADVoNdA2ODakNww3eDfgOEw4uDkkOZA5/DpsOtg7SDu4PCQ8lD0EPXg96D5YPsw/PD+wQCRAmEEMQYRB+EJsQuRDXEPURExExEU8RbRGMEaoRyRHoEgcSJhJFEmQShBKjEsMS4xMDEyMTQxNjE4MTpBPFE+UUBhQnFEkUahSLFK0UzhTwFRIVNBVWFXgVmxW9FeAWAxYmFkkWbBaPFrIW1hb6Fx0XQRdlF4kXrhfSF/cYGxhAGGUYihivGNUY+hkgGUUZaxmRGbcZ3RoEGioaURp3Gp4axRrsGxQbOxtjG4obshvaHAIcKhxSHHscoxzMHPUdHh1HHXAdmR3DHeweFh5AHmoelB6+HukfEx8+H2kflB+/H+ogFSBBIGwgmCDEIPAhHCFIIXUhoSHOIfsiJyJVIoIiryLdIwojOCNmI5QjwiPwJB8kTSR8JKsk2iUJJTglaCWXJccl9yYnJlcmhya3JugnGCdJJ3onqyfcKA0oPyhxKKIo1CkGKTgpaymdKdAqAio1KmgqmyrPKwIrNitpK50r0SwFLDksbiyiLNctDC1BLXYtqy3hLhYuTC6CLrcu7i8kL1ovkS/HL/4wNTBsMKQw2zESMUoxgjG6MfIyKjJjMpsy1DMNM0YzfzO4M/E0KzRlNJ402DUTNU01hzXCNf02NzZyNq426TckN2A3nDfXOBQ4UDiMOMg5BTlCOX85vDn5OjY6dDqyOu87LTtrO6o76DwnPGU8pDzjPSI9YT2hPeA+ID5gPqA+4D8hP2E/oj/iQCNAZECmQOdBKUFqQaxB7kIwQnJCtUL3QzpDfUPARANER0SKRM5FEkVVRZpF3kYiRmdGq0bwRzVHe0fASAVIS0iRSNdJHUljSalJ8Eo3Sn1KxEsMS1NLmkviTCpMcky6TQJNSk2TTdxOJU5uTrdPAE9JT5NP3VAnUHFQu1EGUVBRm1HmUjFSfFLHUxNTX1OqU/ZUQlSPVNtVKFV1VcJWD1ZcVqlW91dEV5JX4FgvWH1Yy1kaWWlZuFoHWlZaplr1W0VblVvlXDVchlzWXSddeF3JXhpebF69Xw9fYV+zYAVgV2CqYPxhT2GiYfViSWKcYvBjQ2OXY+tkQGSUZOllPWWSZedmPWaSZuhnPWeTZ+loP2iWaOxpQ2maafFqSGqfavdrT2una/9sV2yvbQhtYG25bhJua27Ebx5veG/RcCtwhnDgcTpxlXHwcktypnMBc11zuHQUdHB0zHUodYV14XY+dpt2+HdWd7N4EXhueMx5KnmJeed6RnqlewR7Y3vCfCF8gXzhfUF9oX4BfmJ+wn8jf4R/5YBHgKiBCoFrgc2CMIKSgvSDV4O6hB2EgITjhUeFq4YOhnKG14c7h5+IBIhpiM6JM4mZif6KZIrKizCLlov8jGOMyo0xjZiN/45mjs6PNo+ekAaQbpDWkT+RqJIRknqS45NNk7aUIJSKlPSVX5XJljSWn5cKl3WX4JhMmLiZJJmQmfyaaJrVm0Kbr5wcnImc951kndKeQJ6unx2fi5/6oGmg2KFHobaiJqKWowajdqPmpFakx6U4pammGqaLpv2nbqfgqFKoxKk3qamqHKqPqwKrdavprFys0K1ErbiuLa6hrxavi7AAsHWw6rFgsdayS7LCszizrrQltJy1E7WKtgG2ebbwt2i34LhZuNG5SrnCuju6tbsuu6e8IbybvRW9j74KvoS+/796v/XAcMDswWfB48JfwtvDWMPUxFHEzsVLxcjGRsbDx0HHv8g9yLzJOsm5yjjKt8s2y7bMNcy1zTXNtc42zrbPN8+40DnQutE80b7SP9LB00TTxtRJ1MvVTtXR1lXW2Ndc1+DYZNjo2WzZ8dp22vvbgNwF3IrdEN2W3hzeot8p36/gNuC94UThzOJT4tvjY+Pr5HPk/OWE5g3mlucf56noMui86Ubp0Opb6uXrcOv77IbtEe2c7ijutO9A78zwWPDl8XLx//KM8xnzp/Q09ML1UPXe9m32+/eK+Bn4qPk4+cf6V/rn+3f8B/yY/Sn9uv5L/tz/bf///+4AE0Fkb2JlAGQAAAAAAQUAAklE/9sAhAACAgICAgICAgICAwICAgMEAwMDAwQFBAQEBAQFBQUFBQUFBQUFBwgICAcFCQoKCgoJDAwMDAwMDAwMDAwMDAwMAQMCAgMDAwcFBQcNCwkLDQ8NDQ0NDw8MDAwMDA8PDAwMDAwMDwwODg4ODgwRERERERERERERERERERERERERERH/wAARCAIIAZIDAREAAhEBAxEB/8QBogAAAAcBAQEBAQAAAAAAAAAABAUDAgYBAAcICQoLAQACAgMBAQEBAQAAAAAAAAABAAIDBAUGBwgJCgsQAAIBAwMCBAIGBwMEAgYCcwECAxEEAAUhEjFBUQYTYSJxgRQykaEHFbFCI8FS0eEzFmLwJHKC8SVDNFOSorJjc8I1RCeTo7M2F1RkdMPS4ggmgwkKGBmElEVGpLRW01UoGvLj88TU5PRldYWVpbXF1eX1ZnaGlqa2xtbm9jdHV2d3h5ent8fX5/c4SFhoeIiYqLjI2Oj4KTlJWWl5iZmpucnZ6fkqOkpaanqKmqq6ytrq+hEAAgIBAgMFBQQFBgQIAwNtAQACEQMEIRIxQQVRE2EiBnGBkTKhsfAUwdHhI0IVUmJy8TMkNEOCFpJTJaJjssIHc9I14kSDF1STCAkKGBkmNkUaJ2R0VTfyo7PDKCnT4/OElKS0xNTk9GV1hZWltcXV5fVGVmZ2hpamtsbW5vZHV2d3h5ent8fX5/c4SFhoeIiYqLjI2Oj4OUlZaXmJmam5ydnp+So6SlpqeoqaqrrK2ur6/9oADAMBAAIRAxEAPwBTPmp+rXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/wCMtmy/6puq/wCqrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/AMZbNl/1TdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KtgE7AEn2xUml3B/5G+440jiHesxS7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/AFTdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXt/5A/ldF+annuHS9RMieXtIgOoaoYzxZ4kZVSBW7GR2AJ68QxG4zoPYj2bHbPaIxz+iI4pe7u+LzP8AwQfaqXYXZZyY/wC8keGPv6n4D7afrnoug6J5csYtM0DSbTR9PhACQWcSQoKClSEAqfEnc57do9Dp9JjEMMBGPcBT4Bru0NTrMpyZpmUj1JtNsvcd53+Yf5X+UfzL0e70zzDpcDXcsRW21JI1F5ayAHg8ctA1ATupPE9CM1Xb3s1oe1sBhmiL6Sr1D3H9Dt/Zz2q7Q7F1EcmCZq9436Ze8fpfjP5m8v3/AJU8w615a1NQL/Q7yaymK14s0Tlea1/ZYCoPgc8H7Q0OTR6qeGfOJIPwfo3svtDFr9Jj1GP6ZgSHxSPMdyXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff8AjLZsv+qbqv8AqqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Kv1H/5xB8k/4e/LmfzPcxcNQ853RnQnqLK1LRQClKir+o3XcFc9g/4FXY/5bss55D1ZDf8Amx2H22+H/wDBi7c/N9sDTxPpxCv86W5+yg+sc7V4J2KuxV+an/OZXkb9E+b9I88WkVLPzTb/AFa8I6C9s1Cgnp9uErT/AFGzyb/gs9jeBroaqI2mKP8AWj+sfc+z/wDAX7d/Mdnz0kjvjNj+rL9R+98ZZwb6M7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ksv8heTtS8/ebtD8p6Wp+satcLHJKASIIB8U0zeyICfwzN7F7Ky9pa2Gnx85H5DqfgHX9v9s4eyuz8mpycojl3noPiX7caRpVloWlaboumxehp+k2sVnbR/yxQoEQV+S59B6TS49NgjigKjEAD3B+aNZq8uqzzy5DcpEk+87pjlrS7FXYq8q/OryAv5k/l1r3lyKNW1RUF7pbN+ze21WjANQBzBaMk9AxzS+2HYf8q9lZMIHq5x/rDl8+Xxd77Ee0B7G7Yx5yfT9Mv6p5/Ln8H4wSxSwSyQTRtFNC5SRHBVlZTQqQdwQRngsomJo836PhOMogg7FTwJdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVUiilnljggjeaeZxHHHGCzOzGiqqipJJOwwxiZEADdE5xjEkmgH6P/AJFf84uaTo9ja+aPzM0yPVdeuVWW20a5Ae2slNCpuI/sySnurVVelC249U9i/wDgbYcGMZ9dHimdxA8o/wBYdT9j477ef8FTUajKdP2fMxgNjMfVL+qeg+0vo/Xfyi/LHzHZNYap5G0Z4ivBZLe0jtp4wK0Ec0CxyL16Bs6vW+ynY+qx8E8EPgBE/Aii8boPbDtvR5OPHqJ35kyHxErD5C8//wDOF88Zmvvy314Tp9oaXrBCuNhtFdIoU1NaB0Huxzhu3P8AgRzjc9Fkv+jLn8JD9PzfQfZ7/g1wNQ1+Ov6UOXxif0H4PjnzX5B85+RrprTzX5bvtFcOUWSaMmCQgkfup05RONuqsc4XtPsTX9nT4dRjMfeNvgeRfROyfaDs7tOHFpssZe47j3x5hiGYTsHpnkH8ofP35kXcUPlvQpmsWI9XU7pWhsYh3JmYUY/5K8m9s23Ynst2l2rMDBjNfzjtEfF0vtB7YdldjYyc+QcXSI3kfh+t+n/5M/kh5f8Ayh0yRreU6r5n1KJU1HU3XjVQeXowJvwjBAPUliKnsF9e9kfY3Tdh4iQeLIR6pfoHk+Je2vtzq/aDOLHDiifTH9Mu8/c9tzoXmXYq7FXYq7FXx3+e3/OMFv53u7zzh5FeLTfNNyWlvrCYhLW/kO5kR6fu5W7k/Cx3PE1Y8J7af8DiPaE5anSUMh3MTyl5+R+w+T6J7Bf8FKfZmOOl1lyxDaMh9UB3ecftHm/O/wAy+TvNPk68aw80aBe6HdKxUC6iZEeld45N0cbdVJGeX9odlazQ5ODPjMT5j7u99d7M7Z0PaOPj0+SMx5H7xzDG8xXMereSfyT/ADL8/PC2heWLlNPlI/3I3ym1swp/aEsgHMDuEDH2zcdj+yHa3aRHhYjw/wA47R+Z/Q6Ltz237F7KB8bMOL+bH1S+Q5fGn2x+Xn/OHflPRPSv/P1+3m3UAAfqNvztrCNqGoJBWWWhoQaoPFTnoHYP/An0Wnqerl4kv5osR/Wfs9z5r7R/8GXX6m4aKPhx/nGpTP6B9vvfRo/Kz8tFsX01fIHl5bKRODRrptsKgAgEsI+XLc/FWvetc6r/AEM9keHwfl4V/VH6njv9FfbXi+J+ZyX/AFpfrfA3/OQX/ONk/ko3fnLyLbSXXlD+8vbAFpJtN8WUmrPD7kkr3qN8819uv+B9Ls+9TpReLqOZh/x37n1b/gef8EyPaXDpdYay9JchP9UvvfHucO+hOxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/RP/AJxN/JnTINHtPzT1+2W81W/eQaHDIAyWsMbNG1zT/fjsrBaj4VFRu23qP/Aw9ksMcA1+YXI3wDuA24ve+Q/8Fz20zy1EuzsJqIrjP84nfh9w+34PuXPRHzB2KuxVQubW2vYJbW8t4ru2mHGSGZFkjceDKwIORyYoZImMgCD0LLFlnjmJQJBHUbFjEHkDyHbTLcW3knQLedDVZItNtUcHrUMIgcw4dhdmQlccEAf6sf1OdP2h7VnHhlqMhHcZy/Wy1VVVCqAqqKADYADsMzgAA68kkt4q7FXYq7FXYq7FXYqh7q0tb63ltL22ivLWccZIZ0WSNxWtGRgQenfIZcUMsDGYBB6HcM8WbJimJQJBHIjYsbt/IXkW0uEu7TyXoVrdRNzSaLTrVJFbxDLECDmJj7D7NhLijggD3iI/U5mT2g7UyQMZajIR3GUq+9lmZzgOxV2KrXRJUeKVFkjkUq6MAVZSKEEHYgjBKIkKKYyMTYflT/zk1+Tdh+WfmCw1ry4hi8r+aGmMdrWv1O6jo0kKk/7rYOCnh8Q7CvjP/BE9k8fZGqjkw/3c7ofzSOY93c+7f8C/20y9taSWLP8A3uOrP86J5H3975fzkXtnYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/wCqbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/W3/nFnzLZ6/8Ak/oVnAyi88tST6Zdxg7qyyNLG1OtGjlXfxr4Z7X/AMDTtDHqew8cRzgTE/Ox9hfAv+Ct2Zk0ntDkmeWQCQPwo/aH0XnVPHuxV2KuxV2KuxV4R52/5yP/ACp8kPLa3Gvfp7VIqhrLRlF2wYDo0oZYVNdiC9R4ZzfbH/BB7G7PJicnHLuh6vt5fa9T2H/wNe3u0wJRx8ET1n6fs+r7HzH5i/5za16ZmTyp5LsdPjAIEuqTyXTt1o3pw/Vgvy5NnI6//gw6qRrT4YjzkTL7uF7bs3/gH6WIvU6iUj3RAj9p4nk97/zlb+dl07NB5ktdNB6Lb6dZsBuenrwzH8c0uX/gme0EztlA90Y/pBd9h/4E3s1Ab4jL3yl+ghJov+clfzvhuJblPPk5kmryD2di8YqQfhja1KL07AZRH/ghe0MZmQ1B38o18qpyZ/8AAy9mZQETphQ/pSv58Vsm0z/nLf8AOWwkR7vUtN1pFpWO8sIkVunU2v1Y9uxzL03/AAUe3sZuU4y98R/veFwtV/wIfZzLGowlHzEj/vuJ7R5X/wCc2oGMUPnPyU0QLfvLvRp+YAPhbXHE7f8AGXN92b/wYRsNTg+MD/vT+t5vtT/gHSFnS6j4TH++j/xL6q8j/nB+Xf5hqi+WfMlvPfsKnT7g/V7wda0hl4s1KblOQ987Psb2s7K7UFYMo4v5p2l8j+h4Tt32N7Y7IN6jERH+cN4/Mcvi9MzbuldirsVdirsVdir4B/5zZ80Wbt5M8mwuHvoDNq90o/3XG49CAV8WKybew8c8z/4MPaOMnDphzFyPx2H6X1j/AIB/ZeQDUao/SagPPrL9D4FzzZ9VdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Kvp3/nFT8wm8nfmNBoV5cenonnULp8wY0RLsEm0k6gVLEx/7POt/4Gnbp0HaoxSPoyek/wBb+E/o+LxX/BY9nR2j2Oc0R68XqH9X+Ifp+D9W89ofB3Yq7FXYq8v/ADO/N3yf+VWmC88w3Zl1G5Qmy0u2Ktd3JG1QpI4oD1dqAe52zT+0ftVoexcPFmNyPKI+o/s83eey/sf2j27n4cEaiPqkfpj+3yfmd+Z3/OQvn/8AMqS4tJb5vL3lqUlV0jT3ZEdDTa5lHF5jsKg0WvRRnkntH7ddp9rExMuDH/Njy/zj1+7yfafZf/gddk9igSEePJ/Pl/vR/D9/m8IznXqHYq7FXYq7FXYqvilkhkSaGRopYmDI6EqysNwQRuCMYyMTYRKIkKI2fW35Uf8AOWHmvym9po/nky+bfLqlY/rTEHUrZK7kSsR6wFejnl2DgbZ23sx/wTtboSMeqvJj7/4x8evx+bwPtb/wJNBrxLLo6x5O7+CXw/h+Hyfo75V82eX/ADrotr5g8s6nFqul3eyyxHdHABaORDRkdaiqsARnqvZnaml7Q04zYJCUT+KPcXx3tbsjV9m6k4NRAxkOh+8d4ZFmU4bsVdiqE1C/s9LsL3U9QnW1sNOt5Lq5mevGOGFS8jmlTQKpOV58+PDilkmaiAST3Ac2zT6fJnyxxwFykQAO8nYB+I/5iecrz8wPOnmDzbeclbVrpngiY19G2SiQRf7GNQPnvnz7272tk7T1+TUS/iOw7h0HwD9L+znYuPsns3Fpofwjc955k/EsKzAdk7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVVhmlt5oriCRoZ4HWSORDRkdTVWBHQgjDGRjIEHcInCM4mJFgv29/LjzT/jXyH5U80t/f6xpsM1wAAoFyq8JwAOwlVqe2fQns92l/KHZuHP1lEX7+R+1+ZvaXsr+Te1c2n6RkQPdzj9jNs2DrHYq+f8A89vzz038pdJSzsli1LznqsTNYWbGscKdPrNwAQeAP2V6sdugJHMe2vtpi7Fw8MN8suQ7v6Uvxu9Z7Bewmbt/UcU7jhifUe/+jHz+5+UXmLzHrfmzWL3X/MOpTarq2oPzmuJ25E9lVR0VVGyqKADYCmeMa/X6jW55Zc0jKR5kvvHZ3Zum0GnjhwQEYDkAkmUOS7FXYq+5/wAnv+cSY9d0qy8zfmTdXVjBqEaz2mjWhEU3pOKq11IysV5A14KAw7sDVR6H7J/8C4anDHPrSQDuIjY1/SP6HzD2y/4Lx0ueWn0EQSNjM7i/6I/S+gtQ/wCcUPyUvbI2tt5evNJn2/0y01G6afYUO1xLcRb9fsZ0+f8A4GPs/kx8McZie8SN/wCyJH2PJaf/AILftLjy8UsokO4xjX+xET9r4N/Oz8itb/KG+trj6z+mvK2puUs9RCcGSUAn0LhATxegqCNmHTcEDzj2v9i9R2HkBvixy5S8+4+b6n7Ee3mm9oMRjXDljzj5fzonu+54RnOPUuxV2KvSfyx/NLzN+Vevx6zoM5ktJWVdQ02RiLe8iWvwuBWjCp4sBVT4ioO19nfaTV9jakZcJ2/ij0kPN03tR7K6Lt3SHFmG4+mQ5xPl+kP13/L78wfLn5leXLbzH5cufUhkolzbOQJ7ScAFoZlB2I7HoRuNs9v7B7e0va2lGbCfeOsT3F+fvaL2d1nYusODON+h6SHeGcZsXWOxV8t/85b+b5PLn5XPo9rIY7zzheR6eSvUW0Y9ac19+CofZs47/gpdqnS9j+FE75DXwG5e4/4EHY41nbniyG2IcX+cdo/r+D8q88bfdXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/AMZbNl/1TdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXp/wCXP5P+evzQujF5Y0r/AHHwuEuNTuyYbKDcVDSUJZhWvFAzU3pTNt2B7K9o9sTrBDbrI7RHx/Vu6T2k9sey+w8d6ifqPKI3kfh+k0H2l5V/5ws8qWcSS+cPM2oa1dlQWh04JZ26t3HJ1mkYeBqvyzv+zP8AgQ6OEb1OWUj3R9I+2z9z5v2t/wAG3X5JVpcMYjvlcj9lAfa9Uh/5xa/I2KJI38mvcuooZZNS1EM3uQl2i/cBm5h/wNfZ2MaOG/Pil+iTop/8FX2nlKxnryEIfpiWJ6//AM4d/lXqcc50efVvLdw3Ixehci5hQk1AZLhZHYDpT1AffMHXf8CfsfKD4ZlA9KNj5Hf7XP7P/wCDL27hI8UQmOtjhPzjQ+x8nfmT/wA4t/mB5EhudU0sJ5y0C3DO9xYRst1FGtSXmtSWYAAVJRnA70zi/aH/AIG/afZsTkh+8gOseY98f1W977M/8FTsntSQx5P3WQ9JfST5S/XT5n6bHYjOTe0dirsVdir9lP8AnHzTrjS/yZ8gW1ypSSTTjdAMKHhdzS3EZp7pKM939hMEsPYGnjL+bf8ApiZD7351/wCCJqYZ/aPUyjy4q/0oET9oeyZvnnHnf5pfmLpX5X+T9R80alxmmj/cWFpy4tdXcgPpxD22LMeygnNV7S9v4ex9DLPPc8oj+dLoHceyvs3n7b7Rjp8ew5yP82PU/jq/GrzR5m1nzjr2p+ZfMF419q2rTGaaRug6BUQb8URQFVewAGeEdo9o59dqZZs0rlI2X6L7L7L03Z2lhp8EahEUB+k+Z6pBmM5TsVdir0z8mtDs/Mf5p+RdH1CNZrK51aF54nFVkjgrM0bDwYR0Pzza+ymjhqu2MGOYsGQvzrevsdL7aa7Jo+w9TlgakIGj3Xtf2v2sz6Afmx2KvKvzw0G08xflN59sbxUIttHudRhZgPgnsUNzGQTSnxRUJ8Cc0vtnooarsTURl0iZD3x9Q+533sL2hk0fb+mnHrMRPumeE/e/FzPBH6PdirsVdir138mfzX1T8p/NsGrQNJcaFflbfWLAGont6/bUEgepHWqH5rXixzd+yXtNm7F1oyDeB2kO8frHR0Htr7JYO3tAcR2mN4S7j+o9f2P2M0rVNP1vTbHWNJu477TNTgS5tbiI1SSKQBlYVodwehz3XS6nFqMMcmM3GQsHyfnbV6XNps0sWWNSiaIPQhH5a1Pif/nNqxuJfKPkzUUQm1s9Xmt5W/le4gLJ94hbPPv+DDhkdFgmOQkR8xt9z6X/AMA7PCPaGoxnmYAj4Hf735v55W+xOxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FX0n/wA4+/kRc/mpqTa1rfqWfkjSJwlw61WS9mFGNtC3YAEc2HQEAbmo6r2G9ip9s5vEybYonf8ApH+aP0vG/wDBD9vodhYfCxb5pDb+iP5x/Q/VbS9K03RNOs9J0ixh03TLCMQ29tboEjjQdAqjPZtNpcWnxRx44gRGwA5PhOr1ebVZpZcsjKRNknmUflrUl1zq+k2cpgu9UtLWZQCY5p40YA9DxZgcpyazBjlUpgHzIbsWi1GSNxgSPIFMcuaXYq+J/wDnI3/nHKy1qyv/AD75CsEtNdtEa41TS7daR30Y3eaFBssyjcgbOP8AL+1597f+wGPPjlq9JGpjeUR/F5jz+/38/Sv+Bt/wScmmyR0WtlcDtGR/h8j/AEfu93L5v9NjsRnlb7G7FXYq+nLL/nLT81tOs7TT7JNDt7Oxhjt4IlsmokUShEUVmJoAAM63D/wT+2sWMQjwAAUBw9B8Xis//Aj7BzZJTnxkkkk8XU8+iJ/6HA/N/wDn0X/pBP8A1Vyf/J1O3e+P+l/aw/5M57Pd0/8ATfseU/mR+bvnP81JdMk81XUDRaQjrb29pGYYQ0hBdynJqsQAK+AzS+0HtTr+2ZROoI9PIAUN3fezXsf2b2FGY00T6uZJs7dHmGal3TsVdirsVZJ5P8x3HlDzV5e80WsYmm0G/gvRGdhIInDMhpTZlBB+eZXZWvnodZjzx5xkD8ujh9sdmw7Q0OXTyNCcTG+6xzftn5V806J5z0HTvMnl68W90vU4hLG4pyQ/tRyKCeLqdmXsc+gezO09P2hpo58MrjL8UfN+ae1uytT2bq56fPGpRNH9Y8iyHMpxHy//AM5TfmZp3lH8v9R8q292G8y+coWso7eNxzis3IFzNKBWishMYBpyLbVCtnH/APBK9osWi7Mlp4n95kFUOkf4ifhs9v8A8Cn2YzdodrR1Mo/u8R4iT1l/CB7jv8PN+U+eNPuzsVdirsVdir9B/wDnDj8zZLmDUfyx1a5Z2s0fUdEMjdIi3+k261PZm9RQPF/DPTf+BN7RGQloch5eqH++j+n5vkv/AAZ/ZgQlHtDGOfpn7/4Zfo+T7xz0h8seVfnV5Eb8xvy48w+W7dFfVDEt5ppY0pd2x9SNa9BzAKEns2aX2w7EPavZWTDH6ucf6w/Xy+LvfYjt8dj9s4s8j6bqX9WWx+XP4Pxhnhmtppre4ieC4t3aOWORSro6EhlZTQggihGeCzhKMiCKIfo+E4ziJRNg7gqWBLsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxVPfLHl++81+YtE8taYAb7XLyGzhLfZUysF5t/kqDU+wzI7O0OTW6qGGHORAHxcXtTtHFoNHk1GT6YAk/B+3HlHytpXkry3pHlfRYRDp2j26wJsA0jDd5Xp1Z2JZj4nPoLsrszD2fpIYMQ9MRX6z8X5o7Y7Vz9payeoym5SN+7uA8gu81eadE8l6BqPmXzFeLY6VpkfqSOd2Y9FjjXqzsdlA6nD2n2np+z9NLPmlUR+KHmvZPZWp7S1cdPgjcpcv1nyflp+aP/OSvnzz/dXNppV9P5S8rlisVjYymOeVOlbm4Ti7EjqoITtQ9c8c9pP+CF2l2nMxhI48fSIO5/rH8B9x9lf+Bl2V2TjEskRky9ZSFgf1Yn7+b51d3kZnkYu7mrMxqST3JOcuSSbL2AAAoM/8k/mn58/L26juPK/mK6s4VIL2UjGazlHSj271Q7HqAGHYjNl2P7Sdpdlz4sGQjy5xPvidnU9ueynZXa+Mx1GIE/zuUh7pDd+o35JfnZpH5vaNMfRTSvNOkon6S04PyUhthcW5O7RsR06ofhYmqs3sPsd7Y4O3MB24ckfqj+keX3Ph/tx7D6j2f1A34sUvpl/vZef3/d3HOieYfk9/zlH+WsPkP8wDqml2/oaB5yWTULdFXjHDdBh9ahQAAABnVwB0D07Z4t/wSPZ6PZvafHjFQyeoeR/iH6fi+9f8Cv2ml2r2T4eQ3kxVE95j/Cf0fB80Zyb2bsVdirsVdirsVdirsVdirsVeheQvzG8/+QLme48laxdWKTFTc2yoLi2lNCAZIHV0JpWjUqOxzZdi9v8AaXZkzLTTIvmOYPvB2dT2/wCzfZPa0BHV4wa5HlIe4ii9ivf+cp/zyvLWS2jktNPeReP1i200eqtRSq+p6ig/7HN7m/4JXtDOBiCB5iO/2287g/4FPsxjyCRBPkZbfZT5v1nVtX1zU7vVNev7nUtWu3LXFxdu0kzN0+IsSdugHYbZyur1WfUZTkyyJkeZPN7LRaTT6bDHHhiIxHIDYJXlTc7FXYq7FXYqyzyJ5quvJPnDy75qsyfV0S+iuHQGnqQ14zRmnZ4yyn55mdjdpT7P12PUR5xIPw6j4hwO3uysfafZ+XTT5TiR7j0PwL9xLS6t761tr2zmW4tLyJJ4JU+y8cihkYexBBz6GxZYZYCcTYIsHyL8yZsU8WQwkKINEeYRGTYPjv8APr/nGRfPV9decvI8kFh5nuAGvtPlpFb3zgU9VH6JKaCtfhbqSDUnhPbb/gdfyjkOp0tDIecTsJed9D976J7Af8FD+S8UdLrATjH0yG5j5V1j9z87vMvlHzP5Ov20zzRod5od6taJdRlA4BpyjfdXXbqpIzy7tDsvV6HL4efGYnzH3d7692Z2xou0cXiafIJjyP39zHMxnLdirsVdirsVdirsVdirsVdirPv/ABls2X/VN1X/AFVYDmtdq7FXYq7FXYq7FXYq7FX1f/zh1okOpfmtcanN18u6NdXUP/GaZorX/k3O+dn/AMCjRxzdtGZ/ggSPeaj9xLwf/Bm10sPYIxj+OYB9wuX3gP1Jz2J8OfnD/wA5m+ebm98y6N5Atbhl03RbZNSvYwaK95cchFyHfhFuP9c55V/wW+2Z5NXDSRPpiOIj+keXyH3vsf8AwFewYYtFk1sh6pHhif6I5/M/c+Jc8/fSnYq7FXoX5V+d7r8vPPvl3zRbyslvaXSRX6A7S2UxCXEZB2+wSRXowB7Zs/ZvtifZfaWPPE7A7+cT9Q+TqfavsPH2v2Vl08huRcfKQ3ifm/bbPoJ+aGN+ZfJ/lfzjawWfmnQbLXra1k9WFLyJZPTcihZCRUVHWnXMTtHsnR6+AjnxiQG4scnM7M7Z13Z0zPT5JQJ2NGrYZ/yov8oP/LeaL/0jj+ua/wD0Fdhf8o8fk7L/AEee0P8AylT+bv8AlRf5Qf8AlvNF/wCkcf1x/wBBXYX/ACjx+S/6PPaH/lKn83f8qL/KD/y3mi/9I4/rj/oK7C/5R4/Jf9HntD/ylT+bv+VF/lB/5bzRf+kcf1x/0Fdhf8o8fkv+jz2h/wCUqfzd/wAqL/KD/wAt5ov/AEjj+uP+grsL/lHj8l/0ee0P/KVP5u/5UX+UH/lvNF/6Rx/XH/QV2F/yjx+S/wCjz2h/5Sp/N3/Ki/yg/wDLeaL/ANI4/rj/AKCuwv8AlHj8l/0ee0P/AClT+aGvfyC/J69tLmzbyFpdsLmNo/Vto/Smj5CnKN1NQw6g5DN7DdhZIGP5eIvqNj8GzB/wQfaHFkEvzMjR5E2PiH4z54Q/Rb2H8gvLul+a/wA3vJWiazbpd6bPcXFxNBIoeOX6naz3So6nYqzQgEHqM3nsR2fh1vbmDFlFxJJI7+EGVfY89/wQO0s+g9n9RmxGpAAAjpxSEbHzfsjb29vaQx21rBHbW8I4xxRKERB4KqgADPd8eOGOIjEUB0D865Mk8kjKRsnqVbJMXm35t+VtF81/l95rs9Y0+C7a20m9ntJpY1aS2njhaRJYmIJUhkFaHfods1HtV2bp9b2XmjkiDUZEHqCBdj5O59kO1dToO1sMsUiLnEEA7EE0Qfm/FDPAX6UdirsVdirsVdir9iP+ccfMB8xfk35MuJJ/WudNt5NLmrWqfUpXhiU1/wCKlQ/Tnuf/AAP9d+a7BwkmzEcJ/wA00Psp+ef+CV2d+T9otQAKEiJD/OFn7be4Z0TzDsVSzV9F0fzBYy6Zrul2usadN9u2vIUmiJoRXi4Irvscp1ejwarGYZYCUe4iw36PXajSZRkwzMZDqDR+x8r+eP8AnD3yFr3r3flG9ufJt+9SsArd2JanT05GEi1PcSUHZe2cb2z/AMCjs3U3LTyOM931R+R3+34Pddhf8GTtXS1HVRGWPf8ATL5jb7Pi+AvzG/LTzR+V2unQvM1sitKpltLuAl7a6iBpzicqp2OxBAI7jpnmnb/s9rOx9T4Wce4jlId4fVvZv2n0Pbml8bTnyIP1RPcXn+a12zsVdirsVdirsVdirsVZ9/4y2bL/AKpuq/6qsBzWu1dirsVdirsVdirsVdir7T/5wmeMedvOEZX96+hoymg2VbmIMK9erDO9/wCA+R/KOYf0P0h83/4OET/JmA9OP/el+kuesPjT8jv+cqYJ4vzv82SS19O5h02SGtfsCxt0NP8AZo2eI/8ABLhIe0OYnqI1/pQ+/wD/AAKJxl7M4QOhkD/pif0vnjOYeudirsVbALEKoLMxoANyScQFJp+8eh21xZ6Lo9ndbXVrZW8M3T+8SNVb7JI6jsc+jtDjlj00Iy5iIB+T8s6/LDJqcko8jIke600y9odirsVdirsVdirsVdirsVfgPnzU/Vr37/nF7/yenkb/ALef/dMvc6X/AIG//ORYP87/AHEnlP8Agp/84vqP8z/dxfr1nuD8+uxVjHnb/lDPN3/bFv8A/qHkzD7a/wCM/N/Ul9xc7sP/AI0sH9eP3h+F2fOz9PuxV2KuxV2KuxV+nH/OF1+J/wAtNesGJMlh5hmYDsI5ra1K0Nf5lbPXP+BFnEuyckO6Z+0B8U/4Nmn4e2cU+hxj5iUn2BncvnrsVdirsVfHP/OatjaSflz5a1J4Va+s/MUVvDN+0sVxaXbSoPZmgQn/AFRnCf8ABfwwPZeKZG4yUD5GMr+4Pon/AAEdRkj2xlxg+k4ySPMSjX3l+ZueSvtLsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2Kvo3/AJxY81ReWPze0iC5l9G180W82iux6epOUkgHzaaFFHzzqf8Aga9pjR9uQEjtMGHz3H2gPH/8FbsmWt9n5mIs4yJ/AWJf7El+tee2PgT4j/5zB/K661rTdP8AzI0a3ae60CH6nq8Ua1Y2XJninoBX927sG6/CwOwU557/AMFb2bnnxR1uMWYipf1eh+HX9j6Z/wABv2qhps0tBlNCZ4oH+lyMfj093m/OPPLH2F2KuxV9Af8AOOX5YXX5ief9Pubm1Z/LHliaO/1OZlrG7RnlDbVqKmRl3H8oY50vsD7OT7U7SiSP3cCJSPTyj8fueT/4JHtTDsjsmUYy/eZAYxHXfnL4ffT9eM9wfn54l+cf54aD+TsOirqGnT61qWttKYbS2kSMpDDx5yyM3IgFnAXbf4v5c572t9stN2FGAnEylK6ANbDqXpvYz2F1XtFLJwTEYwqyQTuegeEf9DvaB/1IWof9JsX/AFSznP8Ak8en/wCUc/6Yfqep/wCTG6r/AJSY/wClP63f9DvaB/1IWof9JsX/AFSx/wCTx6f/AJRz/ph+pf8Akxuq/wCUmP8ApT+tMtH/AOczdC1jV9K0lPI1/A+qXkFosjXkRCGeRYwxAiFacq5bpf8AguafPmjj8AjiIH1Dqa7mnWf8BXVafTzyHURPCCfpPQX3vtLO/fNnyB5x/wCcvvLnlTzVr/lmPyjf6odAvptPluluI4Vea3YxzcUKMQBIrAGu4Fe+cN2t/wAFXS6LWZMAwmXATG7A3Gx6d76F2N/wHdZr9Di1BzxjxxEgKJ2O43vuY1/0O9oH/Uhah/0mxf8AVLMT/k8en/5Rz/ph+pzf+TG6r/lJj/pT+t9V/lt53t/zH8laL5ztbCTS4NZ+s8baVxI6fV7ma3NWUKDUw16d87P2e7Zj2r2fDUxjwiV7c+RMf0PCe03YU+x+0smklLiMa3G3OIl+lnObF1b8B8+an6te/f8AOL3/AJPTyN/28/8AumXudL/wN/8AnIsH+d/uJPKf8FP/AJxfUf5n+7i/XrPcH59dirGPO3/KGebv+2Lf/wDUPJmH21/xn5v6kvuLndh/8aWD+vH7w/C7PnZ+n3Yq7FXYq7FXYq/Sf/nCaKQeR/N8xRhFJrior0+EsltEWAPiA4r889W/4D0T+QzHpx/oD41/wcJx/lPAL34P98X2jnfvm7sVdirsVfIv/OaP/kq9E/8AAotP+oPUM4f/AILv/GNj/wCGD/cyfQP+An/xu5P+FH/dQfmDnkT7a7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdiqtbXE9ncQXdrK0FzayLNDKhoySIQysp7EEVGGE5QkJRNEbhjkxxyQMZCwdiH7L/AJLfmhYfmp5KstZSSNNcsVS11m1UgNFdKu7hdiElpyQ9Oq1qpz3j2Q9pMfbPZ8cl+sbTHdLv9x6fsfnT229lsvYXaUsRHoO8D3x7veOR+fV6y6JKjxSoskcilXRgCrKRQgg7EEZu5REhRdBGRibD4k/NH/nD7TdaurnWvy41GDQLm4YySaReBvqRY1JMEqB2jBP7JVl32KjbPPvaT/gU4s8zk0UhEn+E/T8D09z6X7K/8GTNpsYxa+JmBymPq/zh19/3vmi4/wCcWfzxhlaOPyfHdovSWLUtPCt8hJdRt94zk5/8DX2iiaGG/wDOj+mT2mP/AIK3sxKNnPXkYz/REvSvI/8Azhr5w1K6in896nbeW9MRgZLazkW6vZAOqqy1hSv83JqfynNr2N/wJtfmmDqpCEe4eqX6h9vudN27/wAGjs7DjI0cDOXQn0xH6T9nvfoJ5Q8n+XvIuhWnlzyxpyabpdpUhV+J5JGpyllc7u7U3J9h0AGem9ldk6Xs3TDDgjUR9p7z5vkvbHbOr7U1Us+olxSP2DuA6BOtQ1Cy0qxvNT1K5jstP0+F7i5uJTxSKKNSzux8ABXMjUZ8eDFLJM1ECyT0AcbT6fLnyxx4xcpGgB1JfjR+c35kT/mj581PzHR4tKiAs9KgcmsVnCTwJHZnYl2HYtTtng3tb7QS7Y7Snm/h5RHdEfr5v0Z7F+zUew+y4YP4ucj3yP6uTyrNO712Ksn8k/8AKZ+Uf+21Yf8AURHmV2T/AI9i/rR+8OF23/xnZ/6kvuL90c+i35ffiN+a/wD5NL8yv/Aq1n/qOnz589p/+NjU/wDDJ/7ov0x7Jf8AGHpP+FQ/3IYBmtdq/Xr/AJxe/wDJF+Rv+3n/AN1O9z3D/gb/APOO4P8AO/3cn59/4Kf/ADlGo/zP9xF79nSvKPwHz5qfq179/wA4vf8Ak9PI3/bz/wC6Ze50v/A3/wCciwf53+4k8p/wU/8AnF9R/mf7uL9es9wfn12KsY87f8oZ5u/7Yt//ANQ8mYfbX/Gfm/qS+4ud2H/xpYP68fvD8Ls+dn6fdirsVdirsVdir9V/+cQtJl038noLuROA13WL6/jP8yr6drX77U57L/wKtLLF2GJH+Kcj90f96+Ff8GLVxze0JiP4IRj98v8AfPqHOweHdirsVaZlVSzEKqipJ2AA7nEkAKASX5y/85c/m3oPmgaR5B8tX0OrW+j3p1HU7uAh4RcpG8MMMcgqGKrK5em1SB1Bp5V/wUvanTazg0mCQkInikRyuqAB+Jt9i/4EHshqtDx63URMTIcMQefDYJJHwFPiLPP30t2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVVgOa12rsVdirsVdirsVdirsVdirP/y4/MfzH+WHmO38w+XrjwjvLOQn0LyCtWilUf8ACt1U7jNl2B2/quyNUM2E+8dJDuLqvaX2a0fbejODOPcesT3h+sX5YfnJ5M/NTT0n0O+FrrEUYa80e6ZVu4G/aIWv7xK9HXbx4nbPafZz2t0HbOK8Uqn1ifqH6x5vgvtT7F9pdhZqzRuHSY+k/qPkXq+bp0LsVdiqReYvM3l/ylpk2seZdXttG02AEtNcuEBIFeKL9pmNNlUEnsMxu0O0tLocJyZ5iMR1P43crs3svV6/MMWngZSPQfp7n5kfn3/zkXffmYZPLHltJNM8kwTB3Lgrc6i8Z+F5t/hjHVU8d2qaBfI/bb2+ydr3gwjhxA/GXv8ALy+b7X7Af8DfF2LWoznizEfCHu8/P5eflvOPe4dirsVTry3fwaV5i0DVLrl9V03UbW6m4CrenDMjtQbVNFy/QZo4dTjnLkJAn4Fx+0sEs+kyY485RIHxFP1u/wChkfySMPr/AOPbbhWlPq15z6V+x9X5fhntn/JwvZ7hv8wPlL9T4D/ybT2m4q/LH5x++35Ree9Ys/MPnjzlr+nFzp+ua7qOoWpkXi5hubmWWPku9DxcVGeMdtavHqu0M2aH0ynKQ9xJIfeOwNHk0nZmDDP6oQjE13xiAWKZhuc9c8mfnp+Z/kDRl8v+WPMQs9HjleaO2ltba4EbyGr8GmidgCd6VpXelSa7vsj2z7X7MweDgyVG7qgefvBdB217B9idranx9RiudVYMhdcuRDI77/nJ/wDOrULK6sZvNqRw3kTwyNDYWccnBwVbi6wAqaHqKEdQQcys3/BG9oMuMwObYitox/U4eD/gW+zWLJGYwbg3vKRHyt4BnNPVvfv+cXv/ACenkb/t5/8AdMvc6X/gb/8AORYP87/cSeU/4Kf/ADi+o/zP93F+vWe4Pz67FWMedv8AlDPN3/bFv/8AqHkzD7a/4z839SX3Fzuw/wDjSwf14/eH4XZ87P0+7FXYq7FXYquRHldI41LySMFVVFSSTQADEAk0FlIRFl+4X5deWB5M8i+VPLBXhNo+mwQ3ABDA3BUNOQRUbysxz6F9n+zvyHZuHB1jEA+/r9r8ye0nan8pdqZtR0lIke7+H7GaZsHWpL5g8xaH5V0q51vzHqlvo+lWgrJcXL8VqeiqOrMeygEnsMx9f2hptFhOXNMRiOpcns7s3Va/OMOCBlI8gHxj54/5zS0y1aaz/L7y42qyI3FdR1flDbmndLaNhIwPbk6H2zgu2f8AgvYoEx0eLi/pS2H+lG/2h9H7C/4CefIBLW5eH+jDc/6Y7fYXx550/OL8yPP5lTzJ5pu5rGQ/8c+3b6tZgCtKwRcFalerVPvnC9r+1favad+PlJH80bR+QfQ+xPY3sbsoA4MIEv5x9Uv9MXmWal3TsVdirsVdirsVdirsVdirPv8Axls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVRFpd3dhcw3ljdS2V5bOJIZ4HaOSNx0ZHUggjxByWLLPHMSiSCORHNjlw48sDCYBB5g7gvo/yt/zlh+bflyJLa9vrLzXbRrwUavAWmArWvrQPA7H3ctnVdmf8E7tvSR4ZSEx/SG/zFH5vHdq/wDAk7A1kuKEZYz/AEDt8iCPlT0dP+c3PM4iIk8jaW89DR1uZlSvb4SrH/hs2o/4MOtrfBG/eXTS/wCAdoeLbUSr3Bieuf8AOY/5p6lGYtJtNG8ug9Jbe2e4mH03Mksf/CZha3/gsds5RWMQh5gWf9kSPsc/Qf8AAZ7Cwm8kpz8iaH+xAP2vm/zJ5t8zecL86n5o1y81y93CyXcpcICa8Y1+yi+ygDOU7Q7T1euyceeZkfM/c9l2Z2RouzsXh6fGIDyH397HcxnLdirsVdirsVdirsVdirsVdirsVe/f84vf+T08jf8Abz/7pl7nS/8AA3/5yLB/nf7iTyn/AAU/+cX1H+Z/u4v16z3B+fXYqxjzt/yhnm7/ALYt/wD9Q8mYfbX/ABn5v6kvuLndh/8AGlg/rx+8Pwuz52fp92KuxV2KuxV9Df8AOM35fyeePzO0u6uIPU0TykyavfMwqjPE3+jRGoIPOUAkHqqtnT/8DzsI9o9rwJHox+o/D6R8T9lvJf8ABP8AaEdl9iTjE+vJ6I/H6j8B9pD9cs9ufn9C317aaZZXmpX9wlpY6fBJc3M8hokcMSl3dj4BQSchnzQw45TmaABJPcBzbMGDJnyxxwFykQAO8nYB+Ov51fm7q/5seaJ72SWW38tadI8Wj6eSQscIJHrSLUgyyDdj22UbDPCva72pz9tawyJrGNox7h3nzL9D+xPsfp+wdCIAA5Jbzl3nuHkOnzeN5ononYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVfqn+Xn5Ifkj5y8jeVPM7eRLf1ta0y3uLgLdXqgXBQCcAfWugkDAZ7H2B7G+z2v7Ow5/AFyiCd5c+v8Xe+F+0ftz7TdndqZtP+ZNRkQNo8un8PczL/oWr8kf+pDg/6S77/spzP/5N57Pf8o4/00v1uu/5Ob7Tf8pJ/wBLH/iXzZ/zkl/zjvoHlzy1becfy60Q6dbaMWXWbOKSaYG3cjjcr6ryMPTOz704kHbic5P/AIIPsHptJpBqdHChH6xZO387e+XV7L/gaf8ABG1es1p0uuycRl9BIA3/AJu1c+j4Nzzl9TdirsVdir37/nF7/wAnp5G/7ef/AHTL3Ol/4G//ADkWD/O/3EnlP+Cn/wA4vqP8z/dxfr1nuD8+uxVi/nhlXyV5vZiFVdE1AknYAC2kqScwu2jXZ2b+pL7i53YQJ7Swf14/7oPwvz53fp92KuxV2KqsEE91PDbW0L3FzcOsUUUalnd3IVVVRUkkmgAwwhKcgALJRkyRhEykaA3JfsL+Qf5Wr+VvkW2sLyNf8Sa0VvtYdd+MzLRIA3cRKabbcuRHXPc/Yf2a/kfs4Rl/eS3l7+g+H6355/4IHtUe3O1DOB/dx9MPd1l/nfdT27OheZfLf/OXPmqXy/8AlW2k2sxjuvNuoQ6ewWob6tGGnmIPgTGqn2b55x3/AAU+0zpuxvDid8khH4Dc/cHuf+A/2THV9u+LIbY4mX+cfSPvJ+D8q88bfdHYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Kv2a/ITSLvRPye8g2F6vC4Omi7KnqEvJJLmMH3CTCoz3n2H0s9P2Fp4S58N/6YmQ+9+cv+CBrMep9odTOHLir/AEoET9z17N48+pTwQ3MM1tcwpcW9wjRSxSqHR0cEMrKQQQQaEHIzhGcTGQsHmGWPJKEhKJojcEPyi/5yF/Iq8/LLWJNd0K3kuPI2rTEwSKC31CZyT9WlNSeP8jHqNuo38X9u/YvJ2RnOXELwyO39E/zT+h94/wCB17eY+29OMOY1niN/6Y/nD9IfNOco9m7FXYqnXlzzBqnlTXdK8x6LP9W1XR7hLm2kIDKHTsynYqRUEdwcv0GuzaPUQzYjUomw43aXZ+DXaWeDKLjIUX2Fa/8AObfmpIVW98kaTcT93guJ4UOw6I3rHr/lZ3OP/gw64R9WCJPkSP1vnuX/AIB2gMvRqJgeYB/UiP8Aod7X/wDqQtP/AOk2X/qlkv8Ak8Wq/wBQj8yw/wCTG6T/AJSZf6UfrYR57/5y186+cvL2qeW7TRNO8vWeswNa3U8LSzXBgkXjJGjsVUcgSCeNaHbxzX9tf8FDtDX6WeGMIwEhRIsmuodn2D/wIuzOztXDPLJKZibANAWOR+D5SzjXu3Yq7FXYq/Qz/nF/8gptLez/ADL862JivivqaFp06/FCHG15MhGzkH92D0+39rjT07/gcew8sRjrdTHf+CJ6f0j+j59z5H/wU/8AggxziWg0kvTyySHX+gD3d/y733Zno75c7FXxX/zmxpl3P5N8oarFHytNO1aWCdh1VrmEmM08P3JFflnn/wDwYNPOWhw5ByEiD8Rt9z6T/wABDVY49o58ZO8oAj/NO/3vzbzyp9kdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV6D+Vfkqb8wvP3lryqisbe/u1e9ZSAUs4f3lw1SQAfTUge9Bmy9m+yJdp9pYtOORO/9Uby+x1PtX23HsjsrLqTzA9P9Y7R+1+2kUUUEUcMMawwwqEjjQBVVVFAqgUAAA2GfQUYxjEACgH5pnOUpEk2SvwodiqX6rpWm65pt7o+sWUWo6ZqMTQXNtOvKOSNuoI/Ue3UZVqtLi1OKWPJEGJFEFu0mrzaXNHLikYyibBHR+ZP53f84x615Fe88yeTIptd8n1aWWBQZLzTl6kSDcyRAdHG4/bH7R8j9sf+B1qOzSc2mBli7v4oe/vHn832r2G/4KGm7UEcGqIhm5A8oz93cfL5dz5Nzi3vXYq7FXYq7FXYq7FXYqibOzu9QurexsLWW9vbuRYoLeBGklkdjRVRFBJJPQAZLFinlmIwBJPIDmwzZseGBnMgAbknYB+hf5D/APOLQ0aWw85fmVBHPqkRW4sNCNHjt2G6yXZ3VnB3CDZf2iT8K+n+xX/A28CUdTrR6ucYd3nLz8nyT2+/4Kv5iMtLoDUeUp9T5R8vN9yZ6I+YOxV2KvP/AM0/JifmB5A8zeVOKfWdStC1mz0ol3CRLbmppQeogBPgTmr9puyB2n2Zl0/Ujb+sNx9rtvZTts9k9rYdT0id/wCqdpfYX4mTQy280tvPG0M8DtHJG4oyOpoykHoQRnz/ACiYyII3D9LQnGcRIGwVLAl2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/RD/AJwv8iC10rzB+Yd7bkXGpv8AorTXYdLeEh7l19nkCrX/ACDnqH/Ai7F4MWTWSG59MfcPq+37nyL/AINnb3HnxaGB2j65e87R+Q+990Z6K+XuxV2KuxV2Kvmb8z/+cXfIvn6S41XR/wDnTvMc5Lvc2cYe1nc1JM1tyQVJP2kKnueWcj7R/wDA27O7SJyYv3cz1A9J98f1Pa+y3/BU7U7KAx5f3uMdCfUPdL9dvhPzx/zjp+ankYzT3GgPr2lRFiL/AEet1HwWnxPGoEqCh3LIB77Z5z2z7Bds9nWZY+KP86PqHy5j5PqPYX/BI7C7UoRy8Ev5s/SfgeR+bw50eJ2jkRo5EJVlYEEEdQQc54gg0Xp4yEhYW4q7FXYqjbDTtQ1W5jstLsLjUryY0jgtYnmlYnsqIGJ+7J4cGXNMRhEk9wFlr1Gpw4IGeSQiB1JofMvpjyH/AM4mfmR5peC68xRx+SdIejFr2kt4y1oeFqjVU+0jJnW9if8AAw7W1hEsw8OPn9X+l/XTxfb/APwXOxtCDHATln/R2j/pj+i33v8Alp+SfkT8rYFfQdO+ta00fCfV72kt29R8QQ0Cxqf5UA969c9J9nfY7s3seN4o3PrI7y/Z8Hyr2n9uO1O3JVmnUOkI7R/b8Xrmbx592KuxV2KuxV+UH/OVXkEeTvzLuNWs4fT0jzpG2pxcR8K3XLjdoNhvzIf/AGeeLf8ABL7DGg7WOSI9OT1D3/xD57/F95/4FHtB/KPYoxTPrxek/wBX+E/Lb4PmbOTe0dirsVdirsVdirsVdirsVdirsVZ9/wCMtmy/6puq/wCqrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/YH/nGm+0+9/JbyWthKj/Uori2uEXrHcLcytIrDsTzDfIg989x/4HebFk7Aw8B5WD77L89/8E7Blx+0mo4xzII8xwinu+dI8s7FXYq7FXYq7FXYqxTzB5F8meauR8yeVdK1uR1C+teWkUswA6cZWXmPoOYWu7E7P1v99ijI95Av583P7P7e7S0H9xmnAdwJA+XJ5VqP/OL35J6h8Q8oNYSFql7S+vI9t9uBnZKb/wAuaXUf8Df2fy/5GvdKX66d7pv+Cn7S4f8AL2POMf1Wki/84j/k0skjnTtTdXpSNr+TilP5aAH7ycxx/wACzsIG+GX+mco/8F/2iIA4o/6UMr0z/nG/8ldKMbweRba5kjpVr2e5uwxAAqyTzum9OnGntmbp/wDgfez+GqwA+8k/eacDVf8ABL9pc9g6gj+qIx+4AvW9I0HQ9Aga10HRrHRLViCYbC3itoyR0JWJVGbvS6HTaWPDihGI7ogD7nn9Zr9Vq58WbJKZ75EyP2prl7Q7FXYq7FXYq7FXYq+Ff+c3b7Tv0P5E01nRtXN5d3KICC6WwjRHJFagM5WnjxPhnnP/AAYs2LwdPD+Kyfhs+o/8A3Bm/ManJ/BUR8bJ+7735455g+uOxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV7X+S350a1+UeuGWMPqPljUnUappnL7QG3rQ12WVR07MPhPYjf+yPtbqOxNTY3xn6o/pHm837bexWm9oNLR9OSP0y/QfJ+t/ljzPofnHQ7DzF5dv49R0rUY+cUqdQf2kdeqsp2ZTuDntvZvaWn1+njmwyuJfAe1Oy9T2dqZYM8eGUeY/SPJPsyXES3V9Z0jQLGbU9c1O10jToBWS5vJUhiXYmhZyBXbplOq1mDTYzPLIRiOpNBu0ei1GryjHhgZSPQCz9j5Z86f85hfl9oLy2nlaxu/Od5HUCaP/Q7KtP8AfsqmQ0PhHTwOcd2v/wAFfszTExwROQ9/0x+Z3+x7nsT/AIDfa2qAlqJDEO76pfIbfa8dt/8AnNzzOtyrXfkbS57MNVoobmaKUrXoJGWUA078PozRY/8AgxawT9WCJHkSD89/ueiyf8A3QmFR1Ege8gEfLb73vfkL/nK/8tvN88GnawZ/JeqTkKg1Eq9mzkgBVukoB16yKg986TsT/gn9la6QhlvHI/zvp/0366eV7f8A+BJ2z2fAzxVliP5v1f6X9Vvp1HSVElidZI5FDI6kFWUioII2IIzr4yEhYeJlExNFdhQ7FXYq7FXYqlmsa1pHl7TrjVtc1K20nTLReU1zdyLFGvgCzECp6AdT2ynV6zBpcRyZZCMRzJNN+i0Oo1eYYsMDKR5ACy+R/OH/ADmb5M0qWa18oaFeea5E5KLud/qFqT2ZOaSSsPYoucR2r/wXNBhkY6bGZ+Z9I+4n7A9/2N/wFe0s8RLVZBj8h65feB9peZ2n/ObnmRbpGvvI2mzWPL4o4LqaKXjXtIyyLWn+Tmoxf8GLWCfrwRI8iQfnu7rN/wAA3RHH6NRIS8wCPlt976K8j/8AOUf5WecTDa3mpP5R1WUhRb6wBHCzGteF0paKm37ZQmuwzquxv+CT2NrqjKXhy7pcv9Ny+dPIdu/8Cvt3s65Qh4ke+G5/0vP5W+iYZoriKKeCVJ4J0WSOSNgyOjCqsrCoIINQRnUwnGUQQbBePnCUJGMhRHMKmFDy781vzW8u/lR5dfV9XcXOo3IaPTdNjYCa7mA6DrxRajm9KAeJIB0/tP7T6XsXS+Jk3kfpj1kf1d5d57JeyWs7e1nhYtoj6pdIj9fcH5DeePO/mD8wvMd75m8yXX1i/uzxRF+GKCFSeEMK1PFFrt3PU1JJzw/tjtjU9p6qWfMbkfkB3DyfoHsLsPSdkaOOnwRqI+ZPUnzYjmE7B2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV6z+V35zecvymvJ5fL88V3pd8eV3pd6Ge1lYCgkAVlZHA/aUiu3Ko2zc+zftZr+xchOEgxPOJ5Hz97ofar2L7O7exgZwRIcpR+oeXmHuOuf85pee720a30Py3pOh3EgINzIZbt0r0MasY0BH+UrD2zotZ/wXe0skKxY4xPfvL5dHmND/wABPsrFk4s2Wcx3bR+fM/c+W/NHnPzX51vjqXmvX7zXLsV4G5kLJGCalYoxREWp6KoGcf2j2trNfk48+QyPmeXuHR7jsrsXQdm4vD02IQHkOfvPM/FjOYjmuxV2KvtL/nFj87dT0nXtP/LXzJfNd+X9af0NIlnYs9ldt/dwKxqfTlPwhezkUoC2d7/wNfbHNg1MdFmlcJbRv+GXQe4/f8Xzf/grew2DUaWWvwRrJHeYH8Uep947+74P0mz1h8adirsVdiqGvb2106zu9Qvp1trKwhkuLiZ9ljiiUu7t7BQSchmzQxY5TmaAFk+QZ4MGTNkjCAuRIAHeTyfjl+cv5v65+a/mW5u57iW38tWMrppGm1pHFCDQSyKDQyuN2JrT7I+EDPCfa32q1HbWrMiaxg+mPcO/3l+ifYv2O0vYOiEYgHIR65dSe4eQ6PHc0b0LsVdir0nyN+bn5g/l3Kp8r+Y7i2sgSW0+c+vZPXrWCTkoJ/mWje+bXsb2o7T7LP7jIQP5p3j8i6ft32Q7J7Yj/hGIE/zhtL/TB9Gr/wA5techZGN/JuitqPGgnWS4EAbxMJctT29T6c6kf8GDtDw68GHF3718r/S8cf8AgH9m+JYzz4e6hfzr9D5T85edfMnn7XLjzD5p1J9R1GcBFqAscMYJKxRRjZUFeg+ZqSTnG9rdr6vtLUHNnlcj9g7gHu+xexNH2VpRg08OGI+ZPeT1LFcw3OdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf8AVN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdiqrBPNazw3NvI0M9u6yxyKaMroQVYHxBGGE5QkCOYRkhGcTGQsHYv2x/KvzrF+YXkHy35qVk+s6hahL1EI/d3cJMU60FKfGpIFPskZ9AezPbA7U7MxZ+pG/8AWGxfmr2s7Dl2R2tl03QH0/1TvH7HoWbR1DsVdir5N/5y889ny3+X1v5Ws5vT1LzrOYJAKVWwt+L3B61HJmROm4LZxX/BU7a/K9mDBE+rIa/zRz/R9r3v/Ae7B/OdrHUSHpxC/wDPO0f0n5Py5zx99wdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/AKpuq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdir7w/5wu89pBeeYvy8vp+Ivqavpas2xljUJdRqD3KBGAHZWOejf8AAi7aEcmTRyPP1R94+ofL7ny3/g2dgmePFroDl6Je47xPzsfEP0Iz098kdirsVfkH/wA5KeeR53/NTWmtpxPpPlumjWJQhkItmb1nUrsQ0zOQd6rTelM8O/4IPbP8o9szMTcYegfDn9tv0H/wM+wv5M7CxiQqc/XL/O5D/S08Dzm3qnYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdiqbaFrmq+WtY07XtEvH0/VdKmW4tp4+qOvsaggjYg7EbHbLtHrM2kzxy4pVKJsFo1+hwa3Tyw5o3GQoh9y6F/zm5wsoY/MvkUz6gi0luNOuxHFIfEQyxsV+XM56Hov+DERjAz4Ll3xND5EfpfMNf/wDbyE6fU1HoJRsj4g/oT3/AKHd8t/9SJqX/SXD/wA0Zk/8ni0v/KPL5j9Tjf8AJjdZ/wApMf8ASn9bzn8wP+cxtd8waPc6P5O8vf4Wa9jeGbUZrn6xcrG44n0FWKNY2pX4qsR2oRXNV27/AMFjU6rAcemx8F7GRNmvLYU7f2e/4DOl0moGXVZfErcRAqN+e5v3bPi3rudyc4J9IdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/ABls2X/VN1X/AFVYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff8AjLZsv+qbqv8AqqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/wDGWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/wCMtmy/6puq/wCqrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq+vf+hLPzS/6v8A5V/6Sr7/ALx2dx/yaHtj/VMfzl/xL59/ye3sP/Usvyj/AMW7/oSz80v+r/5V/wCkq+/7x2P/ACaHtj/VMfzl/wASv/J7ew/9Sy/KP/FqNx/zhj+a0MLyx6t5Zu3WlIoru6DtUgbGSxjXatd2GQyf8CTtqMbE8Z8gT+mIZ4/+DV2DKVGGQeZjH9EiwnWf+cX/AM6NHief/Cq6pDGSCdPuoJ3pWgIi9RZDX2XNfq/+Bz2/gjfg8Q/okH7Lt2Wi/wCCl7N6iXD43Cf6QI+2qeIaro+raFeSadrel3ekahD9u2vYXglX5pIqn8M5/U6XNp8hhliYyHQij9r02k1mn1WMTxTEonrEgj5hLcqbnYq7FXYq7FV8UUk0kcMSGSWVgiIoqWZjQADxJOMYmRoIlIRBJ5PraH/nC/8ANWWGKR9Z8sW7yIrNFJd3ZdCRUqxSwdajoaEjwJztof8AAj7ZMQTPGPK5f8S8DP8A4NfYUZEDHlPnUf0zeI/mf+VPmf8AKbV7HR/Msllcyala/W7e50+SSS3dQ7Iy8pYoW5KRuOPceOc/7R+zOr7Fzxx56NiwY2R9oD0vst7WaLt/Tyy6cEcJoiVA9/Ql5pmpd07FXYq7FVe2trm9uIbSzt5bu6uHCRQwoZJHY9FVVBJJ8Bhx45TkIxFk9AxyZYY4GUiABzJ5Ppryl/ziT+afmOCO71SOx8o2sihlXUpGa5IPT9xCshU+IcqfbOu7L/4F/bOqjxTAxj+kd/kL+2niu1/+C92Fo5GOMyyH+iPT8zX2W9TX/nB27NsXf8yoVvOBPpLpLGLnvQeob4Gh7nh9BzcD/gN5OCzqRfdwbfPi/Q6M/wDB1x8dDSGu/j3+XD+l515n/wCcPvzP0SCS60a40zzXFGGYw2krQXPFamojnVENR2Dk12pmr7R/4FXbGnjxYzGfkDR+Rr73b9l/8GTsTUzEcoljPeRcfnG/ufMGqaTqeh39zpesWFxpmpWbmOe2uY2ilRh2ZWAOchqdNl0+Q48kTGQ5g7F7fS6vBqcQyYpCUTyINhL8rbXYq9H/ACw/LDX/AM2NfvPLvl280+yvbLT5NSd9SkljiMUcsMJVTDDO3LlOtBxpSu+bX2c9nNT21qThwmIIjxeqwKBA6A97p/an2p0nYOkjnzxkYmQj6QCbIJ6mP817t/0JZ+aX/V/8q/8ASVff947Oj/5ND2x/qmP5y/4l5b/k9vYf+pZflH/i3zj598lar+XfmzVfJ2tXFpdano/oetLZO7wN9YgiuF4NJHExosoBqo3r885XtvsjN2XrZ6bKQZRq6utwD1A73sewO28Ha+ghqsQIjK6EqvYmPQnuYhmC7B2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq/fjPpV+UnYq7FXYqxbzb5K8reetMfSPNeiW2s2RB4esv7yEtSrQyrR422G6kHt0zD7U7H0XaOHw9RASHnzHuPMOd2R25ruy8/i6bIYny5H3jkfi/Mb89P+cd9W/K2SXX9Fkl1nyRPKFFwwBuLFpGokdzxABBJAWQAAnYgGlfIvbP2Dz9jk5cfqxE8+sfKX632z2D/wCCNp+3AMOUCOYDl0l5x/U+ac5N7N2KuxV2KvpP/nFnyF/jL8zbPU7uH1NI8mIuq3BYHi1wrUtI/skV9T46GlQhzq/+Bt2J+f7XjOQ9OP1H3/wj57/B43/gq+0H8ndiSxxPry+ge7+I/Lb4v1lz2p8EfMX/ADld5DPm78tJtbtITLqvkmRtSj4gljaMAt2oAB2CqshPgmch/wAE7sT872ScsR6sfq/zf4v1/B7b/gS9v/yf20MMj6cvp/zv4f1fF+UmeMvu7sVdiqpFFLPLFBBG000zrHHGgLMzMaKqgbkknbDGJkQBzROcYRJJoB+s/wCQn5EaV+WGj2usavaxXvnvUIed1dMA/wBSWQb21uSPhoDR2G7GorxpntPsR7FYeyMAy5ADmI3P83+iP0vgn/BA9vc/beoOLESMETsP51fxS/R+t9G51bxzGLvzt5MsLuSwvvN2i2V9ExR7ae/t45VYGhUo0gYGo6UzDy9s9n45mE80Ae4yAPytzsPYXaWXGJwwTMe8RJHzpkkciSoksTrJHIoZHUgqykVBBGxBGZcZCQsOFKJiaPN5H+b/AOTvl382dCktb6GOz8xWkTfovVlUerA+5EchAq0RJ+Jfeooc0ftX7J6XtrTkSFZAPTLqPI+T0Hsd7Z6zsDVCUDeMn1Q6HzH9J+PeuaLqXlzWNT0HV7drTU9IuZLW5ib9mSNipoe4NKg9xvnhus0mXS55YsgqUTRHufoXQ63DrNPDNiNxkAQfIpVlLe+vf+cLP/Jpa/8A+Ardf9R2nZ3H/Ah/42Mn/Cz/ALqL59/wbf8AjDxf8NH+5m/TvPXXxN+Qv/OUP/k9PPP/AG7P+6ZZZ4f/AMEj/nIs/wDm/wC4i/QX/As/5xfT/wCf/u5PAc5p6t2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq/fjPpV+UnyP/AM5nTTQflfoLwSvC5802oLIxU0+pahtUU8M4j/guSMex8dH/ACg/3Mn0D/gKQjLtzJY/yR/3UH5owazq9rIs1tqt5byrQh4p5EYUIIoQwPUZ5LDU5oGxIj4vtGTR4JipQBHmA9o8k/8AOSX5reTJ4VbzBL5l0tCoksdZZroMi7USdj6ybdKNTxBzf9j/APBA7Z0Eh+8M490/V9vMPNduf8DTsLtKJ/dCEv50PT9nI/J+lv5Vfmz5b/NnQjquilrS/syseo6bMwM1rIwqNwBzQ0PFwN/AEED1n2Z9qNJ23pvExbSH1RPMfs83xj2s9kdZ2BqvDy7xP0yHKQ/QfJ6HqemafrWnXuk6raR32m6jC9vc28oqkkcgoyn6Dm01OmxajFLHkFxIog9zqNLqsumzRy45VKJsEdC/Gn85fy3uPyu896n5cJeXS5KXmlTuDWWzlJ4VJAqyEFG91zwf2s9n59j9ozw/w84nvieXy5P0Z7F+0sO3Oy4Z/wCLlId0hz+fN5Xmnd47FXYq/Wz/AJxf8hf4K/LDT727g9LWfN7DVrrktHWF1paxnc7CKjdBQuRntf8AwN+xPyHZEZyHqyeo+7+EfLf4vgf/AAU/aD+Uu25QifRj9A9/8R+e3wfRLSIhjV3VWlbigJALMAWoPE0Un6M6kyAq3jxEkGuindW1ve21xZ3cS3FrdxPDNE4qrxyKVZSPAg0wZcUckDGQsEUQyxZZ4picTRBsHzD8SfzM8mT/AJf+evMnlSYN6Wl3bi0d+slpJ+8t5Op3MbLX3qM+ffaHsmXZnaOXTn+E7ececT8n6W9mO2odrdl4tSOchv5SG0h82CZrnaOxV9Gf84seVI/M/wCbukT3MPrWnle3l1qQE0AkgKR25+YmlRgPb551P/A27MGs7cgZCxAGfy5faQ8f/wAFbtY6H2fmImjkIh8DvL/Ygv1sz2x8CfBf/OWv5yazpN/B+Wvli+m0zlarc63dW7mOWRLhSI7UMKEKU+J6H4uQHQGvm3/BR9rM+HKNFgkY7XMjmb5R+XN9U/4EXsZp8+I6/UREt6gDuBXOXz5dz8++u53JzzN9ZfVn/OL/AObut+V/OmkeSdQvZrzyr5ouFso7aRi4tLyX4YJIORHEM5CuBsQa0qBnZf8AA49qdRo+0IaacicczVd0jyI+PN4T/gpex+m13Zs9XCIGXGOK/wCdEfUD8Nw/UzPY3w1+ZX/OZvlmLTPP+ieZIImjHmjTOM7UPF7ixYREg0pURPECPYeOeR/8Fvs6OHtOGYD647++O33U+1f8BXtOWfsnJgJ/u5be6W/32+PM4Z9DfXv/ADhZ/wCTS1//AMBW6/6jtOzuP+BD/wAbGT/hZ/3UXz7/AINv/GHi/wCGj/czfp3nrr4m/IX/AJyh/wDJ6eef+3Z/3TLLPD/+CR/zkWf/ADf9xF+gv+BZ/wA4vp/8/wD3cngOc09W7FXYq7FXYq7FXYq7FXYq7FXYqz7/AMZbNl/1TdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FX78Z9Kvyk+Qv+c0//ACVugf8AgVWv/UDqOcP/AMF7/jHx/wDDB/uZPoP/AAEv+NzL/wAKP+6g/MTPIn2x2KvVfyZ/MK7/AC18/wCia8lw8elTTJZ6vEp+GWxmZRLUEgEps67j4lHbNx7Jduz7J7ThmB9N1Lzief63Re2vs7j7Z7JyYSPUBcD3SHL58n7RKysoZSGVhUEbgg9CDnvoIIfm8ggvjT/nM/yrBf8AknQfNsaKL7y9qItJGCirW16pqC3X4ZIkoP8AKOcF/wAF3syOTQY9QOcZV8JftD6P/wABTtaWLtLLpj9M43/nR/YS/NPPJ32Z2KvTvyd8iv8AmL+Ynlzy0yM2nyzi51Jl242Vv+8m3o1CwHAbfaYZtvZTsU9qdqY8HQm5f1RuXS+2Xbw7H7Iy6j+ICo/1jsP1v2njjSJEiiRY441CoigBVUCgAA2AAz36MREUH5tlIyNnm+Ff+cj/AM5bnyr+a35fadpUzmHyNPHq2qRRsV9Z7scDA1D1+qswHtLnnP8AwQPayej7a08MZ/ujxSHfxdP9L976j/wNfYuGu7B1WTIN8o4Ik9OHe/8AT/7l9yWd5bahZ2t/ZTLcWd9ClxBKv2XilUOjCtNiCDnomHLDLjE4mwRYPkXzDNhnhyShMUQaI8w+Fv8AnNHyH6tr5e/MSyg+O1b9Eaoygf3bkyWshoAdm5qSSeqjPOv+C72LccesiOXpl98T9/2PqH/AT7f4Z5dDM8/XH38pD7j835855k+tOxVnPkT8xvNn5baheap5Qv49Ovr+3+qzSSW8NxWLmr8QJkcD4lB28M2HYvb2t7KynJp5USKOwO3PqC6zt72b0HbOGOPVR4og2BZG/LoQ9R/6Gr/O7/qaLf8A7h1l/wBUM3H/ACcv2h/1Uf6WP6nR/wDJp/Zn/UT/AKaX63jPm3zZrvnjX77zP5kuxfazqIiE8yxpEpEMSQpRI1VRRYx0Hv1zQ9qdp6ntDUyz5jcjVnlyFch7no+yOyNL2ZpI6fTxqEboWTzJJ3PvY3mK5j1v8idDu/MH5veQLW0Qu1lrFvqcpFAFi09xdOSTtSkVPpoN83XsXo56ntzTxj0mJfCPqP3Og9vddj0ns/qZSPOBiPfMcI+9+zue9vzi/Ov/AJze1ZJvMHkLQxx9TTtPvL4+NL2WKIV36f6GabZ5b/wYtVxarT4u6Jl/piB/vX1//gG6Qx0mpzfzpRj/AKUE/wC/fDeeePpz69/5ws/8mlr/AP4Ct1/1Hadncf8AAh/42Mn/AAs/7qL59/wbf+MPF/w0f7mb9O89dfE35C/85Q/+T088/wDbs/7pllnh/wDwSP8AnIs/+b/uIv0F/wACz/nF9P8A5/8Au5PAc5p6t2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2Kv34z6VflJ8hf85p/+St0D/wKrX/qB1HOH/4L3/GPj/4YP9zJ9B/4CX/G5l/4Uf8AdQfmJnkT7Y7FXYq/cL8tbqW+/LnyBfTEtNeeW9KnkJNSWks4WO/zOfQvs7kOTsrTyPM44H/Yh+ZfafFHF2xqYDkMkx8pFg3/ADkhbrc/kn59jfotrbS7iu8V5byDw7rmt/4IMBL2f1A8h9kgXaf8DTIYe0umI7yPnEh+O2eGP0M7FX6Sf84a+QTpXlnWPP19BxvPMsn1LTywIIsrZv3jDelJJhTp/useOerf8CXsPwdJPVyG89o/1Rz+Z+58b/4NPtB4+tx6KB2h6pf1pcvkPvfY2qalaaPpmo6vfyejY6VazXlzJ14QwI0jt9Cqc7rU6iGnwyyTO0QSfcNy+d6XTZNTnhigLlIgD3k0H4d+cvM975z81a/5q1Da61y9luim9I0dv3ca1JNEQBRv0GfPPa3aOTX6zJnnzkSf2fB+nOxey8fZuhxaaHKEQPf3n4l+mv8Azif53/xV+WFvo1zMH1PyXN+jXU15G1YepaOa7U4loxT+TPXP+Bh2x+c7IGKR9WM8P+bzj+r4Pin/AAW+w/yPbZyxHpyji/zuUv1/F7h578qWnnnyf5h8p3tFh1uzeBXbpHMKPDJt/JIqt9GdD232XDtHQZNPLlIV8eh+BeZ7A7Wydl9o4tTDnA37x1HxD8QdS0680jUb/SdQga2v9MuJbS5hcENHNC5R1INDUMpGfPeowTwZZY5iiCQR5h+mdNqceowxyQNxkAQe8HcILINjsVdirsVdir9QP+cWPycn8kaHJ518w27QeZvM9uEgtpFKvZ2BYOFcEVDylQzDsAo68hnr3/A09k5dn6c6rMKyTGw/mx/WXxH/AIK/tnHtPVDSYDePGdz/ADp/qH631heXdtp9pdX97OlrZ2ULzzzSHikcUalndj2AAJOdplywxQM5GgBZPkHg8OGeXIIQFkmgO8nk/Fn83fPsv5k+f9e80/EtjcSi306Nqgx2UHwQgg9CwHJh/MTngXtR23LtXtLJn6E1H+qOT9I+x/YEexuycen/AIgLl/WO5/U81zVO5fXv/OFn/k0tf/8AAVuv+o7Ts7j/AIEP/Gxk/wCFn/dRfPv+Db/xh4v+Gj/czfp3nrr4m/IX/nKH/wAnp55/7dn/AHTLLPD/APgkf85Fn/zf9xF+gv8AgWf84vp/8/8A3cngOc09W7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV+/GfSr8pPkL/nNP/yVugf+BVa/9QOo5w//AAXv+MfH/wAMH+5k+g/8BL/jcy/8KP8AuoPzEzyJ9sdiqrBBNczw21vGZZ7h1ijRdyzuQFUe5JwwgZSAHMonOMImUjsN37p+U9Hby95W8taAxBbQ9Ks9PJXcE20CRbf8Bn0V2XpDpdFiwn+GMY/IAPy92vrBq9dmzD+Ocpf6YkvG/wDnKTVodL/JXzTG7FZtXksrCADu73MUjA7j/dcT5of+CVqo4ewMoPORiB8wfuD0f/Aq0ks/tLhI5REpH/SkfeQ/IvPEn39PPLPl++81+YdF8t6Yoa+1u8hs4a9FaVgvJumyg1PsMyOz9Dk1mqhhhzkQB8XG7T7QxaHSZM+T6YAk/B+4XlzQbDyvoOj+XdLjEWn6LaRWcAoASsSheTcQByYirHuSTn0L2focWj00MOMemIAHwfmTtLX5ddq8mfIfVIkn4vnf/nLLzPf6T+XC+W9Jtri5v/ONyLaT0I2kKWduVlnNVBpybgnTcMc5b/godpZMHZQwYwSchrb+aNz+h6//AIEfZeLP2z4+QgRxC9z/ABHaP6S/L/8AQGu/9WW//wCkaX/mnPIPyef+YfkX278/pf8AVI/MPpT/AJxY13WvJv5m21he6bfQ6P5vhOmXBe3lCJPXnbSHYAUccKnoHOdZ/wADXXZ9B2uISieHIOE7Hn/Cfnt8XjP+Ct2fpu0exDOE4meM8Q3HLlIfLf4P1Oz2R8Mflz/zl35DHlv8wYPNNlBw0zzpAZ5Cooq39vxScdT9pSj+5LZ49/wU+xPynagzxHpyC/8AOHP9BfcP+A/2/wDneyTp5n1YjX+Yd4/pD5Nzi3vXYq7FXYq+3P8AnGD8hP07PZ/mR5ysg2iWz+po1hOtVvJUO1zItf7tGHwgj4jv9kfF6B/wOPYj8zIa3Ux9A+gH+I958h9r5p/wUvb/APKxloNLL1n65D+EfzR5n7H6OZ6q+Ovzp/5yj/Pm31z6x+Wvk68E2lwSAa5qELVS5kjYEWsTDqiMKu1fibYbA8vLP+CR7bR1N6LTSuI+uQ6n+aPIdX2D/gV+wM9LWv1UakR6In+EH+I+Z6d33eHc89fTXYq+vf8AnCz/AMmlr/8A4Ct1/wBR2nZ3H/Ah/wCNjJ/ws/7qL59/wbf+MPF/w0f7mb9O89dfE35C/wDOUP8A5PTzz/27P+6ZZZ4f/wAEj/nIs/8Am/7iL9Bf8Cz/AJxfT/5/+7k8Bzmnq3Yq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdir9+M+lX5SfIX/ADmn/wCSt0D/AMCq1/6gdRzh/wDgvf8AGPj/AOGD/cyfQf8AgJf8bmX/AIUf91B+YmeRPtjsVfYX/OLH5MX3mXzDZfmHr1m0Hlny/N62niVafXr2M/AyA0rHE3xFuhYBd6NTuP8Aga+yOTV6qOsyiscDcb/ikP0D79u989/4K3tri0WklocMryTFSr+GJ5/E/dv3P02z118Ufnj/AM5o+e4rvUfL35eWU3IaV/uV1NVY0E8yFLZGFBusbM3ycZ5d/wAF3toZM2PRxP0+qXvP0/Z9767/AMBPsCWPDl10x9Xoj7h9R+f3PhXPO31B9uf84ZeQjqHmDWvzCvIT9V0CNtO05iCAby5T98ymlCUhahFf92Z6B/wJOxPF1U9ZIbQ9Mf6x5/Ife+af8Grt/wAHSY9DA7z9Uv6seXzl9z9HM9VfHXYq7FXYq7FXhf8AzkX5EHnv8rddt7eH1dX0Bf0xp5FORktgTLGKivxxFwACPi4+Gc57f9i/yj2PkAHqh6o/DmPlb1H/AAN+3j2X25jMj6J+iX+dyPwNPx7zw1+hXYq7FX1P/wA45fkNL+Y2px+aPM9q8fkfSpf7tuSHUp0r+5Q0/u1I/eMP9Ub1K9h7A+xUu1c3j5x+5if9Oe4eXf8AJ4b/AIJPt9HsfAdPpz++kP8ASDvPn3fP3/U2GGG3hit7eJIIIEWOOONQqIiiiqqigAAFABnskIRhEACgHw2c5TkZSNk8y+G/+clv+ciG0v65+XnkLUB+kWDQ61qlu29uDs1rA4/3Yf22H2fsj4q8fOv+CH7eeFxaPSS35TkOn9Eefe+nf8DL/gc+Pw67Wx9POET1/pS8u7vfnf13O5OeYPrrsVdir69/5ws/8mlr/wD4Ct1/1Hadncf8CH/jYyf8LP8Auovn3/Bt/wCMPF/w0f7mb9O89dfE35C/85Q/+T088/8Abs/7pllnh/8AwSP+ciz/AOb/ALiL9Bf8Cz/nF9P/AJ/+7k8Bzmnq3Yq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdir9+M+lX5SeG/n/APlfrP5teTtN8uaHf2WnXdlrMOpPJfGQRmOO3uoSo9KOQ8qzg9Oxznfbn2b1HbegjhxSAImJeq6oCQ6A970//A99qdN2B2jPPmjKQMDGo1dkxPUj+a+SYP8AnCfz00gF15t0GGLu0QupG+hWhjH45xEP+A/2kT6s0P8AZfqD3+T/AIN/ZYHpwZCfPhH6S9t8kf8AOHnkPy/cQ33mrUrnzncwkMtu6fU7LlT9qJHd2ofGSh7qc6Hsf/gUdnaaQlqJHIe76Y/IG/tea7c/4MvamrgYaaAxA9fql8yAB8n1pa2ttY20FnZW0VnaWyCOGCBFjjjRRRVRFAAAHQAZ22LFDHARiAAOQHJ4HLlnlmZTJJO5J3JeS/nH+cGh/lN5dmvbiSG98x3kZXStLL/HNIagSSBfiESndm2rTiDU5pPa32r0/YulMjRyH6Y9/mfJ33sZ7G6rt/WCEQRjH1y7h3Dzfj5retal5i1jUtd1i5a81PVriS6uZm/akkJY0HYb0AHQbZ4ZrNXl1WeWXIblI2T5l+hdDosOj08MOIVGIAA8gl0cck0kcUSNJLKwREUVZmY0AAHUk5VGJJoN0pCIJPJ+1f5Q+RY/y5/L7y95YKKt/BALjUWWh53s/wAc+4LA8WPEGvRRnv3sr2KOyuy8eCvVVy/rHn+p+bfbDt49sdrZdRfpJqP9UbD9a782/PMf5dfl95j80c1W9tbcwaepoed7P+7gABBBozciKfZBw+1PbI7L7MyZ73AqP9Y7BHsh2Ee2O1sWn/hJuX9Uby/U/M3/AKGh/PT/AKnn/uWaZ/2RZ5L/AMnI9ov9X/2MP+Jfaf8Ak1nsv/yj/wCzn/xTv+hofz0/6nn/ALlmmf8AZFj/AMnI9ov9X/2MP+JX/k1nsv8A8o/+zn/xTv8AoaH89P8Aqef+5Zpn/ZFj/wAnI9ov9X/2MP8AiV/5NZ7L/wDKP/s5/wDFPrr/AJxd/OzzD+Yr+Y/LvnbVU1PX7AJf2M/oQ27SWppHMhWBIkPpvxI+Gvxncgbdv/wN/bDVdqHLh1U+KY9UTQG3IjYAbfpfP/8Agqew+j7HGLPpIcMD6ZCyalzB9RJ3H3PsDO5fPX4y/np5DP5d/mX5g0SGEw6VdyfpLS9iFNndEsqrUCojYNHXxXPBfbLsT+S+1smID0n1R/qn9XL4P0b7CdvjtfsXFmJuQHDL+tH9fP4vIc0j0D3r8iPyVv8A82vMHqXYlsvJ2kSK2qXibNIacltoCf23puf2F3O/EHo/Yr2Qy9t6r1WMUfqP+9HmfseW9vfbfF2BpKjRzS+kf74+Q+1+t2k6TpuhabZaPo9lFp2madEsFtbQLxjjjXoAP1nqTuc9t0ulw6bDHHjiBECgA+A6vV5tVmllyyMpSNknqw38y9M8+635ZutG/L/UdO0XU9SDQT6jfvMr28DCjfVxFDL+8atAxI49R8VCuB7RabtLUaQ4tHKMZS2MpXsP6NA7/c7H2Y1XZWm1oy62EpRjuIxA3P8ASsjby6vhM/8AOFX5iMSzeafLzMxqSZLskk/9Guecn/gQ9q/6rj+cv+JfUR/wbuxx/kcnyj/xTX/QlP5h/wDU0eXf+Du/+yXH/k0Han+q4/nL/iU/8nu7H/1HJ8o/8U8j/Nn8ivMn5Q2ejXmu6tpupR63NLDCtg0xKmFVZi/qxR7HmKUrmj9p/YzV9hwhLLOJ4iQOG+nvAd/7Je3mi9oMmSOGEo8ABPFXX3EvEs0D0r69/wCcLP8AyaWv/wDgK3X/AFHadncf8CH/AI2Mn/Cz/uovn3/Bt/4w8X/DR/uZv07z118TfkL/AM5Q/wDk9PPP/bs/7pllnh//AASP+ciz/wCb/uIv0F/wLP8AnF9P/n/7uTwHOaerdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2Kv34z6VflJ2Koe5u7WyiM95cxWkCkAyTOsaAnoOTEDIZcsMcbkQB5s8WHJklwwBJ8t2Ea3+av5beXYnl1jzzotr6ZIMS3kU01RUGkMTPIaEb0XNfrPafsnSxvJngPiCfkLLs9D7J9s6yVYtPM+fCQPmaD5c/Mb/AJzJ0azhudO/LXTZNWvTyRdW1GNobVOoDxQGkj+I58Kdwemcd2//AMFrBCJhoo8R/nS2HvA5n409x7N/8BfUZJDJr58Mf5kd5e4y5D4W+BPMXmPXPNmr3eveY9Tn1fVr5uUtxO1WNNgqgUCqBsFAAA2AzzXX6/Ua3OcuaRlI8yX1bs7s3S6DTxw4ICMByASTKHJfSP8Azi35BHnT8zbLULyESaP5OQatcchVXnVgtrHuGFfUPOh7Ic6r/gb9h/yh2vGch6cfqPv/AIR89/g8d/wVPaD+TexJQifXl9A938R+W3xfrPntb4G/Ob/nM7z79f13RPy8spz9X0JBqWpKp2N1cJSBWFeqREsP+MmeV/8ABb7b8XUw0cTtD1S/rHl8h977D/wFewPC0uTXTG8/TH+qPq+Z+58QZ58+mOxV2KvQ/wAqvO0v5eef/LfmpS31awugl6i/t2c4MVwtKGp4OSPcDNn7NdsS7L7Sxagcgd/6p2P2Op9rOw49r9k5dMeZHp/rDeP2v2xhmhuIYri3lSeCdFkjkjYMjowqrKwqCCDUEZ9AwnGcQQbBfmqcJQkYyFEcw+Ov+cx/If6Z8n6Z54soeV95Un9C8KrVmsbpgvImv+65eNNujMc4T/gs9iePoYaqI3gaP9WX6j976H/wGO3/AMt2hPRzPpyCx/Wj+sfc+Jfyj/KjW/zY8zw6Np4az0m2Ky6pqRQtHawb9OxkehCLXc7migkefey3szqO2tYMUNojeUukR+vufS/a/wBrdL2DojlnvI7Rj1kf1Dq/YHyn5U0PyToGneWvLtmLLStNj4RpXk7sd3kkY7s7E1Jz3LsvsvT9n6aODCKiPxZfnvtftbVdp6uWozyuUvxQ8mRZluG7FXYq7FXwz/zm9/xwvIH/ADH33/JqHPOv+DH/AHGn98vuD6f/AMAz/GtT/Vj95fnbnl768+vf+cLP/Jpa/wD+Ardf9R2nZ3H/AAIf+NjJ/wALP+6i+ff8G3/jDxf8NH+5m/TvPXXxN+Qv/OUP/k9PPP8A27P+6ZZZ4f8A8Ej/AJyLP/m/7iL9Bf8AAs/5xfT/AOf/ALuTwHOaerdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/AKpuq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/ABls2X/VN1X/AFVYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff8AjLZsv+qbqv8AqqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/wDGWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVViP6K1T/q23X/Il/wDmnMH8rm/mn5F2H5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8wzz9Gal/1b7n/lF+P90/Xw+zmy/L5f5p/u+51X5rD/ADh/e94f/9k='
+        'content': preview_image
     },
         {
         'name': 'twitter:title',
@@ -45,7 +55,7 @@ app = dash.Dash(__name__, external_stylesheets=external_stylesheets, meta_tags=[
     },
     {
         'name': 'twitter:image',
-        'content': 'data:image/png;base64,/9j/4AAQSkZJRgABAgECWAJYAAD/7QAsUGhvdG9zaG9wIDMuMAA4QklNA+0AAAAAABACWAAAAAEAAQJYAAAAAQAB/+IMWElDQ19QUk9GSUxFAAEBAAAMSExpbm8CEAAAbW50clJHQiBYWVogB84AAgAJAAYAMQAAYWNzcE1TRlQAAAAASUVDIHNSR0IAAAAAAAAAAAAAAAAAAPbWAAEAAAAA0y1IUCAgAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAARY3BydAAAAVAAAAAzZGVzYwAAAYQAAABsd3RwdAAAAfAAAAAUYmtwdAAAAgQAAAAUclhZWgAAAhgAAAAUZ1hZWgAAAiwAAAAUYlhZWgAAAkAAAAAUZG1uZAAAAlQAAABwZG1kZAAAAsQAAACIdnVlZAAAA0wAAACGdmlldwAAA9QAAAAkbHVtaQAAA/gAAAAUbWVhcwAABAwAAAAkdGVjaAAABDAAAAAMclRSQwAABDwAAAgMZ1RSQwAABDwAAAgMYlRSQwAABDwAAAgMdGV4dAAAAABDb3B5cmlnaHQgKGMpIDE5OTggSGV3bGV0dC1QYWNrYXJkIENvbXBhbnkAAGRlc2MAAAAAAAAAEnNSR0IgSUVDNjE5NjYtMi4xAAAAAAAAAAAAAAASc1JHQiBJRUM2MTk2Ni0yLjEAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAFhZWiAAAAAAAADzUQABAAAAARbMWFlaIAAAAAAAAAAAAAAAAAAAAABYWVogAAAAAAAAb6IAADj1AAADkFhZWiAAAAAAAABimQAAt4UAABjaWFlaIAAAAAAAACSgAAAPhAAAts9kZXNjAAAAAAAAABZJRUMgaHR0cDovL3d3dy5pZWMuY2gAAAAAAAAAAAAAABZJRUMgaHR0cDovL3d3dy5pZWMuY2gAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAZGVzYwAAAAAAAAAuSUVDIDYxOTY2LTIuMSBEZWZhdWx0IFJHQiBjb2xvdXIgc3BhY2UgLSBzUkdCAAAAAAAAAAAAAAAuSUVDIDYxOTY2LTIuMSBEZWZhdWx0IFJHQiBjb2xvdXIgc3BhY2UgLSBzUkdCAAAAAAAAAAAAAAAAAAAAAAAAAAAAAGRlc2MAAAAAAAAALFJlZmVyZW5jZSBWaWV3aW5nIENvbmRpdGlvbiBpbiBJRUM2MTk2Ni0yLjEAAAAAAAAAAAAAACxSZWZlcmVuY2UgVmlld2luZyBDb25kaXRpb24gaW4gSUVDNjE5NjYtMi4xAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAB2aWV3AAAAAAATpP4AFF8uABDPFAAD7cwABBMLAANcngAAAAFYWVogAAAAAABMCVYAUAAAAFcf521lYXMAAAAAAAAAAQAAAAAAAAAAAAAAAAAAAAAAAAKPAAAAAnNpZyAAAAAAQ1JUIGN1cnYAAAAAAAAEAAAAAAUACgAPABQAGQAeACMAKAAtADIANwA7AEAARQBKAE8AVABZAF4AYwBoAG0AcgB3AHwAgQCGAIsAkACVAJoAnwCkAKkArgCyALcAvADBAMYAywDQANUA2wDgAOUA6wDwAPYA+wEBAQcBDQETARkBHwElASsBMgE4AT4BRQFMAVIBWQFgAWcBbgF1AXwBgwGLAZIBmgGhAakBsQG5AcEByQHRAdkB4QHpAfIB+gIDAgwCFAIdAiYCLwI4AkECSwJUAl0CZwJxAnoChAKOApgCogKsArYCwQLLAtUC4ALrAvUDAAMLAxYDIQMtAzgDQwNPA1oDZgNyA34DigOWA6IDrgO6A8cD0wPgA+wD+QQGBBMEIAQtBDsESARVBGMEcQR+BIwEmgSoBLYExATTBOEE8AT+BQ0FHAUrBToFSQVYBWcFdwWGBZYFpgW1BcUF1QXlBfYGBgYWBicGNwZIBlkGagZ7BowGnQavBsAG0QbjBvUHBwcZBysHPQdPB2EHdAeGB5kHrAe/B9IH5Qf4CAsIHwgyCEYIWghuCIIIlgiqCL4I0gjnCPsJEAklCToJTwlkCXkJjwmkCboJzwnlCfsKEQonCj0KVApqCoEKmAquCsUK3ArzCwsLIgs5C1ELaQuAC5gLsAvIC+EL+QwSDCoMQwxcDHUMjgynDMAM2QzzDQ0NJg1ADVoNdA2ODakNww3eDfgOEw4uDkkOZA5/DpsOtg7SDu4PCQ8lD0EPXg96D5YPsw/PD+wQCRAmEEMQYRB+EJsQuRDXEPURExExEU8RbRGMEaoRyRHoEgcSJhJFEmQShBKjEsMS4xMDEyMTQxNjE4MTpBPFE+UUBhQnFEkUahSLFK0UzhTwFRIVNBVWFXgVmxW9FeAWAxYmFkkWbBaPFrIW1hb6Fx0XQRdlF4kXrhfSF/cYGxhAGGUYihivGNUY+hkgGUUZaxmRGbcZ3RoEGioaURp3Gp4axRrsGxQbOxtjG4obshvaHAIcKhxSHHscoxzMHPUdHh1HHXAdmR3DHeweFh5AHmoelB6+HukfEx8+H2kflB+/H+ogFSBBIGwgmCDEIPAhHCFIIXUhoSHOIfsiJyJVIoIiryLdIwojOCNmI5QjwiPwJB8kTSR8JKsk2iUJJTglaCWXJccl9yYnJlcmhya3JugnGCdJJ3onqyfcKA0oPyhxKKIo1CkGKTgpaymdKdAqAio1KmgqmyrPKwIrNitpK50r0SwFLDksbiyiLNctDC1BLXYtqy3hLhYuTC6CLrcu7i8kL1ovkS/HL/4wNTBsMKQw2zESMUoxgjG6MfIyKjJjMpsy1DMNM0YzfzO4M/E0KzRlNJ402DUTNU01hzXCNf02NzZyNq426TckN2A3nDfXOBQ4UDiMOMg5BTlCOX85vDn5OjY6dDqyOu87LTtrO6o76DwnPGU8pDzjPSI9YT2hPeA+ID5gPqA+4D8hP2E/oj/iQCNAZECmQOdBKUFqQaxB7kIwQnJCtUL3QzpDfUPARANER0SKRM5FEkVVRZpF3kYiRmdGq0bwRzVHe0fASAVIS0iRSNdJHUljSalJ8Eo3Sn1KxEsMS1NLmkviTCpMcky6TQJNSk2TTdxOJU5uTrdPAE9JT5NP3VAnUHFQu1EGUVBRm1HmUjFSfFLHUxNTX1OqU/ZUQlSPVNtVKFV1VcJWD1ZcVqlW91dEV5JX4FgvWH1Yy1kaWWlZuFoHWlZaplr1W0VblVvlXDVchlzWXSddeF3JXhpebF69Xw9fYV+zYAVgV2CqYPxhT2GiYfViSWKcYvBjQ2OXY+tkQGSUZOllPWWSZedmPWaSZuhnPWeTZ+loP2iWaOxpQ2maafFqSGqfavdrT2una/9sV2yvbQhtYG25bhJua27Ebx5veG/RcCtwhnDgcTpxlXHwcktypnMBc11zuHQUdHB0zHUodYV14XY+dpt2+HdWd7N4EXhueMx5KnmJeed6RnqlewR7Y3vCfCF8gXzhfUF9oX4BfmJ+wn8jf4R/5YBHgKiBCoFrgc2CMIKSgvSDV4O6hB2EgITjhUeFq4YOhnKG14c7h5+IBIhpiM6JM4mZif6KZIrKizCLlov8jGOMyo0xjZiN/45mjs6PNo+ekAaQbpDWkT+RqJIRknqS45NNk7aUIJSKlPSVX5XJljSWn5cKl3WX4JhMmLiZJJmQmfyaaJrVm0Kbr5wcnImc951kndKeQJ6unx2fi5/6oGmg2KFHobaiJqKWowajdqPmpFakx6U4pammGqaLpv2nbqfgqFKoxKk3qamqHKqPqwKrdavprFys0K1ErbiuLa6hrxavi7AAsHWw6rFgsdayS7LCszizrrQltJy1E7WKtgG2ebbwt2i34LhZuNG5SrnCuju6tbsuu6e8IbybvRW9j74KvoS+/796v/XAcMDswWfB48JfwtvDWMPUxFHEzsVLxcjGRsbDx0HHv8g9yLzJOsm5yjjKt8s2y7bMNcy1zTXNtc42zrbPN8+40DnQutE80b7SP9LB00TTxtRJ1MvVTtXR1lXW2Ndc1+DYZNjo2WzZ8dp22vvbgNwF3IrdEN2W3hzeot8p36/gNuC94UThzOJT4tvjY+Pr5HPk/OWE5g3mlucf56noMui86Ubp0Opb6uXrcOv77IbtEe2c7ijutO9A78zwWPDl8XLx//KM8xnzp/Q09ML1UPXe9m32+/eK+Bn4qPk4+cf6V/rn+3f8B/yY/Sn9uv5L/tz/bf///+4AE0Fkb2JlAGQAAAAAAQUAAklE/9sAhAACAgICAgICAgICAwICAgMEAwMDAwQFBAQEBAQFBQUFBQUFBQUFBwgICAcFCQoKCgoJDAwMDAwMDAwMDAwMDAwMAQMCAgMDAwcFBQcNCwkLDQ8NDQ0NDw8MDAwMDA8PDAwMDAwMDwwODg4ODgwRERERERERERERERERERERERERERH/wAARCAIIAZIDAREAAhEBAxEB/8QBogAAAAcBAQEBAQAAAAAAAAAABAUDAgYBAAcICQoLAQACAgMBAQEBAQAAAAAAAAABAAIDBAUGBwgJCgsQAAIBAwMCBAIGBwMEAgYCcwECAxEEAAUhEjFBUQYTYSJxgRQykaEHFbFCI8FS0eEzFmLwJHKC8SVDNFOSorJjc8I1RCeTo7M2F1RkdMPS4ggmgwkKGBmElEVGpLRW01UoGvLj88TU5PRldYWVpbXF1eX1ZnaGlqa2xtbm9jdHV2d3h5ent8fX5/c4SFhoeIiYqLjI2Oj4KTlJWWl5iZmpucnZ6fkqOkpaanqKmqq6ytrq+hEAAgIBAgMFBQQFBgQIAwNtAQACEQMEIRIxQQVRE2EiBnGBkTKhsfAUwdHhI0IVUmJy8TMkNEOCFpJTJaJjssIHc9I14kSDF1STCAkKGBkmNkUaJ2R0VTfyo7PDKCnT4/OElKS0xNTk9GV1hZWltcXV5fVGVmZ2hpamtsbW5vZHV2d3h5ent8fX5/c4SFhoeIiYqLjI2Oj4OUlZaXmJmam5ydnp+So6SlpqeoqaqrrK2ur6/9oADAMBAAIRAxEAPwBTPmp+rXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/wCMtmy/6puq/wCqrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/AMZbNl/1TdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KtgE7AEn2xUml3B/5G+440jiHesxS7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/AFTdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXt/5A/ldF+annuHS9RMieXtIgOoaoYzxZ4kZVSBW7GR2AJ68QxG4zoPYj2bHbPaIxz+iI4pe7u+LzP8AwQfaqXYXZZyY/wC8keGPv6n4D7afrnoug6J5csYtM0DSbTR9PhACQWcSQoKClSEAqfEnc57do9Dp9JjEMMBGPcBT4Bru0NTrMpyZpmUj1JtNsvcd53+Yf5X+UfzL0e70zzDpcDXcsRW21JI1F5ayAHg8ctA1ATupPE9CM1Xb3s1oe1sBhmiL6Sr1D3H9Dt/Zz2q7Q7F1EcmCZq9436Ze8fpfjP5m8v3/AJU8w615a1NQL/Q7yaymK14s0Tlea1/ZYCoPgc8H7Q0OTR6qeGfOJIPwfo3svtDFr9Jj1GP6ZgSHxSPMdyXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff8AjLZsv+qbqv8AqqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Kv1H/5xB8k/4e/LmfzPcxcNQ853RnQnqLK1LRQClKir+o3XcFc9g/4FXY/5bss55D1ZDf8Amx2H22+H/wDBi7c/N9sDTxPpxCv86W5+yg+sc7V4J2KuxV+an/OZXkb9E+b9I88WkVLPzTb/AFa8I6C9s1Cgnp9uErT/AFGzyb/gs9jeBroaqI2mKP8AWj+sfc+z/wDAX7d/Mdnz0kjvjNj+rL9R+98ZZwb6M7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ksv8heTtS8/ebtD8p6Wp+satcLHJKASIIB8U0zeyICfwzN7F7Ky9pa2Gnx85H5DqfgHX9v9s4eyuz8mpycojl3noPiX7caRpVloWlaboumxehp+k2sVnbR/yxQoEQV+S59B6TS49NgjigKjEAD3B+aNZq8uqzzy5DcpEk+87pjlrS7FXYq8q/OryAv5k/l1r3lyKNW1RUF7pbN+ze21WjANQBzBaMk9AxzS+2HYf8q9lZMIHq5x/rDl8+Xxd77Ee0B7G7Yx5yfT9Mv6p5/Ln8H4wSxSwSyQTRtFNC5SRHBVlZTQqQdwQRngsomJo836PhOMogg7FTwJdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVUiilnljggjeaeZxHHHGCzOzGiqqipJJOwwxiZEADdE5xjEkmgH6P/AJFf84uaTo9ja+aPzM0yPVdeuVWW20a5Ae2slNCpuI/sySnurVVelC249U9i/wDgbYcGMZ9dHimdxA8o/wBYdT9j477ef8FTUajKdP2fMxgNjMfVL+qeg+0vo/Xfyi/LHzHZNYap5G0Z4ivBZLe0jtp4wK0Ec0CxyL16Bs6vW+ynY+qx8E8EPgBE/Aii8boPbDtvR5OPHqJ35kyHxErD5C8//wDOF88Zmvvy314Tp9oaXrBCuNhtFdIoU1NaB0Huxzhu3P8AgRzjc9Fkv+jLn8JD9PzfQfZ7/g1wNQ1+Ov6UOXxif0H4PjnzX5B85+RrprTzX5bvtFcOUWSaMmCQgkfup05RONuqsc4XtPsTX9nT4dRjMfeNvgeRfROyfaDs7tOHFpssZe47j3x5hiGYTsHpnkH8ofP35kXcUPlvQpmsWI9XU7pWhsYh3JmYUY/5K8m9s23Ynst2l2rMDBjNfzjtEfF0vtB7YdldjYyc+QcXSI3kfh+t+n/5M/kh5f8Ayh0yRreU6r5n1KJU1HU3XjVQeXowJvwjBAPUliKnsF9e9kfY3Tdh4iQeLIR6pfoHk+Je2vtzq/aDOLHDiifTH9Mu8/c9tzoXmXYq7FXYq7FXx3+e3/OMFv53u7zzh5FeLTfNNyWlvrCYhLW/kO5kR6fu5W7k/Cx3PE1Y8J7af8DiPaE5anSUMh3MTyl5+R+w+T6J7Bf8FKfZmOOl1lyxDaMh9UB3ecftHm/O/wAy+TvNPk68aw80aBe6HdKxUC6iZEeld45N0cbdVJGeX9odlazQ5ODPjMT5j7u99d7M7Z0PaOPj0+SMx5H7xzDG8xXMereSfyT/ADL8/PC2heWLlNPlI/3I3ym1swp/aEsgHMDuEDH2zcdj+yHa3aRHhYjw/wA47R+Z/Q6Ltz237F7KB8bMOL+bH1S+Q5fGn2x+Xn/OHflPRPSv/P1+3m3UAAfqNvztrCNqGoJBWWWhoQaoPFTnoHYP/An0Wnqerl4kv5osR/Wfs9z5r7R/8GXX6m4aKPhx/nGpTP6B9vvfRo/Kz8tFsX01fIHl5bKRODRrptsKgAgEsI+XLc/FWvetc6r/AEM9keHwfl4V/VH6njv9FfbXi+J+ZyX/AFpfrfA3/OQX/ONk/ko3fnLyLbSXXlD+8vbAFpJtN8WUmrPD7kkr3qN8819uv+B9Ls+9TpReLqOZh/x37n1b/gef8EyPaXDpdYay9JchP9UvvfHucO+hOxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/RP/AJxN/JnTINHtPzT1+2W81W/eQaHDIAyWsMbNG1zT/fjsrBaj4VFRu23qP/Aw9ksMcA1+YXI3wDuA24ve+Q/8Fz20zy1EuzsJqIrjP84nfh9w+34PuXPRHzB2KuxVQubW2vYJbW8t4ru2mHGSGZFkjceDKwIORyYoZImMgCD0LLFlnjmJQJBHUbFjEHkDyHbTLcW3knQLedDVZItNtUcHrUMIgcw4dhdmQlccEAf6sf1OdP2h7VnHhlqMhHcZy/Wy1VVVCqAqqKADYADsMzgAA68kkt4q7FXYq7FXYq7FXYqh7q0tb63ltL22ivLWccZIZ0WSNxWtGRgQenfIZcUMsDGYBB6HcM8WbJimJQJBHIjYsbt/IXkW0uEu7TyXoVrdRNzSaLTrVJFbxDLECDmJj7D7NhLijggD3iI/U5mT2g7UyQMZajIR3GUq+9lmZzgOxV2KrXRJUeKVFkjkUq6MAVZSKEEHYgjBKIkKKYyMTYflT/zk1+Tdh+WfmCw1ry4hi8r+aGmMdrWv1O6jo0kKk/7rYOCnh8Q7CvjP/BE9k8fZGqjkw/3c7ofzSOY93c+7f8C/20y9taSWLP8A3uOrP86J5H3975fzkXtnYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/wCqbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/W3/nFnzLZ6/8Ak/oVnAyi88tST6Zdxg7qyyNLG1OtGjlXfxr4Z7X/AMDTtDHqew8cRzgTE/Ox9hfAv+Ct2Zk0ntDkmeWQCQPwo/aH0XnVPHuxV2KuxV2KuxV4R52/5yP/ACp8kPLa3Gvfp7VIqhrLRlF2wYDo0oZYVNdiC9R4ZzfbH/BB7G7PJicnHLuh6vt5fa9T2H/wNe3u0wJRx8ET1n6fs+r7HzH5i/5za16ZmTyp5LsdPjAIEuqTyXTt1o3pw/Vgvy5NnI6//gw6qRrT4YjzkTL7uF7bs3/gH6WIvU6iUj3RAj9p4nk97/zlb+dl07NB5ktdNB6Lb6dZsBuenrwzH8c0uX/gme0EztlA90Y/pBd9h/4E3s1Ab4jL3yl+ghJov+clfzvhuJblPPk5kmryD2di8YqQfhja1KL07AZRH/ghe0MZmQ1B38o18qpyZ/8AAy9mZQETphQ/pSv58Vsm0z/nLf8AOWwkR7vUtN1pFpWO8sIkVunU2v1Y9uxzL03/AAUe3sZuU4y98R/veFwtV/wIfZzLGowlHzEj/vuJ7R5X/wCc2oGMUPnPyU0QLfvLvRp+YAPhbXHE7f8AGXN92b/wYRsNTg+MD/vT+t5vtT/gHSFnS6j4TH++j/xL6q8j/nB+Xf5hqi+WfMlvPfsKnT7g/V7wda0hl4s1KblOQ987Psb2s7K7UFYMo4v5p2l8j+h4Tt32N7Y7IN6jERH+cN4/Mcvi9MzbuldirsVdirsVdir4B/5zZ80Wbt5M8mwuHvoDNq90o/3XG49CAV8WKybew8c8z/4MPaOMnDphzFyPx2H6X1j/AIB/ZeQDUao/SagPPrL9D4FzzZ9VdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Kvp3/nFT8wm8nfmNBoV5cenonnULp8wY0RLsEm0k6gVLEx/7POt/4Gnbp0HaoxSPoyek/wBb+E/o+LxX/BY9nR2j2Oc0R68XqH9X+Ifp+D9W89ofB3Yq7FXYq8v/ADO/N3yf+VWmC88w3Zl1G5Qmy0u2Ktd3JG1QpI4oD1dqAe52zT+0ftVoexcPFmNyPKI+o/s83eey/sf2j27n4cEaiPqkfpj+3yfmd+Z3/OQvn/8AMqS4tJb5vL3lqUlV0jT3ZEdDTa5lHF5jsKg0WvRRnkntH7ddp9rExMuDH/Njy/zj1+7yfafZf/gddk9igSEePJ/Pl/vR/D9/m8IznXqHYq7FXYq7FXYqvilkhkSaGRopYmDI6EqysNwQRuCMYyMTYRKIkKI2fW35Uf8AOWHmvym9po/nky+bfLqlY/rTEHUrZK7kSsR6wFejnl2DgbZ23sx/wTtboSMeqvJj7/4x8evx+bwPtb/wJNBrxLLo6x5O7+CXw/h+Hyfo75V82eX/ADrotr5g8s6nFqul3eyyxHdHABaORDRkdaiqsARnqvZnaml7Q04zYJCUT+KPcXx3tbsjV9m6k4NRAxkOh+8d4ZFmU4bsVdiqE1C/s9LsL3U9QnW1sNOt5Lq5mevGOGFS8jmlTQKpOV58+PDilkmaiAST3Ac2zT6fJnyxxwFykQAO8nYB+I/5iecrz8wPOnmDzbeclbVrpngiY19G2SiQRf7GNQPnvnz7272tk7T1+TUS/iOw7h0HwD9L+znYuPsns3Fpofwjc955k/EsKzAdk7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVVhmlt5oriCRoZ4HWSORDRkdTVWBHQgjDGRjIEHcInCM4mJFgv29/LjzT/jXyH5U80t/f6xpsM1wAAoFyq8JwAOwlVqe2fQns92l/KHZuHP1lEX7+R+1+ZvaXsr+Te1c2n6RkQPdzj9jNs2DrHYq+f8A89vzz038pdJSzsli1LznqsTNYWbGscKdPrNwAQeAP2V6sdugJHMe2vtpi7Fw8MN8suQ7v6Uvxu9Z7Bewmbt/UcU7jhifUe/+jHz+5+UXmLzHrfmzWL3X/MOpTarq2oPzmuJ25E9lVR0VVGyqKADYCmeMa/X6jW55Zc0jKR5kvvHZ3Zum0GnjhwQEYDkAkmUOS7FXYq+5/wAnv+cSY9d0qy8zfmTdXVjBqEaz2mjWhEU3pOKq11IysV5A14KAw7sDVR6H7J/8C4anDHPrSQDuIjY1/SP6HzD2y/4Lx0ueWn0EQSNjM7i/6I/S+gtQ/wCcUPyUvbI2tt5evNJn2/0y01G6afYUO1xLcRb9fsZ0+f8A4GPs/kx8McZie8SN/wCyJH2PJaf/AILftLjy8UsokO4xjX+xET9r4N/Oz8itb/KG+trj6z+mvK2puUs9RCcGSUAn0LhATxegqCNmHTcEDzj2v9i9R2HkBvixy5S8+4+b6n7Ee3mm9oMRjXDljzj5fzonu+54RnOPUuxV2KvSfyx/NLzN+Vevx6zoM5ktJWVdQ02RiLe8iWvwuBWjCp4sBVT4ioO19nfaTV9jakZcJ2/ij0kPN03tR7K6Lt3SHFmG4+mQ5xPl+kP13/L78wfLn5leXLbzH5cufUhkolzbOQJ7ScAFoZlB2I7HoRuNs9v7B7e0va2lGbCfeOsT3F+fvaL2d1nYusODON+h6SHeGcZsXWOxV8t/85b+b5PLn5XPo9rIY7zzheR6eSvUW0Y9ac19+CofZs47/gpdqnS9j+FE75DXwG5e4/4EHY41nbniyG2IcX+cdo/r+D8q88bfdXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/AMZbNl/1TdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXp/wCXP5P+evzQujF5Y0r/AHHwuEuNTuyYbKDcVDSUJZhWvFAzU3pTNt2B7K9o9sTrBDbrI7RHx/Vu6T2k9sey+w8d6ifqPKI3kfh+k0H2l5V/5ws8qWcSS+cPM2oa1dlQWh04JZ26t3HJ1mkYeBqvyzv+zP8AgQ6OEb1OWUj3R9I+2z9z5v2t/wAG3X5JVpcMYjvlcj9lAfa9Uh/5xa/I2KJI38mvcuooZZNS1EM3uQl2i/cBm5h/wNfZ2MaOG/Pil+iTop/8FX2nlKxnryEIfpiWJ6//AM4d/lXqcc50efVvLdw3Ixehci5hQk1AZLhZHYDpT1AffMHXf8CfsfKD4ZlA9KNj5Hf7XP7P/wCDL27hI8UQmOtjhPzjQ+x8nfmT/wA4t/mB5EhudU0sJ5y0C3DO9xYRst1FGtSXmtSWYAAVJRnA70zi/aH/AIG/afZsTkh+8gOseY98f1W977M/8FTsntSQx5P3WQ9JfST5S/XT5n6bHYjOTe0dirsVdir9lP8AnHzTrjS/yZ8gW1ypSSTTjdAMKHhdzS3EZp7pKM939hMEsPYGnjL+bf8ApiZD7351/wCCJqYZ/aPUyjy4q/0oET9oeyZvnnHnf5pfmLpX5X+T9R80alxmmj/cWFpy4tdXcgPpxD22LMeygnNV7S9v4ex9DLPPc8oj+dLoHceyvs3n7b7Rjp8ew5yP82PU/jq/GrzR5m1nzjr2p+ZfMF419q2rTGaaRug6BUQb8URQFVewAGeEdo9o59dqZZs0rlI2X6L7L7L03Z2lhp8EahEUB+k+Z6pBmM5TsVdir0z8mtDs/Mf5p+RdH1CNZrK51aF54nFVkjgrM0bDwYR0Pzza+ymjhqu2MGOYsGQvzrevsdL7aa7Jo+w9TlgakIGj3Xtf2v2sz6Afmx2KvKvzw0G08xflN59sbxUIttHudRhZgPgnsUNzGQTSnxRUJ8Cc0vtnooarsTURl0iZD3x9Q+533sL2hk0fb+mnHrMRPumeE/e/FzPBH6PdirsVdir138mfzX1T8p/NsGrQNJcaFflbfWLAGont6/bUEgepHWqH5rXixzd+yXtNm7F1oyDeB2kO8frHR0Htr7JYO3tAcR2mN4S7j+o9f2P2M0rVNP1vTbHWNJu477TNTgS5tbiI1SSKQBlYVodwehz3XS6nFqMMcmM3GQsHyfnbV6XNps0sWWNSiaIPQhH5a1Pif/nNqxuJfKPkzUUQm1s9Xmt5W/le4gLJ94hbPPv+DDhkdFgmOQkR8xt9z6X/AMA7PCPaGoxnmYAj4Hf735v55W+xOxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FX0n/wA4+/kRc/mpqTa1rfqWfkjSJwlw61WS9mFGNtC3YAEc2HQEAbmo6r2G9ip9s5vEybYonf8ApH+aP0vG/wDBD9vodhYfCxb5pDb+iP5x/Q/VbS9K03RNOs9J0ixh03TLCMQ29tboEjjQdAqjPZtNpcWnxRx44gRGwA5PhOr1ebVZpZcsjKRNknmUflrUl1zq+k2cpgu9UtLWZQCY5p40YA9DxZgcpyazBjlUpgHzIbsWi1GSNxgSPIFMcuaXYq+J/wDnI3/nHKy1qyv/AD75CsEtNdtEa41TS7daR30Y3eaFBssyjcgbOP8AL+1597f+wGPPjlq9JGpjeUR/F5jz+/38/Sv+Bt/wScmmyR0WtlcDtGR/h8j/AEfu93L5v9NjsRnlb7G7FXYq+nLL/nLT81tOs7TT7JNDt7Oxhjt4IlsmokUShEUVmJoAAM63D/wT+2sWMQjwAAUBw9B8Xis//Aj7BzZJTnxkkkk8XU8+iJ/6HA/N/wDn0X/pBP8A1Vyf/J1O3e+P+l/aw/5M57Pd0/8ATfseU/mR+bvnP81JdMk81XUDRaQjrb29pGYYQ0hBdynJqsQAK+AzS+0HtTr+2ZROoI9PIAUN3fezXsf2b2FGY00T6uZJs7dHmGal3TsVdirsVZJ5P8x3HlDzV5e80WsYmm0G/gvRGdhIInDMhpTZlBB+eZXZWvnodZjzx5xkD8ujh9sdmw7Q0OXTyNCcTG+6xzftn5V806J5z0HTvMnl68W90vU4hLG4pyQ/tRyKCeLqdmXsc+gezO09P2hpo58MrjL8UfN+ae1uytT2bq56fPGpRNH9Y8iyHMpxHy//AM5TfmZp3lH8v9R8q292G8y+coWso7eNxzis3IFzNKBWishMYBpyLbVCtnH/APBK9osWi7Mlp4n95kFUOkf4ifhs9v8A8Cn2YzdodrR1Mo/u8R4iT1l/CB7jv8PN+U+eNPuzsVdirsVdir9B/wDnDj8zZLmDUfyx1a5Z2s0fUdEMjdIi3+k261PZm9RQPF/DPTf+BN7RGQloch5eqH++j+n5vkv/AAZ/ZgQlHtDGOfpn7/4Zfo+T7xz0h8seVfnV5Eb8xvy48w+W7dFfVDEt5ppY0pd2x9SNa9BzAKEns2aX2w7EPavZWTDH6ucf6w/Xy+LvfYjt8dj9s4s8j6bqX9WWx+XP4Pxhnhmtppre4ieC4t3aOWORSro6EhlZTQggihGeCzhKMiCKIfo+E4ziJRNg7gqWBLsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxVPfLHl++81+YtE8taYAb7XLyGzhLfZUysF5t/kqDU+wzI7O0OTW6qGGHORAHxcXtTtHFoNHk1GT6YAk/B+3HlHytpXkry3pHlfRYRDp2j26wJsA0jDd5Xp1Z2JZj4nPoLsrszD2fpIYMQ9MRX6z8X5o7Y7Vz9payeoym5SN+7uA8gu81eadE8l6BqPmXzFeLY6VpkfqSOd2Y9FjjXqzsdlA6nD2n2np+z9NLPmlUR+KHmvZPZWp7S1cdPgjcpcv1nyflp+aP/OSvnzz/dXNppV9P5S8rlisVjYymOeVOlbm4Ti7EjqoITtQ9c8c9pP+CF2l2nMxhI48fSIO5/rH8B9x9lf+Bl2V2TjEskRky9ZSFgf1Yn7+b51d3kZnkYu7mrMxqST3JOcuSSbL2AAAoM/8k/mn58/L26juPK/mK6s4VIL2UjGazlHSj271Q7HqAGHYjNl2P7Sdpdlz4sGQjy5xPvidnU9ueynZXa+Mx1GIE/zuUh7pDd+o35JfnZpH5vaNMfRTSvNOkon6S04PyUhthcW5O7RsR06ofhYmqs3sPsd7Y4O3MB24ckfqj+keX3Ph/tx7D6j2f1A34sUvpl/vZef3/d3HOieYfk9/zlH+WsPkP8wDqml2/oaB5yWTULdFXjHDdBh9ahQAAABnVwB0D07Z4t/wSPZ6PZvafHjFQyeoeR/iH6fi+9f8Cv2ml2r2T4eQ3kxVE95j/Cf0fB80Zyb2bsVdirsVdirsVdirsVdirsVeheQvzG8/+QLme48laxdWKTFTc2yoLi2lNCAZIHV0JpWjUqOxzZdi9v8AaXZkzLTTIvmOYPvB2dT2/wCzfZPa0BHV4wa5HlIe4ii9ivf+cp/zyvLWS2jktNPeReP1i200eqtRSq+p6ig/7HN7m/4JXtDOBiCB5iO/2287g/4FPsxjyCRBPkZbfZT5v1nVtX1zU7vVNev7nUtWu3LXFxdu0kzN0+IsSdugHYbZyur1WfUZTkyyJkeZPN7LRaTT6bDHHhiIxHIDYJXlTc7FXYq7FXYqyzyJ5quvJPnDy75qsyfV0S+iuHQGnqQ14zRmnZ4yyn55mdjdpT7P12PUR5xIPw6j4hwO3uysfafZ+XTT5TiR7j0PwL9xLS6t761tr2zmW4tLyJJ4JU+y8cihkYexBBz6GxZYZYCcTYIsHyL8yZsU8WQwkKINEeYRGTYPjv8APr/nGRfPV9decvI8kFh5nuAGvtPlpFb3zgU9VH6JKaCtfhbqSDUnhPbb/gdfyjkOp0tDIecTsJed9D976J7Af8FD+S8UdLrATjH0yG5j5V1j9z87vMvlHzP5Ov20zzRod5od6taJdRlA4BpyjfdXXbqpIzy7tDsvV6HL4efGYnzH3d7692Z2xou0cXiafIJjyP39zHMxnLdirsVdirsVdirsVdirsVdirPv/ABls2X/VN1X/AFVYDmtdq7FXYq7FXYq7FXYq7FX1f/zh1okOpfmtcanN18u6NdXUP/GaZorX/k3O+dn/AMCjRxzdtGZ/ggSPeaj9xLwf/Bm10sPYIxj+OYB9wuX3gP1Jz2J8OfnD/wA5m+ebm98y6N5Atbhl03RbZNSvYwaK95cchFyHfhFuP9c55V/wW+2Z5NXDSRPpiOIj+keXyH3vsf8AwFewYYtFk1sh6pHhif6I5/M/c+Jc8/fSnYq7FXoX5V+d7r8vPPvl3zRbyslvaXSRX6A7S2UxCXEZB2+wSRXowB7Zs/ZvtifZfaWPPE7A7+cT9Q+TqfavsPH2v2Vl08huRcfKQ3ifm/bbPoJ+aGN+ZfJ/lfzjawWfmnQbLXra1k9WFLyJZPTcihZCRUVHWnXMTtHsnR6+AjnxiQG4scnM7M7Z13Z0zPT5JQJ2NGrYZ/yov8oP/LeaL/0jj+ua/wD0Fdhf8o8fk7L/AEee0P8AylT+bv8AlRf5Qf8AlvNF/wCkcf1x/wBBXYX/ACjx+S/6PPaH/lKn83f8qL/KD/y3mi/9I4/rj/oK7C/5R4/Jf9HntD/ylT+bv+VF/lB/5bzRf+kcf1x/0Fdhf8o8fkv+jz2h/wCUqfzd/wAqL/KD/wAt5ov/AEjj+uP+grsL/lHj8l/0ee0P/KVP5u/5UX+UH/lvNF/6Rx/XH/QV2F/yjx+S/wCjz2h/5Sp/N3/Ki/yg/wDLeaL/ANI4/rj/AKCuwv8AlHj8l/0ee0P/AClT+aGvfyC/J69tLmzbyFpdsLmNo/Vto/Smj5CnKN1NQw6g5DN7DdhZIGP5eIvqNj8GzB/wQfaHFkEvzMjR5E2PiH4z54Q/Rb2H8gvLul+a/wA3vJWiazbpd6bPcXFxNBIoeOX6naz3So6nYqzQgEHqM3nsR2fh1vbmDFlFxJJI7+EGVfY89/wQO0s+g9n9RmxGpAAAjpxSEbHzfsjb29vaQx21rBHbW8I4xxRKERB4KqgADPd8eOGOIjEUB0D865Mk8kjKRsnqVbJMXm35t+VtF81/l95rs9Y0+C7a20m9ntJpY1aS2njhaRJYmIJUhkFaHfods1HtV2bp9b2XmjkiDUZEHqCBdj5O59kO1dToO1sMsUiLnEEA7EE0Qfm/FDPAX6UdirsVdirsVdir9iP+ccfMB8xfk35MuJJ/WudNt5NLmrWqfUpXhiU1/wCKlQ/Tnuf/AAP9d+a7BwkmzEcJ/wA00Psp+ef+CV2d+T9otQAKEiJD/OFn7be4Z0TzDsVSzV9F0fzBYy6Zrul2usadN9u2vIUmiJoRXi4Irvscp1ejwarGYZYCUe4iw36PXajSZRkwzMZDqDR+x8r+eP8AnD3yFr3r3flG9ufJt+9SsArd2JanT05GEi1PcSUHZe2cb2z/AMCjs3U3LTyOM931R+R3+34Pddhf8GTtXS1HVRGWPf8ATL5jb7Pi+AvzG/LTzR+V2unQvM1sitKpltLuAl7a6iBpzicqp2OxBAI7jpnmnb/s9rOx9T4Wce4jlId4fVvZv2n0Pbml8bTnyIP1RPcXn+a12zsVdirsVdirsVdirsVZ9/4y2bL/AKpuq/6qsBzWu1dirsVdirsVdirsVdir7T/5wmeMedvOEZX96+hoymg2VbmIMK9erDO9/wCA+R/KOYf0P0h83/4OET/JmA9OP/el+kuesPjT8jv+cqYJ4vzv82SS19O5h02SGtfsCxt0NP8AZo2eI/8ABLhIe0OYnqI1/pQ+/wD/AAKJxl7M4QOhkD/pif0vnjOYeudirsVbALEKoLMxoANyScQFJp+8eh21xZ6Lo9ndbXVrZW8M3T+8SNVb7JI6jsc+jtDjlj00Iy5iIB+T8s6/LDJqcko8jIke600y9odirsVdirsVdirsVdirsVfgPnzU/Vr37/nF7/yenkb/ALef/dMvc6X/AIG//ORYP87/AHEnlP8Agp/84vqP8z/dxfr1nuD8+uxVjHnb/lDPN3/bFv8A/qHkzD7a/wCM/N/Ul9xc7sP/AI0sH9eP3h+F2fOz9PuxV2KuxV2KuxV+nH/OF1+J/wAtNesGJMlh5hmYDsI5ra1K0Nf5lbPXP+BFnEuyckO6Z+0B8U/4Nmn4e2cU+hxj5iUn2BncvnrsVdirsVfHP/OatjaSflz5a1J4Va+s/MUVvDN+0sVxaXbSoPZmgQn/AFRnCf8ABfwwPZeKZG4yUD5GMr+4Pon/AAEdRkj2xlxg+k4ySPMSjX3l+ZueSvtLsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2Kvo3/AJxY81ReWPze0iC5l9G180W82iux6epOUkgHzaaFFHzzqf8Aga9pjR9uQEjtMGHz3H2gPH/8FbsmWt9n5mIs4yJ/AWJf7El+tee2PgT4j/5zB/K661rTdP8AzI0a3ae60CH6nq8Ua1Y2XJninoBX927sG6/CwOwU557/AMFb2bnnxR1uMWYipf1eh+HX9j6Z/wABv2qhps0tBlNCZ4oH+lyMfj093m/OPPLH2F2KuxV9Af8AOOX5YXX5ief9Pubm1Z/LHliaO/1OZlrG7RnlDbVqKmRl3H8oY50vsD7OT7U7SiSP3cCJSPTyj8fueT/4JHtTDsjsmUYy/eZAYxHXfnL4ffT9eM9wfn54l+cf54aD+TsOirqGnT61qWttKYbS2kSMpDDx5yyM3IgFnAXbf4v5c572t9stN2FGAnEylK6ANbDqXpvYz2F1XtFLJwTEYwqyQTuegeEf9DvaB/1IWof9JsX/AFSznP8Ak8en/wCUc/6Yfqep/wCTG6r/AJSY/wClP63f9DvaB/1IWof9JsX/AFSx/wCTx6f/AJRz/ph+pf8Akxuq/wCUmP8ApT+tMtH/AOczdC1jV9K0lPI1/A+qXkFosjXkRCGeRYwxAiFacq5bpf8AguafPmjj8AjiIH1Dqa7mnWf8BXVafTzyHURPCCfpPQX3vtLO/fNnyB5x/wCcvvLnlTzVr/lmPyjf6odAvptPluluI4Vea3YxzcUKMQBIrAGu4Fe+cN2t/wAFXS6LWZMAwmXATG7A3Gx6d76F2N/wHdZr9Di1BzxjxxEgKJ2O43vuY1/0O9oH/Uhah/0mxf8AVLMT/k8en/5Rz/ph+pzf+TG6r/lJj/pT+t9V/lt53t/zH8laL5ztbCTS4NZ+s8baVxI6fV7ma3NWUKDUw16d87P2e7Zj2r2fDUxjwiV7c+RMf0PCe03YU+x+0smklLiMa3G3OIl+lnObF1b8B8+an6te/f8AOL3/AJPTyN/28/8AumXudL/wN/8AnIsH+d/uJPKf8FP/AJxfUf5n+7i/XrPcH59dirGPO3/KGebv+2Lf/wDUPJmH21/xn5v6kvuLndh/8aWD+vH7w/C7PnZ+n3Yq7FXYq7FXYq/Sf/nCaKQeR/N8xRhFJrior0+EsltEWAPiA4r889W/4D0T+QzHpx/oD41/wcJx/lPAL34P98X2jnfvm7sVdirsVfIv/OaP/kq9E/8AAotP+oPUM4f/AILv/GNj/wCGD/cyfQP+An/xu5P+FH/dQfmDnkT7a7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdiqtbXE9ncQXdrK0FzayLNDKhoySIQysp7EEVGGE5QkJRNEbhjkxxyQMZCwdiH7L/AJLfmhYfmp5KstZSSNNcsVS11m1UgNFdKu7hdiElpyQ9Oq1qpz3j2Q9pMfbPZ8cl+sbTHdLv9x6fsfnT229lsvYXaUsRHoO8D3x7veOR+fV6y6JKjxSoskcilXRgCrKRQgg7EEZu5REhRdBGRibD4k/NH/nD7TdaurnWvy41GDQLm4YySaReBvqRY1JMEqB2jBP7JVl32KjbPPvaT/gU4s8zk0UhEn+E/T8D09z6X7K/8GTNpsYxa+JmBymPq/zh19/3vmi4/wCcWfzxhlaOPyfHdovSWLUtPCt8hJdRt94zk5/8DX2iiaGG/wDOj+mT2mP/AIK3sxKNnPXkYz/REvSvI/8Azhr5w1K6in896nbeW9MRgZLazkW6vZAOqqy1hSv83JqfynNr2N/wJtfmmDqpCEe4eqX6h9vudN27/wAGjs7DjI0cDOXQn0xH6T9nvfoJ5Q8n+XvIuhWnlzyxpyabpdpUhV+J5JGpyllc7u7U3J9h0AGem9ldk6Xs3TDDgjUR9p7z5vkvbHbOr7U1Us+olxSP2DuA6BOtQ1Cy0qxvNT1K5jstP0+F7i5uJTxSKKNSzux8ABXMjUZ8eDFLJM1ECyT0AcbT6fLnyxx4xcpGgB1JfjR+c35kT/mj581PzHR4tKiAs9KgcmsVnCTwJHZnYl2HYtTtng3tb7QS7Y7Snm/h5RHdEfr5v0Z7F+zUew+y4YP4ucj3yP6uTyrNO712Ksn8k/8AKZ+Uf+21Yf8AURHmV2T/AI9i/rR+8OF23/xnZ/6kvuL90c+i35ffiN+a/wD5NL8yv/Aq1n/qOnz589p/+NjU/wDDJ/7ov0x7Jf8AGHpP+FQ/3IYBmtdq/Xr/AJxe/wDJF+Rv+3n/AN1O9z3D/gb/APOO4P8AO/3cn59/4Kf/ADlGo/zP9xF79nSvKPwHz5qfq179/wA4vf8Ak9PI3/bz/wC6Ze50v/A3/wCciwf53+4k8p/wU/8AnF9R/mf7uL9es9wfn12KsY87f8oZ5u/7Yt//ANQ8mYfbX/Gfm/qS+4ud2H/xpYP68fvD8Ls+dn6fdirsVdirsVdir9V/+cQtJl038noLuROA13WL6/jP8yr6drX77U57L/wKtLLF2GJH+Kcj90f96+Ff8GLVxze0JiP4IRj98v8AfPqHOweHdirsVaZlVSzEKqipJ2AA7nEkAKASX5y/85c/m3oPmgaR5B8tX0OrW+j3p1HU7uAh4RcpG8MMMcgqGKrK5em1SB1Bp5V/wUvanTazg0mCQkInikRyuqAB+Jt9i/4EHshqtDx63URMTIcMQefDYJJHwFPiLPP30t2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVVgOa12rsVdirsVdirsVdirsVdirP/y4/MfzH+WHmO38w+XrjwjvLOQn0LyCtWilUf8ACt1U7jNl2B2/quyNUM2E+8dJDuLqvaX2a0fbejODOPcesT3h+sX5YfnJ5M/NTT0n0O+FrrEUYa80e6ZVu4G/aIWv7xK9HXbx4nbPafZz2t0HbOK8Uqn1ifqH6x5vgvtT7F9pdhZqzRuHSY+k/qPkXq+bp0LsVdiqReYvM3l/ylpk2seZdXttG02AEtNcuEBIFeKL9pmNNlUEnsMxu0O0tLocJyZ5iMR1P43crs3svV6/MMWngZSPQfp7n5kfn3/zkXffmYZPLHltJNM8kwTB3Lgrc6i8Z+F5t/hjHVU8d2qaBfI/bb2+ydr3gwjhxA/GXv8ALy+b7X7Af8DfF2LWoznizEfCHu8/P5eflvOPe4dirsVTry3fwaV5i0DVLrl9V03UbW6m4CrenDMjtQbVNFy/QZo4dTjnLkJAn4Fx+0sEs+kyY485RIHxFP1u/wChkfySMPr/AOPbbhWlPq15z6V+x9X5fhntn/JwvZ7hv8wPlL9T4D/ybT2m4q/LH5x++35Ree9Ys/MPnjzlr+nFzp+ua7qOoWpkXi5hubmWWPku9DxcVGeMdtavHqu0M2aH0ynKQ9xJIfeOwNHk0nZmDDP6oQjE13xiAWKZhuc9c8mfnp+Z/kDRl8v+WPMQs9HjleaO2ltba4EbyGr8GmidgCd6VpXelSa7vsj2z7X7MweDgyVG7qgefvBdB217B9idranx9RiudVYMhdcuRDI77/nJ/wDOrULK6sZvNqRw3kTwyNDYWccnBwVbi6wAqaHqKEdQQcys3/BG9oMuMwObYitox/U4eD/gW+zWLJGYwbg3vKRHyt4BnNPVvfv+cXv/ACenkb/t5/8AdMvc6X/gb/8AORYP87/cSeU/4Kf/ADi+o/zP93F+vWe4Pz67FWMedv8AlDPN3/bFv/8AqHkzD7a/4z839SX3Fzuw/wDjSwf14/eH4XZ87P0+7FXYq7FXYquRHldI41LySMFVVFSSTQADEAk0FlIRFl+4X5deWB5M8i+VPLBXhNo+mwQ3ABDA3BUNOQRUbysxz6F9n+zvyHZuHB1jEA+/r9r8ye0nan8pdqZtR0lIke7+H7GaZsHWpL5g8xaH5V0q51vzHqlvo+lWgrJcXL8VqeiqOrMeygEnsMx9f2hptFhOXNMRiOpcns7s3Va/OMOCBlI8gHxj54/5zS0y1aaz/L7y42qyI3FdR1flDbmndLaNhIwPbk6H2zgu2f8AgvYoEx0eLi/pS2H+lG/2h9H7C/4CefIBLW5eH+jDc/6Y7fYXx550/OL8yPP5lTzJ5pu5rGQ/8c+3b6tZgCtKwRcFalerVPvnC9r+1favad+PlJH80bR+QfQ+xPY3sbsoA4MIEv5x9Uv9MXmWal3TsVdirsVdirsVdirsVdirPv8Axls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVRFpd3dhcw3ljdS2V5bOJIZ4HaOSNx0ZHUggjxByWLLPHMSiSCORHNjlw48sDCYBB5g7gvo/yt/zlh+bflyJLa9vrLzXbRrwUavAWmArWvrQPA7H3ctnVdmf8E7tvSR4ZSEx/SG/zFH5vHdq/wDAk7A1kuKEZYz/AEDt8iCPlT0dP+c3PM4iIk8jaW89DR1uZlSvb4SrH/hs2o/4MOtrfBG/eXTS/wCAdoeLbUSr3Bieuf8AOY/5p6lGYtJtNG8ug9Jbe2e4mH03Mksf/CZha3/gsds5RWMQh5gWf9kSPsc/Qf8AAZ7Cwm8kpz8iaH+xAP2vm/zJ5t8zecL86n5o1y81y93CyXcpcICa8Y1+yi+ygDOU7Q7T1euyceeZkfM/c9l2Z2RouzsXh6fGIDyH397HcxnLdirsVdirsVdirsVdirsVdirsVe/f84vf+T08jf8Abz/7pl7nS/8AA3/5yLB/nf7iTyn/AAU/+cX1H+Z/u4v16z3B+fXYqxjzt/yhnm7/ALYt/wD9Q8mYfbX/ABn5v6kvuLndh/8AGlg/rx+8Pwuz52fp92KuxV2KuxV9Df8AOM35fyeePzO0u6uIPU0TykyavfMwqjPE3+jRGoIPOUAkHqqtnT/8DzsI9o9rwJHox+o/D6R8T9lvJf8ABP8AaEdl9iTjE+vJ6I/H6j8B9pD9cs9ufn9C317aaZZXmpX9wlpY6fBJc3M8hokcMSl3dj4BQSchnzQw45TmaABJPcBzbMGDJnyxxwFykQAO8nYB+Ov51fm7q/5seaJ72SWW38tadI8Wj6eSQscIJHrSLUgyyDdj22UbDPCva72pz9tawyJrGNox7h3nzL9D+xPsfp+wdCIAA5Jbzl3nuHkOnzeN5ononYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVfqn+Xn5Ifkj5y8jeVPM7eRLf1ta0y3uLgLdXqgXBQCcAfWugkDAZ7H2B7G+z2v7Ow5/AFyiCd5c+v8Xe+F+0ftz7TdndqZtP+ZNRkQNo8un8PczL/oWr8kf+pDg/6S77/spzP/5N57Pf8o4/00v1uu/5Ob7Tf8pJ/wBLH/iXzZ/zkl/zjvoHlzy1becfy60Q6dbaMWXWbOKSaYG3cjjcr6ryMPTOz704kHbic5P/AIIPsHptJpBqdHChH6xZO387e+XV7L/gaf8ABG1es1p0uuycRl9BIA3/AJu1c+j4Nzzl9TdirsVdir37/nF7/wAnp5G/7ef/AHTL3Ol/4G//ADkWD/O/3EnlP+Cn/wA4vqP8z/dxfr1nuD8+uxVi/nhlXyV5vZiFVdE1AknYAC2kqScwu2jXZ2b+pL7i53YQJ7Swf14/7oPwvz53fp92KuxV2KqsEE91PDbW0L3FzcOsUUUalnd3IVVVRUkkmgAwwhKcgALJRkyRhEykaA3JfsL+Qf5Wr+VvkW2sLyNf8Sa0VvtYdd+MzLRIA3cRKabbcuRHXPc/Yf2a/kfs4Rl/eS3l7+g+H6355/4IHtUe3O1DOB/dx9MPd1l/nfdT27OheZfLf/OXPmqXy/8AlW2k2sxjuvNuoQ6ewWob6tGGnmIPgTGqn2b55x3/AAU+0zpuxvDid8khH4Dc/cHuf+A/2THV9u+LIbY4mX+cfSPvJ+D8q88bfdHYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Kv2a/ITSLvRPye8g2F6vC4Omi7KnqEvJJLmMH3CTCoz3n2H0s9P2Fp4S58N/6YmQ+9+cv+CBrMep9odTOHLir/AEoET9z17N48+pTwQ3MM1tcwpcW9wjRSxSqHR0cEMrKQQQQaEHIzhGcTGQsHmGWPJKEhKJojcEPyi/5yF/Iq8/LLWJNd0K3kuPI2rTEwSKC31CZyT9WlNSeP8jHqNuo38X9u/YvJ2RnOXELwyO39E/zT+h94/wCB17eY+29OMOY1niN/6Y/nD9IfNOco9m7FXYqnXlzzBqnlTXdK8x6LP9W1XR7hLm2kIDKHTsynYqRUEdwcv0GuzaPUQzYjUomw43aXZ+DXaWeDKLjIUX2Fa/8AObfmpIVW98kaTcT93guJ4UOw6I3rHr/lZ3OP/gw64R9WCJPkSP1vnuX/AIB2gMvRqJgeYB/UiP8Aod7X/wDqQtP/AOk2X/qlkv8Ak8Wq/wBQj8yw/wCTG6T/AJSZf6UfrYR57/5y186+cvL2qeW7TRNO8vWeswNa3U8LSzXBgkXjJGjsVUcgSCeNaHbxzX9tf8FDtDX6WeGMIwEhRIsmuodn2D/wIuzOztXDPLJKZibANAWOR+D5SzjXu3Yq7FXYq/Qz/nF/8gptLez/ADL862JivivqaFp06/FCHG15MhGzkH92D0+39rjT07/gcew8sRjrdTHf+CJ6f0j+j59z5H/wU/8AggxziWg0kvTyySHX+gD3d/y733Zno75c7FXxX/zmxpl3P5N8oarFHytNO1aWCdh1VrmEmM08P3JFflnn/wDwYNPOWhw5ByEiD8Rt9z6T/wABDVY49o58ZO8oAj/NO/3vzbzyp9kdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV6D+Vfkqb8wvP3lryqisbe/u1e9ZSAUs4f3lw1SQAfTUge9Bmy9m+yJdp9pYtOORO/9Uby+x1PtX23HsjsrLqTzA9P9Y7R+1+2kUUUEUcMMawwwqEjjQBVVVFAqgUAAA2GfQUYxjEACgH5pnOUpEk2SvwodiqX6rpWm65pt7o+sWUWo6ZqMTQXNtOvKOSNuoI/Ue3UZVqtLi1OKWPJEGJFEFu0mrzaXNHLikYyibBHR+ZP53f84x615Fe88yeTIptd8n1aWWBQZLzTl6kSDcyRAdHG4/bH7R8j9sf+B1qOzSc2mBli7v4oe/vHn832r2G/4KGm7UEcGqIhm5A8oz93cfL5dz5Nzi3vXYq7FXYq7FXYq7FXYqibOzu9QurexsLWW9vbuRYoLeBGklkdjRVRFBJJPQAZLFinlmIwBJPIDmwzZseGBnMgAbknYB+hf5D/APOLQ0aWw85fmVBHPqkRW4sNCNHjt2G6yXZ3VnB3CDZf2iT8K+n+xX/A28CUdTrR6ucYd3nLz8nyT2+/4Kv5iMtLoDUeUp9T5R8vN9yZ6I+YOxV2KvP/AM0/JifmB5A8zeVOKfWdStC1mz0ol3CRLbmppQeogBPgTmr9puyB2n2Zl0/Ujb+sNx9rtvZTts9k9rYdT0id/wCqdpfYX4mTQy280tvPG0M8DtHJG4oyOpoykHoQRnz/ACiYyII3D9LQnGcRIGwVLAl2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/RD/AJwv8iC10rzB+Yd7bkXGpv8AorTXYdLeEh7l19nkCrX/ACDnqH/Ai7F4MWTWSG59MfcPq+37nyL/AINnb3HnxaGB2j65e87R+Q+990Z6K+XuxV2KuxV2Kvmb8z/+cXfIvn6S41XR/wDnTvMc5Lvc2cYe1nc1JM1tyQVJP2kKnueWcj7R/wDA27O7SJyYv3cz1A9J98f1Pa+y3/BU7U7KAx5f3uMdCfUPdL9dvhPzx/zjp+ankYzT3GgPr2lRFiL/AEet1HwWnxPGoEqCh3LIB77Z5z2z7Bds9nWZY+KP86PqHy5j5PqPYX/BI7C7UoRy8Ev5s/SfgeR+bw50eJ2jkRo5EJVlYEEEdQQc54gg0Xp4yEhYW4q7FXYqjbDTtQ1W5jstLsLjUryY0jgtYnmlYnsqIGJ+7J4cGXNMRhEk9wFlr1Gpw4IGeSQiB1JofMvpjyH/AM4mfmR5peC68xRx+SdIejFr2kt4y1oeFqjVU+0jJnW9if8AAw7W1hEsw8OPn9X+l/XTxfb/APwXOxtCDHATln/R2j/pj+i33v8Alp+SfkT8rYFfQdO+ta00fCfV72kt29R8QQ0Cxqf5UA969c9J9nfY7s3seN4o3PrI7y/Z8Hyr2n9uO1O3JVmnUOkI7R/b8Xrmbx592KuxV2KuxV+UH/OVXkEeTvzLuNWs4fT0jzpG2pxcR8K3XLjdoNhvzIf/AGeeLf8ABL7DGg7WOSI9OT1D3/xD57/F95/4FHtB/KPYoxTPrxek/wBX+E/Lb4PmbOTe0dirsVdirsVdirsVdirsVdirsVZ9/wCMtmy/6puq/wCqrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq/YH/nGm+0+9/JbyWthKj/Uori2uEXrHcLcytIrDsTzDfIg989x/4HebFk7Aw8B5WD77L89/8E7Blx+0mo4xzII8xwinu+dI8s7FXYq7FXYq7FXYqxTzB5F8meauR8yeVdK1uR1C+teWkUswA6cZWXmPoOYWu7E7P1v99ijI95Av583P7P7e7S0H9xmnAdwJA+XJ5VqP/OL35J6h8Q8oNYSFql7S+vI9t9uBnZKb/wAuaXUf8Df2fy/5GvdKX66d7pv+Cn7S4f8AL2POMf1Wki/84j/k0skjnTtTdXpSNr+TilP5aAH7ycxx/wACzsIG+GX+mco/8F/2iIA4o/6UMr0z/nG/8ldKMbweRba5kjpVr2e5uwxAAqyTzum9OnGntmbp/wDgfez+GqwA+8k/eacDVf8ABL9pc9g6gj+qIx+4AvW9I0HQ9Aga10HRrHRLViCYbC3itoyR0JWJVGbvS6HTaWPDihGI7ogD7nn9Zr9Vq58WbJKZ75EyP2prl7Q7FXYq7FXYq7FXYq+Ff+c3b7Tv0P5E01nRtXN5d3KICC6WwjRHJFagM5WnjxPhnnP/AAYs2LwdPD+Kyfhs+o/8A3Bm/ManJ/BUR8bJ+7735455g+uOxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV7X+S350a1+UeuGWMPqPljUnUappnL7QG3rQ12WVR07MPhPYjf+yPtbqOxNTY3xn6o/pHm837bexWm9oNLR9OSP0y/QfJ+t/ljzPofnHQ7DzF5dv49R0rUY+cUqdQf2kdeqsp2ZTuDntvZvaWn1+njmwyuJfAe1Oy9T2dqZYM8eGUeY/SPJPsyXES3V9Z0jQLGbU9c1O10jToBWS5vJUhiXYmhZyBXbplOq1mDTYzPLIRiOpNBu0ei1GryjHhgZSPQCz9j5Z86f85hfl9oLy2nlaxu/Od5HUCaP/Q7KtP8AfsqmQ0PhHTwOcd2v/wAFfszTExwROQ9/0x+Z3+x7nsT/AIDfa2qAlqJDEO76pfIbfa8dt/8AnNzzOtyrXfkbS57MNVoobmaKUrXoJGWUA078PozRY/8AgxawT9WCJHkSD89/ueiyf8A3QmFR1Ege8gEfLb73vfkL/nK/8tvN88GnawZ/JeqTkKg1Eq9mzkgBVukoB16yKg986TsT/gn9la6QhlvHI/zvp/0366eV7f8A+BJ2z2fAzxVliP5v1f6X9Vvp1HSVElidZI5FDI6kFWUioII2IIzr4yEhYeJlExNFdhQ7FXYq7FXYqlmsa1pHl7TrjVtc1K20nTLReU1zdyLFGvgCzECp6AdT2ynV6zBpcRyZZCMRzJNN+i0Oo1eYYsMDKR5ACy+R/OH/ADmb5M0qWa18oaFeea5E5KLud/qFqT2ZOaSSsPYoucR2r/wXNBhkY6bGZ+Z9I+4n7A9/2N/wFe0s8RLVZBj8h65feB9peZ2n/ObnmRbpGvvI2mzWPL4o4LqaKXjXtIyyLWn+Tmoxf8GLWCfrwRI8iQfnu7rN/wAA3RHH6NRIS8wCPlt976K8j/8AOUf5WecTDa3mpP5R1WUhRb6wBHCzGteF0paKm37ZQmuwzquxv+CT2NrqjKXhy7pcv9Ny+dPIdu/8Cvt3s65Qh4ke+G5/0vP5W+iYZoriKKeCVJ4J0WSOSNgyOjCqsrCoIINQRnUwnGUQQbBePnCUJGMhRHMKmFDy781vzW8u/lR5dfV9XcXOo3IaPTdNjYCa7mA6DrxRajm9KAeJIB0/tP7T6XsXS+Jk3kfpj1kf1d5d57JeyWs7e1nhYtoj6pdIj9fcH5DeePO/mD8wvMd75m8yXX1i/uzxRF+GKCFSeEMK1PFFrt3PU1JJzw/tjtjU9p6qWfMbkfkB3DyfoHsLsPSdkaOOnwRqI+ZPUnzYjmE7B2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV6z+V35zecvymvJ5fL88V3pd8eV3pd6Ge1lYCgkAVlZHA/aUiu3Ko2zc+zftZr+xchOEgxPOJ5Hz97ofar2L7O7exgZwRIcpR+oeXmHuOuf85pee720a30Py3pOh3EgINzIZbt0r0MasY0BH+UrD2zotZ/wXe0skKxY4xPfvL5dHmND/wABPsrFk4s2Wcx3bR+fM/c+W/NHnPzX51vjqXmvX7zXLsV4G5kLJGCalYoxREWp6KoGcf2j2trNfk48+QyPmeXuHR7jsrsXQdm4vD02IQHkOfvPM/FjOYjmuxV2KvtL/nFj87dT0nXtP/LXzJfNd+X9af0NIlnYs9ldt/dwKxqfTlPwhezkUoC2d7/wNfbHNg1MdFmlcJbRv+GXQe4/f8Xzf/grew2DUaWWvwRrJHeYH8Uep947+74P0mz1h8adirsVdiqGvb2106zu9Qvp1trKwhkuLiZ9ljiiUu7t7BQSchmzQxY5TmaAFk+QZ4MGTNkjCAuRIAHeTyfjl+cv5v65+a/mW5u57iW38tWMrppGm1pHFCDQSyKDQyuN2JrT7I+EDPCfa32q1HbWrMiaxg+mPcO/3l+ifYv2O0vYOiEYgHIR65dSe4eQ6PHc0b0LsVdir0nyN+bn5g/l3Kp8r+Y7i2sgSW0+c+vZPXrWCTkoJ/mWje+bXsb2o7T7LP7jIQP5p3j8i6ft32Q7J7Yj/hGIE/zhtL/TB9Gr/wA5techZGN/JuitqPGgnWS4EAbxMJctT29T6c6kf8GDtDw68GHF3718r/S8cf8AgH9m+JYzz4e6hfzr9D5T85edfMnn7XLjzD5p1J9R1GcBFqAscMYJKxRRjZUFeg+ZqSTnG9rdr6vtLUHNnlcj9g7gHu+xexNH2VpRg08OGI+ZPeT1LFcw3OdirsVdirsVdirsVdirsVdirsVdirPv/GWzZf8AVN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdiqrBPNazw3NvI0M9u6yxyKaMroQVYHxBGGE5QkCOYRkhGcTGQsHYv2x/KvzrF+YXkHy35qVk+s6hahL1EI/d3cJMU60FKfGpIFPskZ9AezPbA7U7MxZ+pG/8AWGxfmr2s7Dl2R2tl03QH0/1TvH7HoWbR1DsVdir5N/5y889ny3+X1v5Ws5vT1LzrOYJAKVWwt+L3B61HJmROm4LZxX/BU7a/K9mDBE+rIa/zRz/R9r3v/Ae7B/OdrHUSHpxC/wDPO0f0n5Py5zx99wdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/AKpuq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdir7w/5wu89pBeeYvy8vp+Ivqavpas2xljUJdRqD3KBGAHZWOejf8AAi7aEcmTRyPP1R94+ofL7ny3/g2dgmePFroDl6Je47xPzsfEP0Iz098kdirsVfkH/wA5KeeR53/NTWmtpxPpPlumjWJQhkItmb1nUrsQ0zOQd6rTelM8O/4IPbP8o9szMTcYegfDn9tv0H/wM+wv5M7CxiQqc/XL/O5D/S08Dzm3qnYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdiqbaFrmq+WtY07XtEvH0/VdKmW4tp4+qOvsaggjYg7EbHbLtHrM2kzxy4pVKJsFo1+hwa3Tyw5o3GQoh9y6F/zm5wsoY/MvkUz6gi0luNOuxHFIfEQyxsV+XM56Hov+DERjAz4Ll3xND5EfpfMNf/wDbyE6fU1HoJRsj4g/oT3/AKHd8t/9SJqX/SXD/wA0Zk/8ni0v/KPL5j9Tjf8AJjdZ/wApMf8ASn9bzn8wP+cxtd8waPc6P5O8vf4Wa9jeGbUZrn6xcrG44n0FWKNY2pX4qsR2oRXNV27/AMFjU6rAcemx8F7GRNmvLYU7f2e/4DOl0moGXVZfErcRAqN+e5v3bPi3rudyc4J9IdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/ABls2X/VN1X/AFVYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff8AjLZsv+qbqv8AqqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/wDGWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/wCMtmy/6puq/wCqrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq+vf+hLPzS/6v8A5V/6Sr7/ALx2dx/yaHtj/VMfzl/xL59/ye3sP/Usvyj/AMW7/oSz80v+r/5V/wCkq+/7x2P/ACaHtj/VMfzl/wASv/J7ew/9Sy/KP/FqNx/zhj+a0MLyx6t5Zu3WlIoru6DtUgbGSxjXatd2GQyf8CTtqMbE8Z8gT+mIZ4/+DV2DKVGGQeZjH9EiwnWf+cX/AM6NHief/Cq6pDGSCdPuoJ3pWgIi9RZDX2XNfq/+Bz2/gjfg8Q/okH7Lt2Wi/wCCl7N6iXD43Cf6QI+2qeIaro+raFeSadrel3ekahD9u2vYXglX5pIqn8M5/U6XNp8hhliYyHQij9r02k1mn1WMTxTEonrEgj5hLcqbnYq7FXYq7FV8UUk0kcMSGSWVgiIoqWZjQADxJOMYmRoIlIRBJ5PraH/nC/8ANWWGKR9Z8sW7yIrNFJd3ZdCRUqxSwdajoaEjwJztof8AAj7ZMQTPGPK5f8S8DP8A4NfYUZEDHlPnUf0zeI/mf+VPmf8AKbV7HR/Msllcyala/W7e50+SSS3dQ7Iy8pYoW5KRuOPceOc/7R+zOr7Fzxx56NiwY2R9oD0vst7WaLt/Tyy6cEcJoiVA9/Ql5pmpd07FXYq7FVe2trm9uIbSzt5bu6uHCRQwoZJHY9FVVBJJ8Bhx45TkIxFk9AxyZYY4GUiABzJ5Ppryl/ziT+afmOCO71SOx8o2sihlXUpGa5IPT9xCshU+IcqfbOu7L/4F/bOqjxTAxj+kd/kL+2niu1/+C92Fo5GOMyyH+iPT8zX2W9TX/nB27NsXf8yoVvOBPpLpLGLnvQeob4Gh7nh9BzcD/gN5OCzqRfdwbfPi/Q6M/wDB1x8dDSGu/j3+XD+l515n/wCcPvzP0SCS60a40zzXFGGYw2krQXPFamojnVENR2Dk12pmr7R/4FXbGnjxYzGfkDR+Rr73b9l/8GTsTUzEcoljPeRcfnG/ufMGqaTqeh39zpesWFxpmpWbmOe2uY2ilRh2ZWAOchqdNl0+Q48kTGQ5g7F7fS6vBqcQyYpCUTyINhL8rbXYq9H/ACw/LDX/AM2NfvPLvl280+yvbLT5NSd9SkljiMUcsMJVTDDO3LlOtBxpSu+bX2c9nNT21qThwmIIjxeqwKBA6A97p/an2p0nYOkjnzxkYmQj6QCbIJ6mP817t/0JZ+aX/V/8q/8ASVff947Oj/5ND2x/qmP5y/4l5b/k9vYf+pZflH/i3zj598lar+XfmzVfJ2tXFpdano/oetLZO7wN9YgiuF4NJHExosoBqo3r885XtvsjN2XrZ6bKQZRq6utwD1A73sewO28Ha+ghqsQIjK6EqvYmPQnuYhmC7B2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq/fjPpV+UnYq7FXYqxbzb5K8reetMfSPNeiW2s2RB4esv7yEtSrQyrR422G6kHt0zD7U7H0XaOHw9RASHnzHuPMOd2R25ruy8/i6bIYny5H3jkfi/Mb89P+cd9W/K2SXX9Fkl1nyRPKFFwwBuLFpGokdzxABBJAWQAAnYgGlfIvbP2Dz9jk5cfqxE8+sfKX632z2D/wCCNp+3AMOUCOYDl0l5x/U+ac5N7N2KuxV2KvpP/nFnyF/jL8zbPU7uH1NI8mIuq3BYHi1wrUtI/skV9T46GlQhzq/+Bt2J+f7XjOQ9OP1H3/wj57/B43/gq+0H8ndiSxxPry+ge7+I/Lb4v1lz2p8EfMX/ADld5DPm78tJtbtITLqvkmRtSj4gljaMAt2oAB2CqshPgmch/wAE7sT872ScsR6sfq/zf4v1/B7b/gS9v/yf20MMj6cvp/zv4f1fF+UmeMvu7sVdiqpFFLPLFBBG000zrHHGgLMzMaKqgbkknbDGJkQBzROcYRJJoB+s/wCQn5EaV+WGj2usavaxXvnvUIed1dMA/wBSWQb21uSPhoDR2G7GorxpntPsR7FYeyMAy5ADmI3P83+iP0vgn/BA9vc/beoOLESMETsP51fxS/R+t9G51bxzGLvzt5MsLuSwvvN2i2V9ExR7ae/t45VYGhUo0gYGo6UzDy9s9n45mE80Ae4yAPytzsPYXaWXGJwwTMe8RJHzpkkciSoksTrJHIoZHUgqykVBBGxBGZcZCQsOFKJiaPN5H+b/AOTvl382dCktb6GOz8xWkTfovVlUerA+5EchAq0RJ+Jfeooc0ftX7J6XtrTkSFZAPTLqPI+T0Hsd7Z6zsDVCUDeMn1Q6HzH9J+PeuaLqXlzWNT0HV7drTU9IuZLW5ib9mSNipoe4NKg9xvnhus0mXS55YsgqUTRHufoXQ63DrNPDNiNxkAQfIpVlLe+vf+cLP/Jpa/8A+Ardf9R2nZ3H/Ah/42Mn/Cz/ALqL59/wbf8AjDxf8NH+5m/TvPXXxN+Qv/OUP/k9PPP/AG7P+6ZZZ4f/AMEj/nIs/wDm/wC4i/QX/As/5xfT/wCf/u5PAc5p6t2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq/fjPpV+UnyP/AM5nTTQflfoLwSvC5802oLIxU0+pahtUU8M4j/guSMex8dH/ACg/3Mn0D/gKQjLtzJY/yR/3UH5owazq9rIs1tqt5byrQh4p5EYUIIoQwPUZ5LDU5oGxIj4vtGTR4JipQBHmA9o8k/8AOSX5reTJ4VbzBL5l0tCoksdZZroMi7USdj6ybdKNTxBzf9j/APBA7Z0Eh+8M490/V9vMPNduf8DTsLtKJ/dCEv50PT9nI/J+lv5Vfmz5b/NnQjquilrS/syseo6bMwM1rIwqNwBzQ0PFwN/AEED1n2Z9qNJ23pvExbSH1RPMfs83xj2s9kdZ2BqvDy7xP0yHKQ/QfJ6HqemafrWnXuk6raR32m6jC9vc28oqkkcgoyn6Dm01OmxajFLHkFxIog9zqNLqsumzRy45VKJsEdC/Gn85fy3uPyu896n5cJeXS5KXmlTuDWWzlJ4VJAqyEFG91zwf2s9n59j9ozw/w84nvieXy5P0Z7F+0sO3Oy4Z/wCLlId0hz+fN5Xmnd47FXYq/Wz/AJxf8hf4K/LDT727g9LWfN7DVrrktHWF1paxnc7CKjdBQuRntf8AwN+xPyHZEZyHqyeo+7+EfLf4vgf/AAU/aD+Uu25QifRj9A9/8R+e3wfRLSIhjV3VWlbigJALMAWoPE0Un6M6kyAq3jxEkGuindW1ve21xZ3cS3FrdxPDNE4qrxyKVZSPAg0wZcUckDGQsEUQyxZZ4picTRBsHzD8SfzM8mT/AJf+evMnlSYN6Wl3bi0d+slpJ+8t5Op3MbLX3qM+ffaHsmXZnaOXTn+E7ececT8n6W9mO2odrdl4tSOchv5SG0h82CZrnaOxV9Gf84seVI/M/wCbukT3MPrWnle3l1qQE0AkgKR25+YmlRgPb551P/A27MGs7cgZCxAGfy5faQ8f/wAFbtY6H2fmImjkIh8DvL/Ygv1sz2x8CfBf/OWv5yazpN/B+Wvli+m0zlarc63dW7mOWRLhSI7UMKEKU+J6H4uQHQGvm3/BR9rM+HKNFgkY7XMjmb5R+XN9U/4EXsZp8+I6/UREt6gDuBXOXz5dz8++u53JzzN9ZfVn/OL/AObut+V/OmkeSdQvZrzyr5ouFso7aRi4tLyX4YJIORHEM5CuBsQa0qBnZf8AA49qdRo+0IaacicczVd0jyI+PN4T/gpex+m13Zs9XCIGXGOK/wCdEfUD8Nw/UzPY3w1+ZX/OZvlmLTPP+ieZIImjHmjTOM7UPF7ixYREg0pURPECPYeOeR/8Fvs6OHtOGYD647++O33U+1f8BXtOWfsnJgJ/u5be6W/32+PM4Z9DfXv/ADhZ/wCTS1//AMBW6/6jtOzuP+BD/wAbGT/hZ/3UXz7/AINv/GHi/wCGj/czfp3nrr4m/IX/AJyh/wDJ6eef+3Z/3TLLPD/+CR/zkWf/ADf9xF+gv+BZ/wA4vp/8/wD3cngOc09W7FXYq7FXYq7FXYq7FXYq7FXYqz7/AMZbNl/1TdV/1VYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FX78Z9Kvyk+Qv+c0//ACVugf8AgVWv/UDqOcP/AMF7/jHx/wDDB/uZPoP/AAEv+NzL/wAKP+6g/MTPIn2x2KvVfyZ/MK7/AC18/wCia8lw8elTTJZ6vEp+GWxmZRLUEgEps67j4lHbNx7Jduz7J7ThmB9N1Lzief63Re2vs7j7Z7JyYSPUBcD3SHL58n7RKysoZSGVhUEbgg9CDnvoIIfm8ggvjT/nM/yrBf8AknQfNsaKL7y9qItJGCirW16pqC3X4ZIkoP8AKOcF/wAF3syOTQY9QOcZV8JftD6P/wABTtaWLtLLpj9M43/nR/YS/NPPJ32Z2KvTvyd8iv8AmL+Ynlzy0yM2nyzi51Jl242Vv+8m3o1CwHAbfaYZtvZTsU9qdqY8HQm5f1RuXS+2Xbw7H7Iy6j+ICo/1jsP1v2njjSJEiiRY441CoigBVUCgAA2AAz36MREUH5tlIyNnm+Ff+cj/AM5bnyr+a35fadpUzmHyNPHq2qRRsV9Z7scDA1D1+qswHtLnnP8AwQPayej7a08MZ/ujxSHfxdP9L976j/wNfYuGu7B1WTIN8o4Ik9OHe/8AT/7l9yWd5bahZ2t/ZTLcWd9ClxBKv2XilUOjCtNiCDnomHLDLjE4mwRYPkXzDNhnhyShMUQaI8w+Fv8AnNHyH6tr5e/MSyg+O1b9Eaoygf3bkyWshoAdm5qSSeqjPOv+C72LccesiOXpl98T9/2PqH/AT7f4Z5dDM8/XH38pD7j835855k+tOxVnPkT8xvNn5baheap5Qv49Ovr+3+qzSSW8NxWLmr8QJkcD4lB28M2HYvb2t7KynJp5USKOwO3PqC6zt72b0HbOGOPVR4og2BZG/LoQ9R/6Gr/O7/qaLf8A7h1l/wBUM3H/ACcv2h/1Uf6WP6nR/wDJp/Zn/UT/AKaX63jPm3zZrvnjX77zP5kuxfazqIiE8yxpEpEMSQpRI1VRRYx0Hv1zQ9qdp6ntDUyz5jcjVnlyFch7no+yOyNL2ZpI6fTxqEboWTzJJ3PvY3mK5j1v8idDu/MH5veQLW0Qu1lrFvqcpFAFi09xdOSTtSkVPpoN83XsXo56ntzTxj0mJfCPqP3Og9vddj0ns/qZSPOBiPfMcI+9+zue9vzi/Ov/AJze1ZJvMHkLQxx9TTtPvL4+NL2WKIV36f6GabZ5b/wYtVxarT4u6Jl/piB/vX1//gG6Qx0mpzfzpRj/AKUE/wC/fDeeePpz69/5ws/8mlr/AP4Ct1/1Hadncf8AAh/42Mn/AAs/7qL59/wbf+MPF/w0f7mb9O89dfE35C/85Q/+T088/wDbs/7pllnh/wDwSP8AnIs/+b/uIv0F/wACz/nF9P8A5/8Au5PAc5p6t2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2Kv34z6VflJ8hf85p/+St0D/wKrX/qB1HOH/4L3/GPj/4YP9zJ9B/4CX/G5l/4Uf8AdQfmJnkT7Y7FXYq/cL8tbqW+/LnyBfTEtNeeW9KnkJNSWks4WO/zOfQvs7kOTsrTyPM44H/Yh+ZfafFHF2xqYDkMkx8pFg3/ADkhbrc/kn59jfotrbS7iu8V5byDw7rmt/4IMBL2f1A8h9kgXaf8DTIYe0umI7yPnEh+O2eGP0M7FX6Sf84a+QTpXlnWPP19BxvPMsn1LTywIIsrZv3jDelJJhTp/useOerf8CXsPwdJPVyG89o/1Rz+Z+58b/4NPtB4+tx6KB2h6pf1pcvkPvfY2qalaaPpmo6vfyejY6VazXlzJ14QwI0jt9Cqc7rU6iGnwyyTO0QSfcNy+d6XTZNTnhigLlIgD3k0H4d+cvM975z81a/5q1Da61y9luim9I0dv3ca1JNEQBRv0GfPPa3aOTX6zJnnzkSf2fB+nOxey8fZuhxaaHKEQPf3n4l+mv8Azif53/xV+WFvo1zMH1PyXN+jXU15G1YepaOa7U4loxT+TPXP+Bh2x+c7IGKR9WM8P+bzj+r4Pin/AAW+w/yPbZyxHpyji/zuUv1/F7h578qWnnnyf5h8p3tFh1uzeBXbpHMKPDJt/JIqt9GdD232XDtHQZNPLlIV8eh+BeZ7A7Wydl9o4tTDnA37x1HxD8QdS0680jUb/SdQga2v9MuJbS5hcENHNC5R1INDUMpGfPeowTwZZY5iiCQR5h+mdNqceowxyQNxkAQe8HcILINjsVdirsVdir9QP+cWPycn8kaHJ518w27QeZvM9uEgtpFKvZ2BYOFcEVDylQzDsAo68hnr3/A09k5dn6c6rMKyTGw/mx/WXxH/AIK/tnHtPVDSYDePGdz/ADp/qH631heXdtp9pdX97OlrZ2ULzzzSHikcUalndj2AAJOdplywxQM5GgBZPkHg8OGeXIIQFkmgO8nk/Fn83fPsv5k+f9e80/EtjcSi306Nqgx2UHwQgg9CwHJh/MTngXtR23LtXtLJn6E1H+qOT9I+x/YEexuycen/AIgLl/WO5/U81zVO5fXv/OFn/k0tf/8AAVuv+o7Ts7j/AIEP/Gxk/wCFn/dRfPv+Db/xh4v+Gj/czfp3nrr4m/IX/nKH/wAnp55/7dn/AHTLLPD/APgkf85Fn/zf9xF+gv8AgWf84vp/8/8A3cngOc09W7FXYq7FXYq7FXYq7FXYq7FXYqz7/wAZbNl/1TdV/wBVWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV+/GfSr8pPkL/nNP/yVugf+BVa/9QOo5w//AAXv+MfH/wAMH+5k+g/8BL/jcy/8KP8AuoPzEzyJ9sdiqrBBNczw21vGZZ7h1ijRdyzuQFUe5JwwgZSAHMonOMImUjsN37p+U9Hby95W8taAxBbQ9Ks9PJXcE20CRbf8Bn0V2XpDpdFiwn+GMY/IAPy92vrBq9dmzD+Ocpf6YkvG/wDnKTVodL/JXzTG7FZtXksrCADu73MUjA7j/dcT5of+CVqo4ewMoPORiB8wfuD0f/Aq0ks/tLhI5REpH/SkfeQ/IvPEn39PPLPl++81+YdF8t6Yoa+1u8hs4a9FaVgvJumyg1PsMyOz9Dk1mqhhhzkQB8XG7T7QxaHSZM+T6YAk/B+4XlzQbDyvoOj+XdLjEWn6LaRWcAoASsSheTcQByYirHuSTn0L2focWj00MOMemIAHwfmTtLX5ddq8mfIfVIkn4vnf/nLLzPf6T+XC+W9Jtri5v/ONyLaT0I2kKWduVlnNVBpybgnTcMc5b/godpZMHZQwYwSchrb+aNz+h6//AIEfZeLP2z4+QgRxC9z/ABHaP6S/L/8AQGu/9WW//wCkaX/mnPIPyef+YfkX278/pf8AVI/MPpT/AJxY13WvJv5m21he6bfQ6P5vhOmXBe3lCJPXnbSHYAUccKnoHOdZ/wADXXZ9B2uISieHIOE7Hn/Cfnt8XjP+Ct2fpu0exDOE4meM8Q3HLlIfLf4P1Oz2R8Mflz/zl35DHlv8wYPNNlBw0zzpAZ5Cooq39vxScdT9pSj+5LZ49/wU+xPynagzxHpyC/8AOHP9BfcP+A/2/wDneyTp5n1YjX+Yd4/pD5Nzi3vXYq7FXYq+3P8AnGD8hP07PZ/mR5ysg2iWz+po1hOtVvJUO1zItf7tGHwgj4jv9kfF6B/wOPYj8zIa3Ux9A+gH+I958h9r5p/wUvb/APKxloNLL1n65D+EfzR5n7H6OZ6q+Ovzp/5yj/Pm31z6x+Wvk68E2lwSAa5qELVS5kjYEWsTDqiMKu1fibYbA8vLP+CR7bR1N6LTSuI+uQ6n+aPIdX2D/gV+wM9LWv1UakR6In+EH+I+Z6d33eHc89fTXYq+vf8AnCz/AMmlr/8A4Ct1/wBR2nZ3H/Ah/wCNjJ/ws/7qL59/wbf+MPF/w0f7mb9O89dfE35C/wDOUP8A5PTzz/27P+6ZZZ4f/wAEj/nIs/8Am/7iL9Bf8Cz/AJxfT/5/+7k8Bzmnq3Yq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdir9+M+lX5SfIX/ADmn/wCSt0D/AMCq1/6gdRzh/wDgvf8AGPj/AOGD/cyfQf8AgJf8bmX/AIUf91B+YmeRPtjsVfYX/OLH5MX3mXzDZfmHr1m0Hlny/N62niVafXr2M/AyA0rHE3xFuhYBd6NTuP8Aga+yOTV6qOsyiscDcb/ikP0D79u989/4K3tri0WklocMryTFSr+GJ5/E/dv3P02z118Ufnj/AM5o+e4rvUfL35eWU3IaV/uV1NVY0E8yFLZGFBusbM3ycZ5d/wAF3toZM2PRxP0+qXvP0/Z9767/AMBPsCWPDl10x9Xoj7h9R+f3PhXPO31B9uf84ZeQjqHmDWvzCvIT9V0CNtO05iCAby5T98ymlCUhahFf92Z6B/wJOxPF1U9ZIbQ9Mf6x5/Ife+af8Grt/wAHSY9DA7z9Uv6seXzl9z9HM9VfHXYq7FXYq7FXhf8AzkX5EHnv8rddt7eH1dX0Bf0xp5FORktgTLGKivxxFwACPi4+Gc57f9i/yj2PkAHqh6o/DmPlb1H/AAN+3j2X25jMj6J+iX+dyPwNPx7zw1+hXYq7FX1P/wA45fkNL+Y2px+aPM9q8fkfSpf7tuSHUp0r+5Q0/u1I/eMP9Ub1K9h7A+xUu1c3j5x+5if9Oe4eXf8AJ4b/AIJPt9HsfAdPpz++kP8ASDvPn3fP3/U2GGG3hit7eJIIIEWOOONQqIiiiqqigAAFABnskIRhEACgHw2c5TkZSNk8y+G/+clv+ciG0v65+XnkLUB+kWDQ61qlu29uDs1rA4/3Yf22H2fsj4q8fOv+CH7eeFxaPSS35TkOn9Eefe+nf8DL/gc+Pw67Wx9POET1/pS8u7vfnf13O5OeYPrrsVdir69/5ws/8mlr/wD4Ct1/1Hadncf8CH/jYyf8LP8Auovn3/Bt/wCMPF/w0f7mb9O89dfE35C/85Q/+T088/8Abs/7pllnh/8AwSP+ciz/AOb/ALiL9Bf8Cz/nF9P/AJ/+7k8Bzmnq3Yq7FXYq7FXYq7FXYq7FXYq7FWff+Mtmy/6puq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdir9+M+lX5SeG/n/APlfrP5teTtN8uaHf2WnXdlrMOpPJfGQRmOO3uoSo9KOQ8qzg9Oxznfbn2b1HbegjhxSAImJeq6oCQ6A970//A99qdN2B2jPPmjKQMDGo1dkxPUj+a+SYP8AnCfz00gF15t0GGLu0QupG+hWhjH45xEP+A/2kT6s0P8AZfqD3+T/AIN/ZYHpwZCfPhH6S9t8kf8AOHnkPy/cQ33mrUrnzncwkMtu6fU7LlT9qJHd2ofGSh7qc6Hsf/gUdnaaQlqJHIe76Y/IG/tea7c/4MvamrgYaaAxA9fql8yAB8n1pa2ttY20FnZW0VnaWyCOGCBFjjjRRRVRFAAAHQAZ22LFDHARiAAOQHJ4HLlnlmZTJJO5J3JeS/nH+cGh/lN5dmvbiSG98x3kZXStLL/HNIagSSBfiESndm2rTiDU5pPa32r0/YulMjRyH6Y9/mfJ33sZ7G6rt/WCEQRjH1y7h3Dzfj5retal5i1jUtd1i5a81PVriS6uZm/akkJY0HYb0AHQbZ4ZrNXl1WeWXIblI2T5l+hdDosOj08MOIVGIAA8gl0cck0kcUSNJLKwREUVZmY0AAHUk5VGJJoN0pCIJPJ+1f5Q+RY/y5/L7y95YKKt/BALjUWWh53s/wAc+4LA8WPEGvRRnv3sr2KOyuy8eCvVVy/rHn+p+bfbDt49sdrZdRfpJqP9UbD9a782/PMf5dfl95j80c1W9tbcwaepoed7P+7gABBBozciKfZBw+1PbI7L7MyZ73AqP9Y7BHsh2Ee2O1sWn/hJuX9Uby/U/M3/AKGh/PT/AKnn/uWaZ/2RZ5L/AMnI9ov9X/2MP+Jfaf8Ak1nsv/yj/wCzn/xTv+hofz0/6nn/ALlmmf8AZFj/AMnI9ov9X/2MP+JX/k1nsv8A8o/+zn/xTv8AoaH89P8Aqef+5Zpn/ZFj/wAnI9ov9X/2MP8AiV/5NZ7L/wDKP/s5/wDFPrr/AJxd/OzzD+Yr+Y/LvnbVU1PX7AJf2M/oQ27SWppHMhWBIkPpvxI+Gvxncgbdv/wN/bDVdqHLh1U+KY9UTQG3IjYAbfpfP/8Agqew+j7HGLPpIcMD6ZCyalzB9RJ3H3PsDO5fPX4y/np5DP5d/mX5g0SGEw6VdyfpLS9iFNndEsqrUCojYNHXxXPBfbLsT+S+1smID0n1R/qn9XL4P0b7CdvjtfsXFmJuQHDL+tH9fP4vIc0j0D3r8iPyVv8A82vMHqXYlsvJ2kSK2qXibNIacltoCf23puf2F3O/EHo/Yr2Qy9t6r1WMUfqP+9HmfseW9vfbfF2BpKjRzS+kf74+Q+1+t2k6TpuhabZaPo9lFp2madEsFtbQLxjjjXoAP1nqTuc9t0ulw6bDHHjiBECgA+A6vV5tVmllyyMpSNknqw38y9M8+635ZutG/L/UdO0XU9SDQT6jfvMr28DCjfVxFDL+8atAxI49R8VCuB7RabtLUaQ4tHKMZS2MpXsP6NA7/c7H2Y1XZWm1oy62EpRjuIxA3P8ASsjby6vhM/8AOFX5iMSzeafLzMxqSZLskk/9Guecn/gQ9q/6rj+cv+JfUR/wbuxx/kcnyj/xTX/QlP5h/wDU0eXf+Du/+yXH/k0Han+q4/nL/iU/8nu7H/1HJ8o/8U8j/Nn8ivMn5Q2ejXmu6tpupR63NLDCtg0xKmFVZi/qxR7HmKUrmj9p/YzV9hwhLLOJ4iQOG+nvAd/7Je3mi9oMmSOGEo8ABPFXX3EvEs0D0r69/wCcLP8AyaWv/wDgK3X/AFHadncf8CH/AI2Mn/Cz/uovn3/Bt/4w8X/DR/uZv07z118TfkL/AM5Q/wDk9PPP/bs/7pllnh//AASP+ciz/wCb/uIv0F/wLP8AnF9P/n/7uTwHOaerdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2Kv34z6VflJ2Koe5u7WyiM95cxWkCkAyTOsaAnoOTEDIZcsMcbkQB5s8WHJklwwBJ8t2Ea3+av5beXYnl1jzzotr6ZIMS3kU01RUGkMTPIaEb0XNfrPafsnSxvJngPiCfkLLs9D7J9s6yVYtPM+fCQPmaD5c/Mb/AJzJ0azhudO/LXTZNWvTyRdW1GNobVOoDxQGkj+I58Kdwemcd2//AMFrBCJhoo8R/nS2HvA5n409x7N/8BfUZJDJr58Mf5kd5e4y5D4W+BPMXmPXPNmr3eveY9Tn1fVr5uUtxO1WNNgqgUCqBsFAAA2AzzXX6/Ua3OcuaRlI8yX1bs7s3S6DTxw4ICMByASTKHJfSP8Azi35BHnT8zbLULyESaP5OQatcchVXnVgtrHuGFfUPOh7Ic6r/gb9h/yh2vGch6cfqPv/AIR89/g8d/wVPaD+TexJQifXl9A938R+W3xfrPntb4G/Ob/nM7z79f13RPy8spz9X0JBqWpKp2N1cJSBWFeqREsP+MmeV/8ABb7b8XUw0cTtD1S/rHl8h977D/wFewPC0uTXTG8/TH+qPq+Z+58QZ58+mOxV2KvQ/wAqvO0v5eef/LfmpS31awugl6i/t2c4MVwtKGp4OSPcDNn7NdsS7L7Sxagcgd/6p2P2Op9rOw49r9k5dMeZHp/rDeP2v2xhmhuIYri3lSeCdFkjkjYMjowqrKwqCCDUEZ9AwnGcQQbBfmqcJQkYyFEcw+Ov+cx/If6Z8n6Z54soeV95Un9C8KrVmsbpgvImv+65eNNujMc4T/gs9iePoYaqI3gaP9WX6j976H/wGO3/AMt2hPRzPpyCx/Wj+sfc+Jfyj/KjW/zY8zw6Np4az0m2Ky6pqRQtHawb9OxkehCLXc7migkefey3szqO2tYMUNojeUukR+vufS/a/wBrdL2DojlnvI7Rj1kf1Dq/YHyn5U0PyToGneWvLtmLLStNj4RpXk7sd3kkY7s7E1Jz3LsvsvT9n6aODCKiPxZfnvtftbVdp6uWozyuUvxQ8mRZluG7FXYq7FXwz/zm9/xwvIH/ADH33/JqHPOv+DH/AHGn98vuD6f/AMAz/GtT/Vj95fnbnl768+vf+cLP/Jpa/wD+Ardf9R2nZ3H/AAIf+NjJ/wALP+6i+ff8G3/jDxf8NH+5m/TvPXXxN+Qv/OUP/k9PPP8A27P+6ZZZ4f8A8Ej/AJyLP/m/7iL9Bf8AAs/5xfT/AOf/ALuTwHOaerdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/AKpuq/6qsBzWu1dirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirPv/ABls2X/VN1X/AFVYDmtdq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FWff8AjLZsv+qbqv8AqqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/wDGWzZf9U3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv+qbqv+qrAc1rtXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYq7FXYqz7/xls2X/VN1X/VVgOa12rsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVdirsVZ9/4y2bL/qm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8ZbNl/wBU3Vf9VWA5rXauxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxVn3/jLZsv8Aqm6r/qqwHNa7V2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2KuxV2Ks+/8AGWzZf9U3Vf8AVViP6K1T/q23X/Il/wDmnMH8rm/mn5F2H5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8w79Fap/wBW26/5Ev8A804/lc380/Ir+bwfzx8w79Fap/1bbr/kS/8AzTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv8AkS//ADTj+VzfzT8iv5vB/PHzDv0Vqn/Vtuv+RL/804/lc380/Ir+bwfzx8wzz9Gal/1b7n/lF+P90/Xw+zmy/L5f5p/u+51X5rD/ADh/e94f/9k='
+        'content': preview_image
     },
 
 ])
@@ -55,50 +65,37 @@ app.title = 'DA2i Dashboard'
 # Import data
 path = os.path.dirname(os.path.realpath('__file__')) + '/'
 
-# df = pd.read_csv(path + 'DA2i_Database/DA2I_Indicator_Database.csv')
-db_info = pd.read_csv(path + 'DA2i_Database/db_metadata_2020.csv')
-country_info = pd.read_csv(path + 'DA2i_Database/country_info.csv')
-
-indicator_info = pd.read_csv(path + 'DA2i_Database/db_indicator_info.csv')
-
-
-# df = pd.read_csv(path + 'DA2i_Database/DA2I_Indicator_Database_Public.csv')
-try:
-  
-    df = pd.read_csv(path + 'DA2i_Database/DA2I_Indicator_Database_Private.csv')
-
-except:
-    print("ERROR: error reading private database, will read public")
-    df = pd.read_csv(path + 'DA2i_Database/DA2I_Indicator_Database_Public.csv')
-
-
-
-df = df.merge(country_info, left_on='ISO3', right_on='ISO3', how='left')
-df = df.merge(indicator_info, left_on='Name', right_on='Name', how='left')
-df = df.merge(db_info, left_on='Source', right_on='Source', how='left')
-# Map = pd.read_csv(path + 'DA2i_Database/Country_Flags.csv')
-Map = country_info
-df.sort_values(['Country', 'Name', 'Year'], inplace=True)
-
-## Extract data to populate country drop-down list
-countries = df.loc[df['ISO3'].notnull(), 'Country'].unique()
-countries = [x for x in countries if str(x) != 'nan']
-
-### Open and encode local images
-image_filename = './assets/Connectivity_gravel.png'
-encoded_image = base64.b64encode(open(image_filename, 'rb').read())
-
-image_filename3 = './assets/GenderEquality_Gravel.png'
-encoded_image3 = base64.b64encode(open(image_filename3, 'rb').read())
-
-image_filename4 = './assets/equality_icon_gravel.png'
-encoded_image4 = base64.b64encode(open(image_filename4, 'rb').read())
-
-image_filename5 = './assets/Spyglass_Icon.png'
-encoded_image5 = base64.b64encode(open(image_filename5, 'rb').read())
-
-image_filename6 = './assets/Info_Icon_Purple.png'
-encoded_image6 = base64.b64encode(open(image_filename6, 'rb').read())
-
-image_filename7 = './assets/DA2I-2019-logo.jpg'
-encoded_image7 = base64.b64encode(open(image_filename7, 'rb').read())
\ No newline at end of file
+## Indicator fact table, country/indicator/source metadata and the tables derived from them, reloaded in the
+## background when the CSVs change. The regional averages and country ranks are built on first use.
+datasets = DatasetManager(path, startup)
+## Pin each request to the dataset current when it starts, before any hook below reads the data version; POST
+## /admin/reload reloads the dataset if DA2I_RELOAD_TOKEN is set
+datasets.install(application)
+
+## Stand-ins that always forward to the request's dataset, safe to import by name
+store = datasets.proxy('store')
+latest = datasets.proxy('latest')
+regional_averages = datasets.proxy('regional_averages')
+ranks = datasets.proxy('ranks')
+dimensions = datasets.proxy('dimensions')
+
+## Cache of the figures and tables built by utils, keyed by the request's data version
+figure_cache = FigureCache(version=datasets.data_version)
+
+## Fingerprinted URLs of the images in assets/, cached by the browser
+static_assets = StaticAssets(app)
+static_assets.install(application)
+
+## ETags on the layout and dependencies, keyed by the request's data version and a hash of the deployed code
+build = build_fingerprint([path, path + 'apps/', path + 'assets/'])
+conditional_responses = ConditionalResponses(datasets.data_version, build, app.config.routes_pathname_prefix)
+conditional_responses.install(application)
+
+## Compress the Dash bundles and other text responses per request, and the layout and callback payloads once
+Compress(application)
+compressed_responses = CompressedResponses([app.config.routes_pathname_prefix + endpoint
+                                           for endpoint in DASH_ENDPOINTS])
+compressed_responses.install(application)
+
+## Drop everything cached from the previous data version when the dataset is reloaded
+datasets.on_reload(figure_cache.set_version)
@@ -5,13 +5,16 @@ import dash_html_components as html
 import dash
 
 from app import app
-from app import df
 import utils
 from apps import navbar
 
-layout = html.Div(
-    children=[
-        navbar.layout,
-        html.Div(className="row main-container",
-                 children="TESTING")
-    ])
\ No newline at end of file
+def generate_layout():
+    """
+    :return: component tree of the page, built by the page registry on first request
+    """
+    return html.Div(
+        children=[
+            navbar.generate_layout(),
+            html.Div(className="row main-container",
+                     children="TESTING")
+        ])
\ No newline at end of file
@@ -5,13 +5,10 @@ import dash
 import urllib
 import base64
 from app import app
-from app import countries
-from app import encoded_image, encoded_image3, encoded_image4, encoded_image7
+from app import datasets
+from app import static_assets
 from urllib.parse import unquote
 
-all_countries = [ct for ct in countries]
-
-
 def countryParam(country):
     if len(country) > 0:
         return "/"+urllib.parse.quote_plus(country)
@@ -27,7 +24,7 @@ def generateCountryDropdown(country):
         dcc.Dropdown(
             id="country-dropdown",
             options=[{'label': ct, 'value': ct}
-                     for ct in countries],
+                     for ct in datasets.dataset().countries],
             value=country,
 
         ),
@@ -52,8 +49,7 @@ def generateNavButtons(country):
                 className='navbar-button',
                 children=[
                     html.Img(
-                        src='data:image/png;base64,{}'.format(
-                            encoded_image.decode())
+                        src=static_assets.url('Connectivity_gravel.png')
                     ),
                     html.A(
                         children='Connectivity',
@@ -67,8 +63,7 @@ def generateNavButtons(country):
                 className='navbar-button',
                 children=[
                     html.Img(
-                        src='data:image/png;base64,{}'.format(
-                            encoded_image4.decode())
+                        src=static_assets.url('equality_icon_gravel.png')
                     ),
                     html.A('Freedom', href='/freedom'+countryParam(country))
                 ]
@@ -79,8 +74,7 @@ def generateNavButtons(country):
                 className='navbar-button',
                 children=[
                     html.Img(
-                        src='data:image/png;base64,{}'.format(
-                            encoded_image3.decode())
+                        src=static_assets.url('GenderEquality_Gravel.png')
                     ),
                     html.A('Gender', href='/gender'+countryParam(country))
                 ]
@@ -88,52 +82,53 @@ def generateNavButtons(country):
         ]
 
 
-layout = html.Div(
-    id="navbar",
-    className='navbar custom-navbar',
-    children=[
-        html.A(
-            id='da2i-logo',
-            href="/",
-            children=[
-                html.Img(src='data:image/png;base64,{}'.format(encoded_image7.decode()), style={'width': '75px'})]
-        ),
-        html.Div(
-            id="country-dropdown-div",
-            className="",
-            children=generateCountryDropdown(countries[0]),
-        ),
-        html.Div(
-            id="navbar-buttons",
-            className=" dashboard-buttons",
-            children=generateNavButtons(''),
-        ),
-        html.Div(
-            id="pathnameWrap",
-            children=generatePathname(''),
-        ),
-        html.Div(
-            id="countrynameWrap",
-            children='',
-        ),
-        html.Div(
-            id="cookies-eu-banner",
-            style={'display': 'none'},
-            children=[
-                html.Span(
-                    id="banner-text", children="By clicking accept, you accept the use of cookies by Google Analytics for statistical purposes."),
-                html.Span(
-                    children=[
-                        html.Button(id="cookies-eu-reject", children="Reject"),
-                        html.Button(id="cookies-eu-accept", children="Accept"),
-                    ]
-                )
-
-            ]
-        )
+def generate_layout():
+    return html.Div(
+        id="navbar",
+        className='navbar custom-navbar',
+        children=[
+            html.A(
+                id='da2i-logo',
+                href="/",
+                children=[
+                    html.Img(src=static_assets.url('DA2I-2019-logo.jpg'), style={'width': '75px'})]
+            ),
+            html.Div(
+                id="country-dropdown-div",
+                className="",
+                children=generateCountryDropdown(datasets.dataset().countries[0]),
+            ),
+            html.Div(
+                id="navbar-buttons",
+                className=" dashboard-buttons",
+                children=generateNavButtons(''),
+            ),
+            html.Div(
+                id="pathnameWrap",
+                children=generatePathname(''),
+            ),
+            html.Div(
+                id="countrynameWrap",
+                children='',
+            ),
+            html.Div(
+                id="cookies-eu-banner",
+                style={'display': 'none'},
+                children=[
+                    html.Span(
+                        id="banner-text", children="By clicking accept, you accept the use of cookies by Google Analytics for statistical purposes."),
+                    html.Span(
+                        children=[
+                            html.Button(id="cookies-eu-reject", children="Reject"),
+                            html.Button(id="cookies-eu-accept", children="Accept"),
+                        ]
+                    )
 
-    ]
-)
+                ]
+            )
+
+        ]
+    )
 
 
 @app.callback(
@@ -156,9 +151,9 @@ def update_countryname_wrap(value):
               [Input('url', 'pathname')])
 def update_country_dropdown(pathname):
     if (len(pathname.split('/')) < 3):
-        country = countries[0]
+        country = datasets.dataset().countries[0]
     else:
         country_name = unquote(pathname.split('/')[2].replace("+", " "))
-        if (country_name and country_name in countries):
+        if (country_name and country_name in datasets.dataset().countries):
             country = country_name
     return generateCountryDropdown(country)
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import logging
+
+import dash
+import dash.dependencies
+
+logger = logging.getLogger(__name__)
+
+
+class BatchedCallback(object):
+    """
+    Collects the update functions of a dashboard's panels that share one input and registers them as a single
+    multi-output Dash callback. Changing the input then costs one request to the server instead of one per panel.
+
+    Every panel function keeps its own signature and is called with the input value; a panel that raises is logged
+    and left unchanged so the other panels still update.
+
+    :param component_id: id of the input component, e.g. 'country-dropdown'
+    :param component_property: property of the input component, e.g. 'value'
+    """
+
+    def __init__(self, component_id, component_property):
+        self.input = dash.dependencies.Input(component_id, component_property)
+        self.outputs = []
+        self.functions = []
+
+    def output(self, component_id, component_property):
+        """
+        Decorator adding a panel function to the batch.
+
+        :param component_id: id of the component the function updates
+        :param component_property: property of the component the function updates
+        """
+        def add(func):
+            self.outputs.append(dash.dependencies.Output(component_id, component_property))
+            self.functions.append(func)
+            return func
+        return add
+
+    def update(self, value):
+        """
+        :return: list of the panel outputs for the input value, in registration order
+        """
+        results = []
+        for func in self.functions:
+            try:
+                results.append(func(value))
+            except Exception:
+                logger.exception("%s failed for %s", func.__name__, value)
+                results.append(dash.no_update)
+        return results
+
+    def register(self, app):
+        """
+        Registers the batch on the app as one callback. Call once, after every panel function has been added.
+
+        :param app: Dash app
+        """
+        app.callback(self.outputs, [self.input])(self.update)
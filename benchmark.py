@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+Benchmarks the chart and table builders in utils.py against every country.
+
+Every panel of the connectivity, freedom and gender dashboards is run for every country, calling the builders with
+the same arguments the dashboards use, plus the world choropleths. The figure cache is disabled while benchmarking,
+so every call runs its builder. For each panel the harness reports p50/p95/p99 latency, peak allocated memory (via
+tracemalloc) and serialized payload bytes.
+
+Usage, from the repository root:
+
+    python benchmark.py --output results.json                  # run and save the results
+    python benchmark.py --baseline results.json                # compare against saved results
+    python benchmark.py --save-golden golden.json              # record a hash of every output
+    python benchmark.py --golden golden.json                   # check outputs are identical to the recorded ones
+
+The exit status is 1 when a panel is slower than the baseline by more than --tolerance, or when an output differs
+from the golden file.
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import plotly
+
+# ----- configurable variables -----
+PERCENTILES = [50, 95, 99]
+
+
+def panels():
+    """
+    :return: list of (label, function of the selected country) tuples for every benchmarked panel
+    """
+    import utils
+    from apps import connectivity, freedom, gender
+
+    # country callbacks registered on their own rather than in the page's batch
+    standalone = {connectivity: [connectivity.update_country_profile,
+                                 connectivity.update_country_population,
+                                 connectivity.update_country_income_group,
+                                 connectivity.update_country_sub_region],
+                  freedom: [freedom.update_country_percent_using_internet_vs_freedom_on_net_chart,
+                            freedom.update_country_percent_using_internet_vs_freedom_on_net_table],
+                  gender: [gender.update_gender_inequality_vs_internet_use_chart]}
+
+    result = []
+    for module in (connectivity, freedom, gender):
+        for func in module.dashboard.functions + standalone[module]:
+            # app.callback returns the wrapper serializing the response; time the function it wraps
+            func = getattr(func, '__wrapped__', func)
+            result.append(('{0}.{1}'.format(module.__name__.split('.')[-1], func.__name__), func))
+
+    # the world maps do not depend on the country but are benchmarked the same number of times
+    for builder in (utils.generate_gender_inequality_choropleth, utils.generate_freedom_on_the_net_choropleth_chart):
+        result.append(('utils.' + builder.__name__, lambda country, builder=builder: builder()))
+    return result
+
+
+def serialize(output):
+    """
+    :return: canonical JSON of a figure or Dash component, as sent to the browser
+    """
+    return json.dumps(output, cls=plotly.utils.PlotlyJSONEncoder, sort_keys=True)
+
+
+def run(countries, measure_allocations=True):
+    """
+    Runs every panel for every country.
+
+    :param countries: list of country names
+    :param measure_allocations: if True, run each call a second time under tracemalloc to record its peak allocation
+    :return: (results, golden) tuple; results maps each panel to its statistics, golden maps 'panel|country' to a
+    hash of the output
+    """
+    from app import figure_cache
+
+    # every call must run its builder
+    figure_cache.maxsize = 0
+    figure_cache.clear()
+
+    results = {}
+    golden = {}
+    for label, func in panels():
+        latencies = []
+        allocations = []
+        payloads = []
+        errors = 0
+        for country in countries:
+            try:
+                start = time.perf_counter()
+                output = func(country)
+                latencies.append(time.perf_counter() - start)
+
+                if measure_allocations:
+                    tracemalloc.start()
+                    func(country)
+                    allocations.append(tracemalloc.get_traced_memory()[1])
+                    tracemalloc.stop()
+
+                payload = serialize(output)
+                payloads.append(len(payload.encode('utf-8')))
+                golden[label + '|' + country] = hashlib.sha256(payload.encode('utf-8')).hexdigest()
+            except Exception:
+                errors += 1
+                golden[label + '|' + country] = 'error'
+                if tracemalloc.is_tracing():
+                    tracemalloc.stop()
+
+        results[label] = summarize(latencies, allocations, payloads, errors)
+        print("{0:<70} p50 {1:8.2f} ms  p95 {2:8.2f} ms  p99 {3:8.2f} ms  {4} errors".format(
+            label, results[label]['latency_ms']['p50'], results[label]['latency_ms']['p95'],
+            results[label]['latency_ms']['p99'], errors))
+
+    return results, golden
+
+
+def summarize(latencies, allocations, payloads, errors):
+    """
+    :return: dict of the latency percentiles (ms), allocation percentiles (bytes), mean payload bytes and counts
+    """
+    def percentiles(values, scale=1.0):
+        if len(values) == 0:
+            return {'p%d' % p: float('nan') for p in PERCENTILES}
+        return {'p%d' % p: float(np.percentile(values, p)) * scale for p in PERCENTILES}
+
+    return {'calls': len(latencies),
+            'errors': errors,
+            'latency_ms': percentiles(latencies, 1000.0),
+            'allocated_bytes': percentiles(allocations),
+            'payload_bytes': float(np.mean(payloads)) if len(payloads) != 0 else float('nan')}
+
+
+def compare(results, baseline, tolerance):
+    """
+    Prints the p50 and p95 latency of every panel relative to the baseline.
+
+    :return: list of the panels whose p50 or p95 latency regressed by more than tolerance
+    """
+    regressions = []
+    for label, stats in sorted(results.items()):
+        if label not in baseline:
+            continue
+        ratios = []
+        for p in ('p50', 'p95'):
+            before = baseline[label]['latency_ms'][p]
+            ratios.append(stats['latency_ms'][p] / before if before > 0 else float('nan'))
+        flag = ''
+        if any(ratio > 1 + tolerance for ratio in ratios):
+            regressions.append(label)
+            flag = '  REGRESSION'
+        print("{0:<70} p50 x{1:5.2f}  p95 x{2:5.2f}{3}".format(label, ratios[0], ratios[1], flag))
+    return regressions
+
+
+def check_golden(golden, expected):
+    """
+    :return: list of the 'panel|country' keys whose output differs from the expected hashes
+    """
+    return sorted(key for key, digest in expected.items() if golden.get(key) != digest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the dashboard builders against every country.')
+    parser.add_argument('--countries', type=int, default=None, help='only run the first N countries')
+    parser.add_argument('--no-allocations', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--output', help='save the results as JSON')
+    parser.add_argument('--baseline', help='compare against results saved with --output')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed slowdown against the baseline')
+    parser.add_argument('--save-golden', help='save a hash of every output as JSON')
+    parser.add_argument('--golden', help='check every output against hashes saved with --save-golden')
+    args = parser.parse_args()
+
+    from app import datasets
+
+    countries = datasets.current.countries
+    data_version = datasets.version
+    selected = countries[:args.countries] if args.countries else countries
+    results, golden = run(selected, measure_allocations=not args.no_allocations)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'data_version': data_version, 'countries': len(selected), 'results': results}, f, indent=2)
+    if args.save_golden:
+        with open(args.save_golden, 'w') as f:
+            json.dump({'data_version': data_version, 'outputs': golden}, f, indent=2, sort_keys=True)
+
+    failed = False
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)['results'], args.tolerance)
+        if regressions:
+            print("{0} panels regressed: {1}".format(len(regressions), ', '.join(regressions)))
+            failed = True
+    if args.golden:
+        with open(args.golden) as f:
+            mismatches = check_golden(golden, json.load(f)['outputs'])
+        if mismatches:
+            print("{0} outputs differ from the golden file, e.g. {1}".format(len(mismatches), mismatches[:5]))
+            failed = True
+        else:
+            print("All outputs match the golden file")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+import bisect
+import functools
+import threading
+import time
+
+import flask
+from dash.exceptions import PreventUpdate
+
+# ----- configurable variables -----
+LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0]  # seconds
+SIZE_BUCKETS = [1000, 5000, 10000, 50000, 100000, 500000, 1000000, 5000000]  # bytes
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class CallbackMetrics(object):
+    """
+    Invocation counts, exceptions, latency and response size histograms for every Dash callback, keyed by the
+    callback's output id, exposed in the Prometheus text format. The panels of a batched callback can be measured
+    one by one as well, see instrument_panels().
+
+    Recording a call costs a clock read, two bisections and a few additions under a lock. The counters are per
+    process: under gunicorn, every worker reports its own calls.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self.exceptions = {}
+        self.latency = {}
+        self.sizes = {}
+        self._lock = threading.Lock()
+
+    def instrument(self, app):
+        """
+        Wraps every callback registered on the app. Call once, after every callback has been registered and after
+        any other wrapper (figure cache, prerendered bundles) was installed, so that served-from-cache responses are
+        measured as well.
+
+        :param app: Dash app
+        """
+        for callback_id, entry in app.callback_map.items():
+            entry['callback'] = self._measure(callback_id, entry['callback'])
+
+    def instrument_panels(self, batch):
+        """
+        Wraps every panel function of a BatchedCallback, so each panel gets its own calls, exceptions and latency,
+        keyed by its output id, next to those of the batch as a whole. A panel that raises is counted here before the
+        batch logs it and leaves the panel unchanged. Panels only run when the batch response is computed, not when it
+        is served from the figure cache or a pre-rendered bundle, and their response size is not recorded.
+
+        :param batch: BatchedCallback
+        """
+        for i, (output, func) in enumerate(zip(batch.outputs, batch.functions)):
+            panel_id = '{0}.{1}'.format(output.component_id, output.component_property)
+            batch.functions[i] = self._measure(panel_id, func, sized=False)
+
+    def _measure(self, callback_id, callback, sized=True):
+        self.calls[callback_id] = 0
+        self.exceptions[callback_id] = 0
+        self.latency[callback_id] = Histogram(LATENCY_BUCKETS)
+        self.sizes[callback_id] = Histogram(SIZE_BUCKETS)
+
+        @functools.wraps(callback)
+        def measure(*args):
+            start = time.perf_counter()
+            try:
+                response = callback(*args)
+            except PreventUpdate:
+                self.record(callback_id, time.perf_counter() - start, None)
+                raise
+            except Exception:
+                self.record(callback_id, time.perf_counter() - start, None, failed=True)
+                raise
+            self.record(callback_id, time.perf_counter() - start, len(response) if sized else None)
+            return response
+
+        measure.original = callback
+        return measure
+
+    def record(self, callback_id, seconds, size, failed=False):
+        """
+        :param callback_id: id of the callback in app.callback_map
+        :param seconds: time spent in the callback
+        :param size: length of the serialized response, or None when the callback did not return one
+        :param failed: True if the callback raised
+        """
+        with self._lock:
+            self.calls[callback_id] += 1
+            self.latency[callback_id].observe(seconds)
+            if size is not None:
+                self.sizes[callback_id].observe(size)
+            if failed:
+                self.exceptions[callback_id] += 1
+
+    def render(self):
+        """
+        :return: every metric in the Prometheus text exposition format
+        """
+        lines = []
+        with self._lock:
+            lines.append('# HELP dash_callback_calls_total Number of invocations of the callback.')
+            lines.append('# TYPE dash_callback_calls_total counter')
+            for callback_id in sorted(self.calls):
+                lines.append('dash_callback_calls_total{0} {1}'.format(_labels(callback_id), self.calls[callback_id]))
+
+            lines.append('# HELP dash_callback_exceptions_total Number of invocations of the callback that raised.')
+            lines.append('# TYPE dash_callback_exceptions_total counter')
+            for callback_id in sorted(self.exceptions):
+                count = self.exceptions[callback_id]
+                lines.append('dash_callback_exceptions_total{0} {1}'.format(_labels(callback_id), count))
+
+            lines.append('# HELP dash_callback_latency_seconds Time spent in the callback.')
+            lines.append('# TYPE dash_callback_latency_seconds histogram')
+            for callback_id in sorted(self.latency):
+                lines.extend(self.latency[callback_id].render('dash_callback_latency_seconds', callback_id))
+
+            lines.append('# HELP dash_callback_response_bytes Size of the serialized callback response.')
+            lines.append('# TYPE dash_callback_response_bytes histogram')
+            for callback_id in sorted(self.sizes):
+                lines.extend(self.sizes[callback_id].render('dash_callback_response_bytes', callback_id))
+        return '\n'.join(lines) + '\n'
+
+    def install(self, server, route='/metrics'):
+        """
+        :param server: Flask server of the Dash app
+        :param route: path of the metrics endpoint
+        """
+
+        @server.route(route)
+        def metrics():
+            return flask.Response(self.render(), mimetype=CONTENT_TYPE)
+
+
+class Histogram(object):
+    """
+    Cumulative histogram with fixed bucket upper bounds, as Prometheus expects.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name, callback_id):
+        """
+        :return: list of the _bucket, _sum and _count lines of the histogram
+        """
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ['+Inf'], self.counts):
+            cumulative += count
+            lines.append('{0}_bucket{1} {2}'.format(name, _labels(callback_id, le=bound), cumulative))
+        lines.append('{0}_sum{1} {2}'.format(name, _labels(callback_id), self.sum))
+        lines.append('{0}_count{1} {2}'.format(name, _labels(callback_id), self.count))
+        return lines
+
+
+def _labels(callback_id, le=None):
+    """
+    :return: Prometheus label set of a callback, with the output id escaped
+    """
+    output = callback_id.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    if le is None:
+        return '{{output="{0}"}}'.format(output)
+    return '{{output="{0}",le="{1}"}}'.format(output, le)
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+import flask
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# ----- configurable variables -----
+MIN_SIZE = 500  # smaller payloads are sent uncompressed
+GZIP_LEVEL = 9  # paid once per distinct payload, so compress as hard as possible
+BROTLI_QUALITY = 11
+
+
+class CompressedResponses(object):
+    """
+    Cache of compressed Dash layout and callback payloads. A payload is fully determined by the request and the data
+    version, so its gzip (and brotli, if the brotli package is installed) encoding is computed once and served from
+    the cache to every later client that accepts it.
+
+    :param paths: request paths whose responses are cached, e.g. ConditionalResponses.paths
+    :param maxsize: maximum number of cached encodings; the least recently used one is evicted first
+    """
+
+    def __init__(self, paths, maxsize=4096):
+        self.paths = set(paths)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._payloads = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encoding(self):
+        """
+        :return: the preferred encoding the current request accepts, or None
+        """
+        if brotli is not None and 'br' in flask.request.accept_encodings:
+            return 'br'
+        if 'gzip' in flask.request.accept_encodings:
+            return 'gzip'
+        return None
+
+    def compressed(self, key, encoding, data):
+        """
+        :param key: identity of the payload, e.g. its ETag
+        :param encoding: 'gzip' or 'br'
+        :param data: uncompressed payload
+        :return: the compressed payload, from the cache when it was compressed before
+        """
+        with self._lock:
+            if (key, encoding) in self._payloads:
+                self._payloads.move_to_end((key, encoding))
+                self.hits += 1
+                return self._payloads[(key, encoding)]
+            self.misses += 1
+
+        if encoding == 'br':
+            payload = brotli.compress(data, quality=BROTLI_QUALITY)
+        else:
+            payload = gzip.compress(data, compresslevel=GZIP_LEVEL)
+
+        with self._lock:
+            self._payloads[(key, encoding)] = payload
+            while len(self._payloads) > self.maxsize:
+                self._payloads.popitem(last=False)
+        return payload
+
+    def install(self, server):
+        """
+        :param server: Flask server of the Dash app
+        """
+
+        @server.after_request
+        def compress_payload(response):
+            if flask.request.path not in self.paths or response.status_code != 200 \
+                    or response.direct_passthrough or 'Content-Encoding' in response.headers:
+                return response
+
+            response.vary.add('Accept-Encoding')
+            encoding = self.encoding()
+            data = response.get_data()
+            if encoding is None or len(data) < MIN_SIZE:
+                return response
+
+            etag = flask.g.get('etag')
+            key = etag or hashlib.sha256(data).hexdigest()
+            response.set_data(self.compressed(key, encoding, data))
+            response.headers['Content-Encoding'] = encoding
+            if etag is not None:
+                # each encoding of a payload is a different representation
+                response.set_etag(etag + '-' + encoding)
+            return response
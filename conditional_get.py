@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+
+import dash
+import flask
+
+# ----- configurable variables -----
+# Dash endpoints whose responses depend only on the request, the loaded data and the deployed code
+DASH_ENDPOINTS = ['_dash-layout', '_dash-dependencies', '_dash-update-component']
+# the GET endpoints among them, which browsers revalidate; callback responses are POSTs, which browsers and proxies
+# never revalidate, so they get no ETag
+REVALIDATED_ENDPOINTS = ['_dash-layout', '_dash-dependencies']
+
+
+class ConditionalResponses(object):
+    """
+    ETag support for the Dash layout and dependencies endpoints. A response is fully determined by the request, the
+    deployed code and the data version of the dataset the request is pinned to, so the ETag is a hash of the three
+    and can be computed before Dash builds the response. A request whose If-None-Match carries that ETag is answered
+    with 304 Not Modified. A new data version, or a deploy changing a layout, a callback or an asset, invalidates
+    every ETag handed out before.
+
+    :param version: function returning the data version of the current request
+    :param build: fingerprint of the deployed code, e.g. from build_fingerprint()
+    :param prefix: routes pathname prefix of the Dash app, e.g. '/'
+    """
+
+    def __init__(self, version, build, prefix='/'):
+        self.version = version
+        self.build = build
+        self.paths = set(prefix + endpoint for endpoint in REVALIDATED_ENDPOINTS)
+
+    def etag(self):
+        """
+        :return: ETag of the response to the current request
+        """
+        sha = hashlib.sha256(str(self.version()).encode('utf-8'))
+        sha.update(self.build.encode('utf-8'))
+        sha.update(flask.request.path.encode('utf-8'))
+        sha.update(flask.request.get_data())
+        return sha.hexdigest()[:32]
+
+    def install(self, server):
+        """
+        :param server: Flask server of the Dash app
+        """
+
+        @server.before_request
+        def answer_not_modified():
+            if flask.request.path not in self.paths:
+                return None
+            etag = self.etag()
+            flask.g.etag = etag
+            # compressed payloads carry the ETag with an '-<encoding>' suffix
+            if any(tag.split('-')[0] == etag for tag in flask.request.if_none_match.as_set()):
+                response = flask.Response(status=304)
+                response.set_etag(etag)
+                return response
+            return None
+
+        @server.after_request
+        def add_etag(response):
+            etag = flask.g.get('etag')
+            if etag is not None and response.status_code == 200:
+                if 'ETag' not in response.headers:
+                    response.set_etag(etag)
+                # cached copies must be revalidated, which costs a 304 at most
+                response.headers['Cache-Control'] = 'no-cache'
+            return response
+
+
+def build_fingerprint(folders):
+    """
+    :param folders: folders holding the files the layouts and callbacks are built from: modules and assets
+    :return: hash of the Dash version and of every file directly in the folders; the same in every worker, and
+    different after a deploy that changes any of them
+    """
+    sha = hashlib.sha256(dash.__version__.encode('utf-8'))
+    for folder in folders:
+        for name in sorted(os.listdir(folder)):
+            file = os.path.join(folder, name)
+            if os.path.isfile(file):
+                sha.update(name.encode('utf-8'))
+                with open(file, 'rb') as f:
+                    sha.update(f.read())
+    return sha.hexdigest()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+
+# country attributes countries can be ranked within
+GROUPINGS = ['Region', 'Income.group']
+
+
+class CountryRanks(object):
+    """
+    Rank of every country within its region and income group for every indicator, computed in one vectorized pass at
+    data-load time from the most recent value of each (Country, Name) pair. Ranks are dense, as displayed by the
+    dashboard tables ("3 of 17"): tied countries share a rank and the next value gets the next rank. Countries whose
+    most recent value is missing are not ranked.
+
+    :param store: IndicatorStore built from the fact table
+    :param latest: LatestValues built from the same store
+    """
+
+    def __init__(self, store, latest):
+        # first row of each country
+        first_rows = [start for start, stop in store.country_bounds.values()]
+        attributes = store.table.frame(first_rows, ['Country'] + GROUPINGS)
+        table = latest.table[['Country', 'Name', 'value']].merge(attributes, on='Country', how='left')
+
+        # {(grouping, ascending): {(group, Name, Country): (rank, count)}}
+        self.ranks = {}
+        self.tables = {}
+        for grouping in GROUPINGS:
+            ranked = table.loc[table[grouping].notnull() & table['value'].notnull()]
+            grouped = ranked.groupby([grouping, 'Name'], observed=True)['value']
+            count = grouped.transform('size').astype(int)
+            for ascending in (True, False):
+                # ascending=True ranks the highest value first
+                rank = grouped.rank(method='dense', ascending=not ascending).astype(int)
+                self.tables[(grouping, ascending)] = pd.DataFrame({'Country': ranked['Country'],
+                                                                   'Name': ranked['Name'],
+                                                                   grouping: ranked[grouping],
+                                                                   'rank': rank,
+                                                                   'count': count})
+                self.ranks[(grouping, ascending)] = dict(zip(zip(ranked[grouping], ranked['Name'], ranked['Country']),
+                                                             zip(rank.tolist(), count.tolist())))
+
+    def get(self, country, group, indicator, by='Region', ascending=True):
+        """
+        :param country: country name
+        :param group: region or income group the country is ranked within
+        :param indicator: indicator name
+        :param by: 'Region' or 'Income.group'
+        :param ascending: rank the highest value first if True, the lowest value first otherwise
+        :return: (rank, count) tuple, or None if the country has no data for the indicator
+        """
+        return self.ranks[(by, ascending)].get((group, indicator, country))
+
+    def country_ranks(self, country, by='Region', ascending=True):
+        """
+        Returns the ranks of a country across every indicator with data, for building comparison tables.
+
+        :param country: country name
+        :param by: 'Region' or 'Income.group'
+        :param ascending: rank the highest value first if True, the lowest value first otherwise
+        :return: DataFrame with 'Name', 'rank' and 'count' columns
+        """
+        ranks = self.tables[(by, ascending)]
+        return ranks.loc[ranks['Country'] == country, ['Name', 'rank', 'count']].reset_index(drop=True)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+Loads the indicator database used by the dashboards.
+
+The CSV path reads the indicator database, merges the country attributes onto it and sorts the result. Because that is
+paid again by every gunicorn worker, the fact table can also be written to a columnar, memory-mappable snapshot,
+keyed by a checksum of the source CSVs, which the app maps instead whenever it is fresh. To rebuild the snapshot after
+updating the CSVs, run from the repository root:
+
+    python -m data.database
+"""
+
+import hashlib
+import json
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from data.dimensions import Dimensions
+from data.fact_table import EncodedColumn, FactTable
+
+DATABASE_DIR = 'DA2i_Database/'
+PUBLIC_DATABASE = DATABASE_DIR + 'DA2I_Indicator_Database_Public.csv'
+# private observations layered over the public database when the file exists, e.g. the IS.* ICT skills rows
+PRIVATE_OVERLAY = DATABASE_DIR + 'ICT_Skills_Data.csv'
+DB_INFO = DATABASE_DIR + 'db_metadata_2020.csv'
+COUNTRY_INFO = DATABASE_DIR + 'country_info.csv'
+INDICATOR_INFO = DATABASE_DIR + 'db_indicator_info.csv'
+SNAPSHOT = DATABASE_DIR + 'DA2I_Indicator_Database.snapshot'
+
+# country attributes kept on every observation row
+FACT_COUNTRY_COLUMNS = ['Country', 'Income.group', 'Region']
+
+# ----- snapshot layout -----
+MAGIC = b'DA2ISNAP'
+ALIGNMENT = 64
+# an overlay observation replaces the base observation with the same key
+OBSERVATION_KEY = ['ISO3', 'Name', 'Year']
+
+
+def indicator_databases(path):
+    """
+    :param path: repository root, with a trailing slash
+    :return: list of the public indicator database followed by the private overlay, if it exists
+    """
+    if os.path.exists(path + PRIVATE_OVERLAY):
+        return [path + PUBLIC_DATABASE, path + PRIVATE_OVERLAY]
+    # shown once per process by the default warning filter, although the file list is built on every load
+    warnings.warn("Private overlay {0} not found, reading the public database only".format(PRIVATE_OVERLAY))
+    return [path + PUBLIC_DATABASE]
+
+
+def source_files(path):
+    """
+    :param path: repository root, with a trailing slash
+    :return: list of the CSV files the fact table and its snapshot checksum are built from: the indicator databases,
+    then the country, indicator and source metadata
+    """
+    return indicator_databases(path) + [path + COUNTRY_INFO, path + INDICATOR_INFO, path + DB_INFO]
+
+
+def overlay(base, layer):
+    """
+    Keyed union of two sets of observations: every observation of the layer, plus the observations of the base
+    whose (ISO3, Name, Year) key the layer does not have.
+
+    :param base: DataFrame with 'ISO3', 'Year', 'value' and 'Name' columns
+    :param layer: DataFrame with the same columns
+    :return: DataFrame with the same columns
+    """
+    replaced = pd.MultiIndex.from_frame(base[OBSERVATION_KEY]).isin(pd.MultiIndex.from_frame(layer[OBSERVATION_KEY]))
+    return pd.concat([base.loc[~replaced], layer[base.columns]], ignore_index=True)
+
+
+def source_checksum(files):
+    """
+    Computes a SHA-256 checksum over the names and contents of the source files, so the snapshot is rebuilt when
+    any of them changes or when the private overlay is added or removed.
+
+    :param files: list of file paths
+    :return: hex digest
+    """
+    sha = hashlib.sha256()
+    for file in files:
+        sha.update(os.path.basename(file).encode('utf-8'))
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha.update(chunk)
+    return sha.hexdigest()
+
+
+def read_csv_database(databases, country_file):
+    """
+    Reads the public indicator database, layers the private overlay over it when present, and builds the fact table
+    used by the dashboards, sorted by ['Country', 'Name', 'Year']. Only the country attributes the dashboards select
+    rows by (FACT_COUNTRY_COLUMNS) are merged onto the observations; indicator and source metadata live in Dimensions.
+
+    :param databases: list of the indicator databases, as returned by indicator_databases
+    :param country_file: path of the country metadata CSV
+    :return: DataFrame with 'ISO3', 'Year', 'value', 'Name' and FACT_COUNTRY_COLUMNS columns
+    """
+    df = pd.read_csv(databases[0])
+    for layer in databases[1:]:
+        df = overlay(df, pd.read_csv(layer))
+    country_info = pd.read_csv(country_file)
+    df = df.merge(country_info[['ISO3'] + FACT_COUNTRY_COLUMNS], left_on='ISO3', right_on='ISO3', how='left')
+    df.sort_values(['Country', 'Name', 'Year'], inplace=True)
+    return df
+
+
+def load_dimensions(path):
+    """
+    :param path: repository root, with a trailing slash
+    :return: Dimensions built from the country, indicator and source metadata CSVs
+    """
+    return Dimensions(pd.read_csv(path + COUNTRY_INFO),
+                      pd.read_csv(path + INDICATOR_INFO),
+                      pd.read_csv(path + DB_INFO))
+
+
+def write_snapshot(df, file, checksum):
+    """
+    Writes the fact table to a single binary file laid out for memory mapping: a JSON header followed by one
+    aligned raw array per column. Numeric columns are stored as they are; string columns are dictionary-encoded as
+    integer codes, with -1 marking missing values, and their categories are kept in the header.
+
+    :param df: fact table
+    :param file: snapshot path
+    :param checksum: checksum of the source files the frame was built from
+    """
+    arrays = [('index', df.index.to_numpy())]
+    columns = []
+    for column in df.columns:
+        entry = {'name': column}
+        if df[column].dtype == object:
+            encoded = pd.Categorical(df[column])
+            entry['categories'] = encoded.categories.tolist()
+            arrays.append((column, encoded.codes))
+        else:
+            arrays.append((column, df[column].to_numpy()))
+        columns.append(entry)
+
+    # lay the arrays out after the header, each starting on an ALIGNMENT boundary
+    layout = {}
+    offset = 0
+    for name, array in arrays:
+        layout[name] = {'dtype': array.dtype.str, 'length': len(array), 'offset': offset}
+        offset = _align(offset + array.nbytes)
+
+    header = json.dumps({'checksum': checksum, 'columns': columns, 'layout': layout}).encode('utf-8')
+    data_start = _align(len(MAGIC) + 8 + len(header))
+
+    # write next to the target and rename, so a running app never maps a partial file
+    tmp = file + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.array(len(header), dtype='<u8').tobytes())
+        f.write(header)
+        for name, array in arrays:
+            f.seek(data_start + layout[name]['offset'])
+            f.write(np.ascontiguousarray(array).tobytes())
+    os.replace(tmp, file)
+
+
+def read_snapshot(file, checksum):
+    """
+    Maps a snapshot written by write_snapshot read-only. The operating system shares the mapped pages between every
+    process that opens the file, so gunicorn workers do not each hold a private copy of the columns: the numeric
+    columns and the codes of the string columns are returned as the mapped arrays themselves, without copying them
+    into a DataFrame.
+
+    :param file: snapshot path
+    :param checksum: checksum of the current source files
+    :return: FactTable, or None if the snapshot is missing or was built from other source files
+    """
+    if not os.path.exists(file):
+        return None
+
+    with open(file, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            return None
+        header_length = int(np.frombuffer(f.read(8), dtype='<u8')[0])
+        header = json.loads(f.read(header_length).decode('utf-8'))
+    if header['checksum'] != checksum:
+        return None
+
+    data_start = _align(len(MAGIC) + 8 + header_length)
+
+    def mapped(name):
+        entry = header['layout'][name]
+        if entry['length'] == 0:
+            return np.array([], dtype=entry['dtype'])
+        return np.memmap(file, mode='r', dtype=entry['dtype'], offset=data_start + entry['offset'],
+                         shape=(entry['length'],))
+
+    columns = {}
+    for entry in header['columns']:
+        column = entry['name']
+        if 'categories' in entry:
+            # code -1 takes the trailing NaN
+            columns[column] = EncodedColumn(mapped(column), np.array(entry['categories'] + [np.nan], dtype=object))
+        else:
+            columns[column] = mapped(column)
+
+    return FactTable(columns, mapped('index'), [entry['name'] for entry in header['columns']])
+
+
+def _align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def build_snapshot(path):
+    """
+    Rebuilds the snapshot from the source CSVs.
+
+    :param path: repository root, with a trailing slash
+    :return: fact table
+    """
+    files = source_files(path)
+    df = read_csv_database(indicator_databases(path), country_file=path + COUNTRY_INFO)
+    write_snapshot(df, path + SNAPSHOT, source_checksum(files))
+    return df
+
+
+def load_database(path):
+    """
+    Loads the fact table from the snapshot when it is fresh, and from the source CSVs otherwise.
+
+    :param path: repository root, with a trailing slash
+    :return: (FactTable sorted by ['Country', 'Name', 'Year'], checksum of the source files) tuple; the checksum
+    doubles as the data version
+    """
+    files = source_files(path)
+    checksum = source_checksum(files)
+    table = read_snapshot(path + SNAPSHOT, checksum)
+    if table is None:
+        print("Database snapshot is missing or stale, reading CSV files")
+        table = FactTable.from_frame(read_csv_database(indicator_databases(path), country_file=path + COUNTRY_INFO))
+    return table, checksum
+
+
+if __name__ == '__main__':
+    build_snapshot(os.path.dirname(os.path.realpath('__file__')) + '/')
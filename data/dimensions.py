@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+
+class Dimensions(object):
+    """
+    Country, indicator and source lookups for the indicator fact table. Metadata is kept once per country, indicator
+    and source instead of being repeated on every observation row, and each attribute is a dictionary fetch.
+
+    :param country_info: DataFrame read from country_info.csv
+    :param indicator_info: DataFrame read from db_indicator_info.csv
+    :param db_info: DataFrame read from db_metadata_2020.csv
+    """
+
+    def __init__(self, country_info, indicator_info, db_info):
+        # ----- countries, keyed by country name -----
+        self.countries = country_info.drop_duplicates('Country', keep='last').set_index('Country')
+        self._countries = self.countries.to_dict('index')
+
+        # ----- sources, keyed by source name -----
+        self.sources = db_info.drop_duplicates('Source', keep='last').set_index('Source')
+        self._sources = self.sources.to_dict('index')
+
+        # ----- indicators, keyed by indicator name, with the year of their source database -----
+        indicators = indicator_info.merge(db_info, on='Source', how='left')
+        self.indicators = indicators.drop_duplicates('Name', keep='last').set_index('Name')
+        self._indicators = self.indicators.to_dict('index')
+
+    def country(self, country, attribute):
+        """
+        :param country: country name
+        :param attribute: one of 'ISO3', 'Income.group', 'Region', 'Flag'
+        :return: the attribute of the country
+        """
+        return self._countries[country][attribute]
+
+    def indicator(self, indicator, attribute):
+        """
+        :param indicator: indicator name
+        :param attribute: one of 'Long.name', 'Description', 'Source', 'Unit', 'db_year'
+        :return: the attribute of the indicator
+        """
+        return self._indicators[indicator][attribute]
+
+    def source(self, indicator):
+        """
+        :return: the source of the indicator
+        """
+        return self._indicators[indicator]['Source']
+
+    def db_year(self, indicator):
+        """
+        :return: the year of the source database the indicator comes from
+        """
+        return self._indicators[indicator]['db_year']
+
+    def long_name(self, indicator):
+        """
+        :return: the long name of the indicator
+        """
+        return self._indicators[indicator]['Long.name']
+
+    def description(self, indicator):
+        """
+        :return: the description of the indicator
+        """
+        return self._indicators[indicator]['Description']
+
+    def source_year(self, source):
+        """
+        :return: the year of the source database
+        """
+        return self._sources[source]['db_year']
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# dictionary-encoded string column: integer codes, with -1 marking missing values, and the categories as an object
+# array whose trailing NaN is what code -1 takes
+EncodedColumn = namedtuple('EncodedColumn', ['codes', 'categories'])
+
+
+class FactTable(object):
+    """
+    Column store of the fact table. Numeric columns are plain read-only arrays and string columns are dictionary
+    encoded, so when the table is read from the snapshot every column stays backed by the memory mapping and its pages
+    are shared between the processes that map it. No DataFrame of the whole table is kept; frame() decodes the rows
+    a caller asks for into a new DataFrame, with strings as object columns, as read from the CSVs.
+
+    :param columns: dict of {column name: NumPy array or EncodedColumn}
+    :param index: index labels of the rows
+    :param names: column names, in order
+    """
+
+    def __init__(self, columns, index, names):
+        self.columns = columns
+        self.index = index
+        self.names = names
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        :param df: fact table read from the CSVs
+        :return: FactTable holding the same rows
+        """
+        columns = {}
+        for name in df.columns:
+            if df[name].dtype == object:
+                codes, uniques = pd.factorize(df[name])
+                categories = np.append(np.asarray(uniques, dtype=object), np.nan)
+                columns[name] = EncodedColumn(codes, categories)
+            else:
+                columns[name] = df[name].to_numpy()
+                columns[name].flags.writeable = False
+        return cls(columns, df.index.to_numpy(), list(df.columns))
+
+    def __len__(self):
+        return len(self.index)
+
+    def codes(self, name):
+        """
+        :return: codes of an encoded column, -1 for missing values
+        """
+        return self.columns[name].codes
+
+    def categories(self, name):
+        """
+        :return: categories of an encoded column, followed by NaN
+        """
+        return self.columns[name].categories
+
+    def column(self, name, rows=slice(None)):
+        """
+        :param name: column name
+        :param rows: slice or array of row positions
+        :return: values of the column at the rows; strings are decoded to an object array
+        """
+        column = self.columns[name]
+        if isinstance(column, EncodedColumn):
+            return column.categories.take(column.codes[rows])
+        return np.asarray(column[rows])
+
+    def frame(self, rows=slice(None), columns=None):
+        """
+        :param rows: slice or array of row positions
+        :param columns: list of column names; every column if None
+        :return: new DataFrame of the rows, which the caller may modify
+        """
+        columns = columns if columns is not None else self.names
+        return pd.DataFrame({name: self.column(name, rows) for name in columns}, columns=columns,
+                            index=self.index[rows])
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# ----- configurable variables -----
+COUNTRY_FRAMES = 64  # decoded country slices kept per store; the least recently used one is evicted first
+
+
+class IndicatorStore(object):
+    """
+    Indexed view of the fact table built in app.py. Because the table is sorted by ['Country', 'Name', 'Year'], every
+    (Country, Name) series and every country's full history occupy a contiguous block of rows. The store records the
+    bounds of those blocks once, from the codes of the string columns, so a lookup is a dictionary fetch plus a slice
+    instead of a boolean mask over the whole table. The year and value arrays are the table's own read-only columns,
+    shared with the snapshot mapping when the table was read from it.
+
+    :param table: FactTable, sorted by ['Country', 'Name', 'Year']
+    :param country_frames: maximum number of decoded country slices kept by country_frame()
+    """
+
+    def __init__(self, table, country_frames=COUNTRY_FRAMES):
+        self.table = table
+
+        # decoded country slices, at most country_frames of them; the store belongs to one data version, so they are
+        # dropped with it on reload
+        self.country_frames = OrderedDict()
+        self.country_frames_maxsize = country_frames
+        self._lock = threading.Lock()
+
+        country = table.codes('Country')
+        name = table.codes('Name')
+        country_names = table.categories('Country')
+        indicator_names = table.categories('Name')
+
+        # year-sorted contiguous arrays shared by every series view
+        self.years = table.columns['Year']
+        self.values = table.columns['value']
+        if self.values.dtype != float:
+            self.values = self.values.astype(float)
+            self.values.flags.writeable = False
+
+        # ----- (Country, Name) blocks -----
+        self.series_bounds = {}
+        starts, stops = _block_bounds(country, name)
+        for start, stop in zip(starts, stops):
+            if country[start] >= 0:
+                self.series_bounds[(country_names[country[start]], indicator_names[name[start]])] = (start, stop)
+
+        # ----- Country blocks -----
+        self.country_bounds = {}
+        starts, stops = _block_bounds(country)
+        for start, stop in zip(starts, stops):
+            if country[start] >= 0:
+                self.country_bounds[country_names[country[start]]] = (start, stop)
+
+        # ----- Name rows across countries, in table order -----
+        order = np.argsort(name, kind='stable')
+        self.indicator_rows = {}
+        starts, stops = _block_bounds(name[order])
+        for start, stop in zip(starts, stops):
+            if name[order[start]] >= 0:
+                self.indicator_rows[indicator_names[name[order[start]]]] = order[start:stop]
+
+        # distinct (Country, ISO3) pairs, in table order
+        pairs = country.astype(np.int64) * (len(table.categories('ISO3')) + 1) + table.codes('ISO3')
+        first = np.sort(np.unique(pairs, return_index=True)[1])
+        self.locations = table.frame(first, ['Country', 'ISO3'])
+
+        # countries with an ISO3 code, in table order
+        with_iso3 = country[(table.codes('ISO3') >= 0) & (country >= 0)]
+        self.countries = [country_names[code] for code in pd.unique(with_iso3)]
+
+        # ----- country attributes -----
+        region = table.column('Region', [start for start, stop in self.country_bounds.values()])
+        self.regions = dict(zip(self.country_bounds.keys(), region))
+        self.region_countries = {}
+        for ct, rgn in self.regions.items():
+            self.region_countries.setdefault(rgn, []).append(ct)
+
+    def has_series(self, country, indicator):
+        """
+        :return: True if any rows exist for the country and indicator
+        """
+        return (country, indicator) in self.series_bounds
+
+    def series(self, country, indicator):
+        """
+        Returns the year-sorted years and values of an indicator for a country. The arrays are read-only views into
+        the store and must not be modified.
+
+        :param country: country name
+        :param indicator: indicator name
+        :return: (years, values) tuple of NumPy arrays, empty if no data exists
+        """
+        start, stop = self.series_bounds.get((country, indicator), (0, 0))
+        return self.years[start:stop], self.values[start:stop]
+
+    def frame(self, country, indicator):
+        """
+        Returns the merged rows of an indicator for a country, sorted by year. Equivalent to
+        df.loc[(df.Country == country) & (df.Name == indicator)].
+
+        :param country: country name
+        :param indicator: indicator name
+        :return: DataFrame slice, empty if no data exists
+        """
+        start, stop = self.series_bounds.get((country, indicator), (0, 0))
+        return self.table.frame(slice(start, stop))
+
+    def country_frame(self, country):
+        """
+        Returns every merged row for a country, sorted by indicator name and year. Equivalent to
+        df.loc[df.Country == country]. The slice is decoded once and kept, so the panels of a dashboard share it;
+        every caller gets its own copy, which it may modify.
+
+        :param country: country name
+        :return: DataFrame slice, empty if the country is unknown
+        """
+        if country not in self.country_bounds:
+            return self.table.frame(slice(0, 0))
+
+        with self._lock:
+            frame = self.country_frames.get(country)
+            if frame is not None:
+                self.country_frames.move_to_end(country)
+        if frame is None:
+            start, stop = self.country_bounds[country]
+            frame = self.table.frame(slice(start, stop))
+            with self._lock:
+                self.country_frames[country] = frame
+                while len(self.country_frames) > self.country_frames_maxsize:
+                    self.country_frames.popitem(last=False)
+        return frame.copy()
+
+    def indicators_frame(self, country, indicators):
+        """
+        Returns the merged rows of several indicators for a country. Equivalent to
+        df.loc[(df.Country == country) & (df.Name.isin(indicators))].
+
+        :param country: country name
+        :param indicators: list of indicator names
+        :return: DataFrame slice
+        """
+        country_df = self.country_frame(country)
+        return country_df.loc[country_df['Name'].isin(indicators)]
+
+    def indicator_frame(self, indicators):
+        """
+        Returns the merged rows of one or several indicators across every country, in frame order. Equivalent to
+        df.loc[df.Name == indicator] or df.loc[df.Name.isin(indicators)].
+
+        :param indicators: indicator name, or list of indicator names
+        :return: DataFrame, empty if no data exists
+        """
+        if isinstance(indicators, str):
+            rows = self.indicator_rows.get(indicators, np.array([], dtype=int))
+        else:
+            rows = [self.indicator_rows[name] for name in indicators if name in self.indicator_rows]
+            rows = np.sort(np.concatenate(rows)) if rows else np.array([], dtype=int)
+        return self.table.frame(rows)
+
+    def indicator_names(self):
+        """
+        :return: list of the indicator names with data
+        """
+        return list(self.indicator_rows)
+
+    def region(self, country):
+        """
+        :return: the region of the country, or None if the country is unknown
+        """
+        return self.regions.get(country)
+
+    def countries_in_region(self, region):
+        """
+        :return: list of the countries in the region, in alphabetical order
+        """
+        return list(self.region_countries.get(region, []))
+
+
+def _block_bounds(*columns):
+    """
+    Computes the [start, stop) bounds of runs of equal consecutive keys.
+
+    :param columns: equal-length NumPy arrays forming the key
+    :return: (starts, stops) arrays of row positions
+    """
+    n = len(columns[0])
+    if n == 0:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    change = np.zeros(n, dtype=bool)
+    change[0] = True
+    for col in columns:
+        change[1:] |= col[1:] != col[:-1]
+
+    starts = np.flatnonzero(change)
+    stops = np.append(starts[1:], n)
+    return starts, stops
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Builds the indicator database CSVs from the raw source extracts, replacing the "DA2I Data Updater" Google Sheet.
+
+The sources are listed in a JSON manifest. Each entry names a raw file, relative to the manifest, and how to read it:
+
+    {"sources": [
+        {"name": "wdi", "file": "raw/WDI_Data.csv", "layout": "wide",
+         "iso3": "Country Code", "indicator": "Indicator Code",
+         "indicators": {"SG.GEN.PARL.ZS": "SG.GEN.PARL.ZS", "IT.NET.USER.ZS": "ind.internet"}},
+        {"name": "fotn", "file": "raw/FotN.csv", "layout": "long",
+         "iso3": "Code", "year": "Edition", "value": "Total Score", "indicator_name": "FotN"},
+        {"name": "ict_skills", "file": "raw/IS_raw.csv", "layout": "long", "private": true,
+         "iso3": "ISO3", "year": "Year", "value": "value", "indicator": "Name"}
+    ]}
+
+- "layout" is "long" (one observation per row, with "year" and "value" columns) or "wide" (one column per year).
+- The indicator comes from the "indicator" column, mapped through "indicators" when given (other codes are
+  dropped), or is the constant "indicator_name".
+- Optional keys: "scale" multiplies the values; "read_csv" holds keyword arguments of pandas.read_csv, e.g.
+  {"skiprows": 4}; "private": true writes the rows to the private overlay instead of the public database.
+
+Hand fixes go in a corrections CSV with ISO3,Year,Name,value,action,note columns, applied after normalization.
+Action "set" replaces or adds the observation and needs a Year; "drop" removes it (every year when Year is empty).
+
+Each source is normalized to the ISO3,Year,value,Name schema and cached next to the manifest, keyed by a hash of
+its file and manifest entry, so only changed sources are normalized again. The cached sources are then
+concatenated and corrected, and each output (the public database and the private overlay) is only written when its
+content changed; the overlay is deleted when no private rows are left. The indicators whose rows changed are
+reported, and the hashes are saved in ingest_state.json for reproducibility. Run from the repository root:
+
+    python -m data.ingest DA2i_Database/ingest/sources.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+
+import pandas as pd
+
+from data.database import DATABASE_DIR, PRIVATE_OVERLAY, PUBLIC_DATABASE
+
+# ----- configurable variables -----
+COLUMNS = ['ISO3', 'Year', 'value', 'Name']
+CORRECTIONS = DATABASE_DIR + 'corrections.csv'
+CACHE_DIR = 'cache/'
+STATE_FILE = 'ingest_state.json'
+
+
+def file_hash(file, extra=''):
+    """
+    :param file: path of the file
+    :param extra: text hashed along with the content, e.g. the source's manifest entry
+    :return: hex digest of the file's content and the extra text
+    """
+    sha = hashlib.sha256(extra.encode('utf-8'))
+    with open(file, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def normalize(source, folder):
+    """
+    Reads a raw source file into the database schema.
+
+    :param source: manifest entry of the source
+    :param folder: folder of the manifest, with a trailing slash
+    :return: DataFrame with COLUMNS, without missing values
+    """
+    raw = pd.read_csv(folder + source['file'], **source.get('read_csv', {}))
+
+    if source['layout'] == 'wide':
+        id_columns = [source['iso3']] + ([source['indicator']] if 'indicator' in source else [])
+        years = [column for column in raw.columns if str(column).strip().isdigit() and len(str(column).strip()) == 4]
+        raw = raw.melt(id_vars=id_columns, value_vars=years, var_name='Year', value_name='value')
+        year, value = 'Year', 'value'
+    elif source['layout'] == 'long':
+        year, value = source['year'], source['value']
+    else:
+        raise ValueError("Unknown layout '{0}' for source {1}".format(source['layout'], source['name']))
+
+    df = pd.DataFrame({'ISO3': raw[source['iso3']].str.strip().str.upper(),
+                       'Year': pd.to_numeric(raw[year], errors='coerce'),
+                       'value': pd.to_numeric(raw[value], errors='coerce') * source.get('scale', 1)})
+    if 'indicator' in source:
+        names = raw[source['indicator']].astype(str).str.strip()
+        df['Name'] = names.map(source['indicators']) if 'indicators' in source else names
+    else:
+        df['Name'] = source['indicator_name']
+
+    df = df.dropna()
+    df['Year'] = df['Year'].astype(int)
+    return df[COLUMNS]
+
+
+def apply_corrections(df, corrections):
+    """
+    :param df: observations with COLUMNS
+    :param corrections: DataFrame with ISO3, Year, Name, value and action columns
+    :return: observations with the corrections applied
+    """
+    for row in corrections.itertuples(index=False):
+        match = (df['ISO3'] == row.ISO3) & (df['Name'] == row.Name)
+        if not pd.isnull(row.Year):
+            match &= df['Year'] == int(row.Year)
+        if row.action == 'drop':
+            df = df.loc[~match]
+        elif row.action == 'set':
+            if pd.isnull(row.Year):
+                raise ValueError("Correction 'set' for {0} {1} has no Year; a set row must name the year it "
+                                 "replaces".format(row.ISO3, row.Name))
+            fixed = pd.DataFrame({'ISO3': [row.ISO3], 'Year': [int(row.Year)], 'value': [float(row.value)],
+                                  'Name': [row.Name]})
+            df = pd.concat([df.loc[~match], fixed], ignore_index=True, sort=False)
+        else:
+            raise ValueError("Unknown correction action '{0}' for {1} {2}".format(row.action, row.ISO3, row.Name))
+    return df[COLUMNS]
+
+
+def indicator_hashes(df):
+    """
+    :return: dict of {indicator name: hash of its rows}
+    """
+    return {name: hashlib.sha256(group.to_csv(index=False).encode('utf-8')).hexdigest()
+            for name, group in df.groupby('Name')}
+
+
+def ingest(manifest, corrections_file, path, force=False):
+    """
+    Rebuilds the public indicator database and the private overlay from the sources of a manifest.
+
+    :param manifest: path of the JSON manifest
+    :param corrections_file: path of the corrections CSV, or None
+    :param path: repository root, with a trailing slash
+    :param force: if True, normalize every source again even when its hash is unchanged
+    :return: dict with the lists of the 'added', 'changed' and 'removed' indicators
+    """
+    folder = os.path.dirname(os.path.abspath(manifest)) + '/'
+    with open(manifest) as f:
+        sources = json.load(f)['sources']
+
+    state = {}
+    if os.path.exists(folder + STATE_FILE):
+        with open(folder + STATE_FILE) as f:
+            state = json.load(f)
+    if not os.path.isdir(folder + CACHE_DIR):
+        os.makedirs(folder + CACHE_DIR)
+
+    # ----- normalize the sources whose file or manifest entry changed -----
+    frames = []
+    source_hashes = {}
+    for source in sources:
+        digest = file_hash(folder + source['file'], json.dumps(source, sort_keys=True))
+        cached = folder + CACHE_DIR + source['name'] + '.csv'
+        if force or state.get('sources', {}).get(source['name']) != digest or not os.path.exists(cached):
+            print("Normalizing {0}".format(source['name']))
+            normalize(source, folder).to_csv(cached, index=False)
+        df = pd.read_csv(cached)
+        df['private'] = bool(source.get('private', False))
+        frames.append(df)
+        source_hashes[source['name']] = digest
+
+    df = pd.concat(frames, ignore_index=True)
+    duplicated = df.duplicated(['ISO3', 'Name', 'Year'], keep=False)
+    if duplicated.any():
+        raise ValueError("Duplicate observations in the sources:\n{0}".format(
+            df.loc[duplicated].sort_values(['Name', 'ISO3', 'Year']).head(20)))
+
+    # ----- hand fixes -----
+    corrections_hash = None
+    if corrections_file is not None and os.path.exists(corrections_file):
+        private = set(df.loc[df['private'], 'Name'])
+        df = apply_corrections(df[COLUMNS], pd.read_csv(corrections_file))
+        df['private'] = df['Name'].isin(private)
+        corrections_hash = file_hash(corrections_file)
+
+    df = df.sort_values(['Name', 'Year', 'ISO3']).reset_index(drop=True)
+
+    # ----- report the indicators whose rows changed -----
+    hashes = indicator_hashes(df[COLUMNS])
+    previous = state.get('indicators', {})
+    report = {'added': sorted(set(hashes) - set(previous)),
+              'removed': sorted(set(previous) - set(hashes)),
+              'changed': sorted(name for name in hashes if name in previous and previous[name] != hashes[name])}
+
+    # ----- write the databases whose content changed, and the state -----
+    output_hashes = {}
+    for output, rows in ((PUBLIC_DATABASE, ~df['private']), (PRIVATE_OVERLAY, df['private'])):
+        if output == PRIVATE_OVERLAY and not rows.any():
+            # stale private rows would otherwise keep being layered over the public database
+            if os.path.exists(path + output):
+                print("Removing {0}, no private rows left".format(output))
+                os.remove(path + output)
+            continue
+        content = df.loc[rows, COLUMNS].to_csv(index=False)
+        output_hashes[output] = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        if state.get('outputs', {}).get(output) != output_hashes[output] or not os.path.exists(path + output):
+            print("Writing {0}".format(output))
+            with open(path + output, 'w') as f:
+                f.write(content)
+
+    with open(folder + STATE_FILE, 'w') as f:
+        json.dump({'sources': source_hashes, 'corrections': corrections_hash, 'indicators': hashes,
+                   'outputs': output_hashes}, f, indent=2, sort_keys=True)
+    return report
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the indicator database CSVs from the raw source files.')
+    parser.add_argument('manifest', help='JSON manifest of the sources')
+    parser.add_argument('--corrections', default=CORRECTIONS, help='CSV of hand fixes')
+    parser.add_argument('--force', action='store_true', help='normalize every source again')
+    args = parser.parse_args()
+
+    report = ingest(args.manifest, args.corrections, os.path.dirname(os.path.realpath('__file__')) + '/',
+                    force=args.force)
+    for key in ('added', 'changed', 'removed'):
+        print("{0} indicators {1}: {2}".format(len(report[key]), key, ', '.join(report[key])))
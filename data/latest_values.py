@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# most recent observation of an indicator for a country; previous_* and pct_change are None when the series has a
+# single observation
+LatestValue = namedtuple('LatestValue', ['value', 'year', 'previous_value', 'previous_year', 'pct_change'])
+
+
+class LatestValues(object):
+    """
+    Materialized table of the most recent (and previous) observation for every (Country, Name) pair in an
+    IndicatorStore. It is computed once at data-load time so the quick look and table callbacks can replace a
+    filter + sort + tail(1) with a dictionary lookup.
+
+    :param store: IndicatorStore built from the fact table
+    """
+
+    def __init__(self, store):
+        keys = list(store.series_bounds.keys())
+        bounds = np.array([store.series_bounds[k] for k in keys], dtype=int).reshape(-1, 2)
+        starts, stops = bounds[:, 0], bounds[:, 1]
+
+        # series are year-sorted, so the last row of each block is the most recent observation
+        last = stops - 1
+        has_previous = (stops - starts) > 1
+        previous = np.where(has_previous, stops - 2, last)
+
+        value = store.values[last]
+        year = store.years[last]
+        previous_value = np.where(has_previous, store.values[previous], np.nan)
+        previous_year = np.where(has_previous, store.years[previous], np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct_change = (value - previous_value) / previous_value * 100
+
+        self.table = pd.DataFrame({'Country': [k[0] for k in keys],
+                                   'Name': [k[1] for k in keys],
+                                   'value': value,
+                                   'Year': year,
+                                   'previous_value': previous_value,
+                                   'previous_year': previous_year,
+                                   'pct_change': pct_change})
+
+        self.records = {}
+        for i, key in enumerate(keys):
+            self.records[key] = LatestValue(value=float(value[i]),
+                                            year=int(year[i]),
+                                            previous_value=float(previous_value[i]) if has_previous[i] else None,
+                                            previous_year=int(previous_year[i]) if has_previous[i] else None,
+                                            pct_change=_finite_or_none(pct_change[i]) if has_previous[i] else None)
+
+    def get(self, country, indicator):
+        """
+        :param country: country name
+        :param indicator: indicator name
+        :return: LatestValue for the pair, or None if no data exists
+        """
+        return self.records.get((country, indicator))
+
+    def value(self, country, indicator, default=None):
+        """
+        :return: the most recent value of the indicator for the country, or default if no data exists
+        """
+        record = self.records.get((country, indicator))
+        return record.value if record is not None else default
+
+    def year(self, country, indicator, default=None):
+        """
+        :return: the year of the most recent value of the indicator for the country, or default if no data exists
+        """
+        record = self.records.get((country, indicator))
+        return record.year if record is not None else default
+
+
+def _finite_or_none(x):
+    return float(x) if np.isfinite(x) else None
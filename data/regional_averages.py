@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+
+
+class RegionalAverages(object):
+    """
+    Population-weighted regional average of every indicator for every (Region, Name, Year), computed once at data-load
+    time. Each country's value is weighted by its population in the same year, back-filled from later years when the
+    population of that year is missing; countries without any later population figure are left out of the average.
+
+    :param store: IndicatorStore built from the fact table
+    """
+
+    def __init__(self, store):
+        rows = store.table.frame(columns=['Region', 'Country', 'Name', 'Year', 'value'])
+        rows = rows.loc[rows['Country'].notnull() & rows['Region'].notnull()]
+
+        # ----- population weights -----
+        population = rows.loc[rows['Name'] == 'population', ['Country', 'Year', 'value']]
+        population = population.rename(columns={'value': 'population'})
+        rgl = rows.merge(population, on=['Country', 'Year'], how='left')
+        rgl['population'] = rgl.groupby(['Country', 'Name'], observed=True)['population'].bfill()
+
+        # ----- weighted average by (Region, Name, Year) -----
+        rgl['w_value'] = rgl['value'] * rgl['population']
+        cube = rgl.groupby(['Region', 'Name', 'Year'], as_index=False, observed=True)[['w_value', 'population']].sum()
+        cube['w_avg'] = cube['w_value'] / cube['population']
+
+        self.cube = cube[['Region', 'Name', 'Year', 'w_avg']]
+        self.series_by_key = {}
+        for (region, name), group in self.cube.groupby(['Region', 'Name'], observed=True):
+            self.series_by_key[(region, name)] = group[['Year', 'w_avg']].reset_index(drop=True)
+
+        self._empty = pd.DataFrame({'Year': [], 'w_avg': []})
+
+    def series(self, region, indicator):
+        """
+        Returns the population-weighted average of an indicator for a region by year. The frame is shared between
+        callers and must not be modified.
+
+        :param region: region name
+        :param indicator: indicator name
+        :return: DataFrame with 'Year' and 'w_avg' columns, empty if no data exists
+        """
+        return self.series_by_key.get((region, indicator), self._empty)
+
+    def regions(self, indicator):
+        """
+        :return: list of the regions with data for the indicator
+        """
+        return sorted(region for region, name in self.series_by_key if name == indicator)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+
+import os
+import threading
+import time
+import traceback
+
+import flask
+
+from data.database import DATABASE_DIR, load_database, load_dimensions
+from data.indicator_store import IndicatorStore
+from data.latest_values import LatestValues
+from data.regional_averages import RegionalAverages
+from data.country_ranks import CountryRanks
+from startup import Deferred
+
+# ----- configurable variables -----
+WATCH_INTERVAL = 30  # seconds between two checks of the database folder
+RELOAD_TOKEN_VARIABLE = 'DA2I_RELOAD_TOKEN'  # environment variable holding the token of the reload route
+
+
+class Dataset(object):
+    """
+    The fact table loaded from one version of the source files, with everything derived from it.
+
+    :param path: repository root, with a trailing slash
+    :param profile: StartupProfile the loading phases are recorded in
+    :param defer: if True, the regional averages and country ranks are built on first use instead of now
+    """
+
+    def __init__(self, path, profile, defer=True):
+        with profile.phase('load database'):
+            self.table, self.version = load_database(path)
+        with profile.phase('load dimensions'):
+            self.dimensions = load_dimensions(path)
+
+        with profile.phase('index indicators'):
+            self.store = IndicatorStore(self.table)
+        self.countries = self.store.countries
+        with profile.phase('latest values'):
+            self.latest = LatestValues(self.store)
+
+        self.regional_averages = Deferred('regional averages', profile, RegionalAverages, self.store)
+        self.ranks = Deferred('country ranks', profile, CountryRanks, self.store, self.latest)
+        if not defer:
+            self.regional_averages.build()
+            self.ranks.build()
+
+
+class DatasetManager(object):
+    """
+    Holds the current Dataset and replaces it when the source files change. A new dataset is built completely,
+    derived tables included, in a background thread while requests keep being served from the current one; it is
+    then swapped in with a single assignment and the new data version is passed to every reload listener (the figure
+    cache, the ETags, the pre-rendered bundles, ...) so that whatever was cached from the previous version is dropped.
+    Once installed, every request is pinned to the dataset current when it started, so requests in flight during the
+    swap finish on that dataset.
+
+    Modules that import the dataset's objects by name at boot (``from app import store``) get a Current stand-in
+    from proxy(), which forwards to the dataset of the request being served, see dataset().
+
+    :param path: repository root, with a trailing slash
+    :param profile: StartupProfile the loading phases are recorded in
+    """
+
+    def __init__(self, path, profile):
+        self.path = path
+        self.profile = profile
+        self.current = Dataset(path, profile)
+        self.listeners = []
+        self.reloads = 0
+        self._signature = self.signature()
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        return self.data_version()
+
+    def data_version(self):
+        """
+        :return: version of the dataset pinned to the request being served, or of the current dataset outside of a
+        request; caches and ETags are keyed on it
+        """
+        return self.dataset().version
+
+    def dataset(self):
+        """
+        :return: the dataset pinned to the request being served, or the current dataset outside of a request
+        """
+        if flask.has_request_context():
+            dataset = flask.g.get('dataset')
+            if dataset is not None:
+                return dataset
+        return self.current
+
+    def proxy(self, name):
+        """
+        :param name: attribute of Dataset, e.g. 'store'
+        :return: stand-in forwarding attribute access to that object of the request's dataset
+        """
+        return Current(self, name)
+
+    def on_reload(self, listener):
+        """
+        :param listener: function called with the new data version after each swap
+        """
+        self.listeners.append(listener)
+
+    def signature(self):
+        """
+        :return: names, sizes and modification times of the files in the database folder
+        """
+        folder = self.path + DATABASE_DIR
+        return sorted((entry.name, entry.stat().st_size, entry.stat().st_mtime)
+                      for entry in os.scandir(folder) if entry.is_file() and entry.name.endswith('.csv'))
+
+    def reload(self):
+        """
+        Builds a dataset from the source files and swaps it in if its version differs from the current one.
+
+        :return: True if a new version was swapped in
+        """
+        with self._lock:
+            self._signature = self.signature()
+            dataset = Dataset(self.path, self.profile, defer=False)
+            if dataset.version == self.current.version:
+                return False
+            self.current = dataset
+            self.reloads += 1
+            # caches are keyed on the version of the dataset each request is pinned to, so requests still running on
+            # the old dataset can only cache under the old version; the listeners drop what was cached before
+            for listener in self.listeners:
+                listener(dataset.version)
+            print("Reloaded dataset, version {0}".format(dataset.version))
+            return True
+
+    def reload_in_background(self):
+        """
+        Starts a reload in a daemon thread and returns immediately.
+        """
+        threading.Thread(target=self._reload_safely, daemon=True).start()
+
+    def _reload_safely(self):
+        try:
+            self.reload()
+        except Exception:
+            # a half-written or malformed file leaves the current dataset in place
+            print("ERROR: dataset reload failed")
+            traceback.print_exc()
+
+    def watch(self, interval=WATCH_INTERVAL):
+        """
+        Starts a daemon thread reloading the dataset whenever a CSV file of the database folder changes.
+
+        :param interval: seconds between two checks
+        """
+        def poll():
+            while True:
+                time.sleep(interval)
+                try:
+                    changed = self.signature() != self._signature
+                except OSError:
+                    continue
+                if changed:
+                    self._reload_safely()
+
+        threading.Thread(target=poll, daemon=True).start()
+
+    def install(self, server, route='/admin/reload'):
+        """
+        Pins every request to the dataset current when it starts, and adds a route starting a background reload on
+        POST. The route is only added when the DA2I_RELOAD_TOKEN environment variable is set, and requests must carry
+        that token in the X-Reload-Token header. Install before any other request hook that reads the data or its
+        version, since Flask runs the hooks in the order they were added.
+
+        :param server: Flask server of the Dash app
+        :param route: path of the reload route
+        """
+
+        @server.before_request
+        def pin_dataset():
+            flask.g.dataset = self.current
+
+        token = os.environ.get(RELOAD_TOKEN_VARIABLE)
+        if not token:
+            return
+
+        @server.route(route, methods=['POST'])
+        def reload_dataset():
+            if flask.request.headers.get('X-Reload-Token') != token:
+                return flask.Response('Forbidden\n', status=403, mimetype='text/plain')
+            self.reload_in_background()
+            return flask.Response('Reload started, current version {0}\n'.format(self.version), status=202,
+                                  mimetype='text/plain')
+
+
+class Current(object):
+    """
+    Stand-in for an object of the current dataset, e.g. its IndicatorStore. Every attribute access is forwarded to
+    the object of the dataset the request being served is pinned to, or of the current dataset outside of requests.
+
+    :param manager: DatasetManager
+    :param name: attribute of Dataset
+    """
+
+    def __init__(self, manager, name):
+        self._manager = manager
+        self._name = name
+
+    def __getattr__(self, attribute):
+        # only called for attributes the stand-in itself does not have
+        return getattr(getattr(self._manager.dataset(), self._name), attribute)
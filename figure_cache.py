@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+import functools
+import threading
+from collections import OrderedDict
+
+
+class FigureCache(object):
+    """
+    Bounded LRU cache for the figure and table builders in utils.py. A builder's output depends only on its
+    arguments and the loaded data, so results are keyed by (function, arguments, data version). The version is the
+    one of the dataset the current request is pinned to, so a request still served from the previous dataset after
+    a reload can only store results under the previous version, where requests on the new dataset never look.
+
+    Cached results are shared between callbacks and must not be modified.
+
+    :param maxsize: maximum number of cached results; the least recently used result is evicted first
+    :param version: function returning the data version of the current request
+    """
+
+    def __init__(self, maxsize=2048, version=None):
+        self.maxsize = maxsize
+        self._version = version
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        return self._version() if self._version is not None else None
+
+    def memoize(self, func):
+        """
+        Decorator caching the results of func. Calls whose arguments cannot be made hashable are not cached.
+        """
+        name = func.__module__ + '.' + func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                key = (name, _freeze(args), _freeze(kwargs), self.version)
+                hash(key)
+            except TypeError:
+                return func(*args, **kwargs)
+
+            with self._lock:
+                if key in self._results:
+                    self._results.move_to_end(key)
+                    self.hits += 1
+                    return self._results[key]
+                self.misses += 1
+
+            result = func(*args, **kwargs)
+
+            with self._lock:
+                self._results[key] = result
+                self._results.move_to_end(key)
+                while len(self._results) > self.maxsize:
+                    self._results.popitem(last=False)
+            return result
+
+        wrapper.uncached = func
+        return wrapper
+
+    def set_version(self, version):
+        """
+        Called when a new data version is swapped in; drops the results computed so far, which belong to previous
+        versions.
+        """
+        with self._lock:
+            self._results.clear()
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+
+    def stats(self):
+        """
+        :return: dict with the hit and miss counts, the number of cached results and the maximum size
+        """
+        with self._lock:
+            return {'hits': self.hits,
+                    'misses': self.misses,
+                    'size': len(self._results),
+                    'maxsize': self.maxsize,
+                    'version': self.version}
+
+
+def _freeze(value):
+    """
+    Converts lists and dicts, e.g. the categories passed to the sparklines charts, into hashable tuples.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
@@ -1,12 +1,24 @@
+# first, so that the boot profile starts before any third-party import
+from startup import profile as startup
+
+from app import app, datasets, dimensions, path
+
 import dash_core_components as dcc
 import dash_html_components as html
 from dash.dependencies import Input, Output
 
-from app import app
-from apps import connectivity, freedom, gender, about
+with startup.phase('import pages'):
+    from apps import connectivity, freedom, gender, about
+from prerender import PrerenderedResponses
+from page_registry import PageRegistry
+from callback_metrics import CallbackMetrics
 
 application = app.server
 
+# serve the country callbacks from the bundles built by prerender.py, when they are fresh
+prerendered = PrerenderedResponses(dimensions, datasets.data_version, path)
+prerendered.install(app)
+
 
 app.layout = html.Div([
     dcc.Location(id='url', refresh=False),
@@ -14,22 +26,42 @@ app.layout = html.Div([
 ])
 
 
+# callbacks are registered by the imports above; each layout is built on its first request
+pages = PageRegistry(startup, default='connectivity', version=datasets.data_version)
+pages.add('connectivity', connectivity)
+pages.add('freedom', freedom)
+pages.add('gender', gender)
+pages.add('about', about)
+
+
 @app.callback(Output('page-content', 'children'),
               [Input('url', 'pathname')])
 def display_page(pathname):
-    pagename = pathname.split('/')[1]
-    if pagename == '/' or pagename == '':
-        return connectivity.layout
-    elif pagename == 'connectivity':
-        return connectivity.layout
-    elif pagename == 'freedom':
-        return freedom.layout
-    elif pagename == 'gender':
-        return gender.layout
-    elif pagename == 'about':
-        return about.layout
-    else:
+    pagename = pages.page(pathname)
+    if pagename is None:
         return '404'
+    return pages.layout(pagename)
+
+
+# serialize the index layout and each page's response once
+pages.install(app, 'page-content.children')
+
+# reload the dataset when the CSVs change; app.py pins each request to a dataset and adds the reload route
+datasets.on_reload(prerendered.set_version)
+datasets.on_reload(pages.set_version)
+datasets.watch()
+
+
+# measure every callback, including the ones answered from the bundles, and every panel of the batches; exposed on
+# /metrics
+callback_metrics = CallbackMetrics()
+callback_metrics.instrument(app)
+for page in (connectivity, freedom, gender):
+    callback_metrics.instrument_panels(page.dashboard)
+callback_metrics.install(application)
+
+startup.finish()
+print(startup.report())
 
 
 if __name__ == '__main__':
@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+Load test replaying the sessions of users who switch countries and dashboards.
+
+A session opens /<dashboard>/<country> the way a browser does: it fetches the page, the Dash layout and the
+dependencies, then fires the same _dash-update-component requests the Dash renderer sends while the page renders.
+After that it picks other countries from the dropdown, and eventually opens another dashboard. The renderer is
+simulated from the dependency list, so new callbacks are exercised without changes here.
+
+Usage, from the repository root:
+
+    python loadtest.py --users 8 --duration 60                         # in-process, through the Flask test client
+    python loadtest.py --url http://localhost:8000 --users 32          # against a running server, e.g. gunicorn
+
+The in-process mode shares one interpreter between the simulated users, so it measures a single-threaded worker;
+run against gunicorn with --url to size workers.
+"""
+
+import argparse
+import functools
+import gzip
+import json
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import numpy as np
+
+# ----- configurable variables -----
+DASHBOARDS = ['connectivity', 'freedom', 'gender']
+PERCENTILES = [50, 95, 99]
+MAX_WAVES = 10  # callback chains deeper than this are cut off
+
+
+class LocalClient(object):
+    """
+    Sends the requests to the Flask server in this process.
+    """
+
+    def __init__(self, server):
+        self.client = server.test_client()
+
+    def request(self, method, path, body=None):
+        """
+        :return: (status code, response body) tuple
+        """
+        if method == 'GET':
+            response = self.client.get(path)
+        else:
+            response = self.client.post(path, data=json.dumps(body), content_type='application/json')
+        return response.status_code, response.get_data()
+
+
+class HttpClient(object):
+    """
+    Sends the requests to a running server, accepting gzip like a browser does.
+    """
+
+    def __init__(self, url):
+        self.url = url.rstrip('/')
+
+    def request(self, method, path, body=None):
+        """
+        :return: (status code, response body) tuple
+        """
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(self.url + path, data=data, method=method,
+                                         headers={'Content-Type': 'application/json', 'Accept-Encoding': 'gzip'})
+        try:
+            with urllib.request.urlopen(request) as response:
+                status, payload, encoding = response.status, response.read(), response.headers.get('Content-Encoding')
+        except urllib.error.HTTPError as e:
+            status, payload, encoding = e.code, e.read(), e.headers.get('Content-Encoding')
+        if encoding == 'gzip':
+            payload = gzip.decompress(payload)
+        return status, payload
+
+
+class Session(object):
+    """
+    One simulated user. Keeps the ids and property values of the rendered components, as the Dash renderer does, to
+    fill in the inputs and state of the callbacks it fires and to skip callbacks whose outputs are not on the page.
+
+    :param client: LocalClient or HttpClient
+    :param stats: Stats the requests are recorded in
+    :param countries: list of country names to pick from
+    :param switches: number of country changes per dashboard
+    """
+
+    def __init__(self, client, stats, countries, switches):
+        self.client = client
+        self.stats = stats
+        self.countries = countries
+        self.switches = switches
+        self.dependencies = []
+        self.props = {}
+        self.rendered = set()
+
+    def send(self, label, method, path, body=None):
+        """
+        :return: decoded JSON response, or None if the request failed or the response is empty
+        """
+        start = time.perf_counter()
+        try:
+            status, payload = self.client.request(method, path, body)
+        except Exception:
+            self.stats.record(label, time.perf_counter() - start, 0, failed=True)
+            return None
+        self.stats.record(label, time.perf_counter() - start, len(payload), failed=status >= 400)
+        if status != 200 or label == 'page':
+            return None
+        try:
+            return json.loads(payload.decode('utf-8'))
+        except ValueError:
+            return None
+
+    def open(self, dashboard, country):
+        """
+        Loads /<dashboard>/<country> and fires the callbacks the renderer fires until the page settles.
+        """
+        pathname = '/' + dashboard + ('/' + urllib.parse.quote_plus(country) if country else '')
+        self.send('page', 'GET', pathname)
+        layout = self.send('_dash-layout', 'GET', '/_dash-layout')
+        self.dependencies = self.send('_dash-dependencies', 'GET', '/_dash-dependencies') or []
+
+        self.props = {'url.pathname': pathname}
+        self.rendered = {'url'}
+        changed = set(self.props) | self.collect(layout)
+        self.fire(changed)
+
+    def select(self, country):
+        """
+        Picks a country in the dropdown and fires the callbacks that depend on it.
+        """
+        self.props['country-dropdown.value'] = country
+        self.fire({'country-dropdown.value'})
+
+    def fire(self, changed):
+        """
+        Fires, in waves, every callback with a changed input whose inputs are all rendered and at least one of whose
+        outputs is rendered, and applies the responses until no property changes.
+        """
+        for _ in range(MAX_WAVES):
+            if not changed:
+                return
+            triggered = [d for d in self.dependencies
+                         if any(prop_id(i) in changed for i in d['inputs'])
+                         and all(prop_id(i) in self.props for i in d['inputs'])
+                         and any(component_id in self.rendered for component_id in output_ids(d['output']))]
+            previous, changed = changed, set()
+            for dependency in triggered:
+                body = {'output': dependency['output'],
+                        'inputs': [dict(i, value=self.props[prop_id(i)]) for i in dependency['inputs']],
+                        'state': [dict(s, value=self.props.get(prop_id(s))) for s in dependency.get('state', [])],
+                        'changedPropIds': [prop_id(i) for i in dependency['inputs'] if prop_id(i) in previous]}
+                response = self.send(dependency['output'], 'POST', '/_dash-update-component', body)
+                if response is not None:
+                    changed |= self.apply(dependency['output'], response)
+
+    def apply(self, output, response):
+        """
+        :return: set of the properties changed by a callback response, including those of returned components
+        """
+        if response.get('multi'):
+            updates = response['response']
+        else:
+            component_id = output.rsplit('.', 1)[0]
+            updates = {component_id: response['response']['props']}
+
+        changed = set()
+        for component_id, props in updates.items():
+            for prop, value in props.items():
+                self.props[component_id + '.' + prop] = value
+                changed.add(component_id + '.' + prop)
+                changed |= self.collect(value)
+        return changed
+
+    def collect(self, tree):
+        """
+        Records the properties of every component with an id in a serialized component tree.
+
+        :return: set of the recorded properties
+        """
+        found = set()
+        if isinstance(tree, list):
+            for child in tree:
+                found |= self.collect(child)
+        elif isinstance(tree, dict) and 'props' in tree and 'type' in tree:
+            props = tree['props']
+            if 'id' in props:
+                self.rendered.add(props['id'])
+                for prop, value in props.items():
+                    if prop != 'children':
+                        self.props[props['id'] + '.' + prop] = value
+                        found.add(props['id'] + '.' + prop)
+            found |= self.collect(props.get('children'))
+        return found
+
+    def run(self, stop):
+        """
+        Opens random dashboards and switches countries until stop is set.
+        """
+        while not stop.is_set():
+            self.open(random.choice(DASHBOARDS), random.choice(self.countries))
+            for _ in range(self.switches):
+                if stop.is_set():
+                    return
+                self.select(random.choice(self.countries))
+            self.stats.sessions += 1
+
+
+def prop_id(dependency):
+    return dependency['id'] + '.' + dependency['property']
+
+
+def output_ids(output):
+    """
+    :param output: output of a dependency, e.g. 'graph.figure', or '..graph.figure...table.children..' when the
+    callback has several outputs
+    :return: list of the ids of the output components
+    """
+    if output.startswith('..'):
+        return [part.rsplit('.', 1)[0] for part in output[2:-2].split('...')]
+    return [output.rsplit('.', 1)[0]]
+
+
+class Stats(object):
+    """
+    Latencies, response sizes and failures of the requests of every session, per request label.
+    """
+
+    def __init__(self):
+        self.latencies = {}
+        self.sizes = {}
+        self.errors = {}
+        self.sessions = 0
+        self._lock = threading.Lock()
+
+    def record(self, label, seconds, size, failed=False):
+        with self._lock:
+            self.latencies.setdefault(label, []).append(seconds)
+            self.sizes.setdefault(label, []).append(size)
+            self.errors[label] = self.errors.get(label, 0) + int(failed)
+
+    def report(self, elapsed):
+        """
+        :param elapsed: duration of the test in seconds
+        :return: dict with the overall throughput and error rate, and the latency percentiles per label
+        """
+        def summary(latencies, errors, sizes):
+            return dict({'p%d_ms' % p: float(np.percentile(latencies, p)) * 1000 for p in PERCENTILES},
+                        requests=len(latencies), errors=errors, error_rate=errors / float(len(latencies)),
+                        mean_bytes=float(np.mean(sizes)))
+
+        with self._lock:
+            all_latencies = [x for latencies in self.latencies.values() for x in latencies]
+            if len(all_latencies) == 0:
+                return {'elapsed': elapsed, 'requests': 0}
+            total = summary(all_latencies, sum(self.errors.values()),
+                            [x for sizes in self.sizes.values() for x in sizes])
+            return {'elapsed': elapsed,
+                    'sessions': self.sessions,
+                    'requests_per_second': len(all_latencies) / elapsed,
+                    'total': total,
+                    'requests': {label: summary(self.latencies[label], self.errors[label], self.sizes[label])
+                                 for label in sorted(self.latencies)}}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay country-switching sessions against the dashboards.')
+    parser.add_argument('--url', help='base URL of a running server; the app is loaded in-process if omitted')
+    parser.add_argument('--users', type=int, default=4, help='number of concurrent sessions')
+    parser.add_argument('--duration', type=float, default=30, help='length of the test in seconds')
+    parser.add_argument('--switches', type=int, default=5, help='country changes before opening another dashboard')
+    parser.add_argument('--seed', type=int, default=None, help='seed of the random choices')
+    parser.add_argument('--output', help='save the report as JSON')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    if args.url:
+        # the country names are not served on their own; read them from the layout of a page
+        session = Session(HttpClient(args.url), Stats(), [], 0)
+        session.open(DASHBOARDS[0], None)
+        options = session.props.get('country-dropdown.options') or []
+        countries = [option['value'] for option in options]
+        make_client = functools.partial(HttpClient, args.url)
+    else:
+        import index
+        countries = index.datasets.current.countries
+        make_client = functools.partial(LocalClient, index.application)
+
+    stats = Stats()
+    stop = threading.Event()
+    threads = [threading.Thread(target=Session(make_client(), stats, countries, args.switches).run, args=(stop,))
+               for _ in range(args.users)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    report = stats.report(time.perf_counter() - start)
+
+    if 'total' not in report:
+        print("No requests completed")
+        return
+    print("{0} users, {1:.0f} s: {2} sessions, {3:.1f} requests/s, error rate {4:.2%}".format(
+        args.users, report['elapsed'], report['sessions'], report['requests_per_second'],
+        report['total']['error_rate']))
+    for label, summary in [('total', report['total'])] + list(report['requests'].items()):
+        print("{0:<70} {1:6d} req  p50 {2:8.2f} ms  p95 {3:8.2f} ms  p99 {4:8.2f} ms  {5} errors".format(
+            label, summary['requests'], summary['p50_ms'], summary['p95_ms'], summary['p99_ms'], summary['errors']))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+import json
+import threading
+
+import flask
+import plotly
+
+
+class PageRegistry(object):
+    """
+    The dashboard pages served by index.display_page. A page module registers its callbacks when it is imported, which
+    must happen at boot, but its component tree is only built by generate_layout() when the page is first requested,
+    then reused. A worker that never serves a page never builds its layout.
+
+    Once installed, the registry also keeps the serialized responses: the index layout and each page's display_page
+    response are encoded to JSON once per data version, so a route change costs a lookup instead of a tree walk.
+    Layouts and responses are keyed on the data version of the request that built them, so a request still served
+    from the previous dataset after a reload never stores its layout under the new version.
+
+    :param profile: optional StartupProfile the layout builds are recorded in
+    :param default: page served for '/'
+    :param version: function returning the data version of the current request
+    """
+
+    def __init__(self, profile=None, default=None, version=None):
+        self.profile = profile
+        self.default = default
+        self.version = version if version is not None else _unversioned
+        self.modules = {}
+        self.layouts = {}
+        self.responses = {}
+        self.index_layouts = {}
+        self._lock = threading.Lock()
+
+    def add(self, name, module):
+        """
+        :param name: first segment of the page's URL, e.g. 'connectivity'
+        :param module: page module with a generate_layout() function
+        """
+        self.modules[name] = module
+
+    def __contains__(self, name):
+        return name in self.modules
+
+    def page(self, pathname):
+        """
+        :param pathname: URL path, e.g. '/connectivity/Kenya'
+        :return: name of the page serving the path, or None if no page does
+        """
+        name = pathname.split('/')[1] if pathname is not None and '/' in pathname else ''
+        if name == '':
+            return self.default
+        return name if name in self.modules else None
+
+    def layout(self, name):
+        """
+        :param name: name of a registered page
+        :return: component tree of the page, built on the first call for the data version
+        """
+        key = (self.version(), name)
+        if key not in self.layouts:
+            with self._lock:
+                if key not in self.layouts:
+                    if self.profile is not None:
+                        with self.profile.phase('build layout: ' + name):
+                            self.layouts[key] = self.modules[name].generate_layout()
+                    else:
+                        self.layouts[key] = self.modules[name].generate_layout()
+        return self.layouts[key]
+
+    def set_version(self, version):
+        """
+        Called when a new data version is swapped in; drops the layouts and responses built so far, which belong to
+        previous versions.
+        """
+        with self._lock:
+            self.layouts = {}
+            self.responses = {}
+            self.index_layouts = {}
+
+    def install(self, app, callback_id):
+        """
+        Serves the index layout and the responses of the page callback pre-serialized. Call after app.layout is set
+        and the page callback is registered.
+
+        :param app: Dash app
+        :param callback_id: id of the page callback in app.callback_map, e.g. 'page-content.children'
+        """
+        callback = app.callback_map[callback_id]['callback']
+
+        def serve(pathname):
+            # every path of a page, whatever the country in it, gets the same response
+            key = (self.version(), self.page(pathname))
+            response = self.responses.get(key)
+            if response is None:
+                response = callback(pathname)
+                if isinstance(response, str):
+                    response = response.encode('utf-8')
+                self.responses[key] = response
+            return response
+
+        serve.original = callback
+        app.callback_map[callback_id]['callback'] = serve
+
+        layout_path = app.config.routes_pathname_prefix + '_dash-layout'
+
+        @app.server.before_request
+        def serve_index_layout():
+            if flask.request.path != layout_path:
+                return None
+            version = self.version()
+            index_layout = self.index_layouts.get(version)
+            if index_layout is None:
+                layout = app.layout() if callable(app.layout) else app.layout
+                index_layout = json.dumps(layout, cls=plotly.utils.PlotlyJSONEncoder).encode('utf-8')
+                self.index_layouts[version] = index_layout
+            return flask.Response(index_layout, mimetype='application/json')
+
+
+def _unversioned():
+    return None
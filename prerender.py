@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+"""
+Pre-renders every callback that depends only on the selected country, for every country, into one JSON bundle per
+country. The data only changes with the yearly database update, so the bundles can be built once and the callbacks
+serve them directly instead of running pandas and Plotly per request.
+
+To build the bundles after updating the database, run from the repository root:
+
+    python prerender.py
+
+Bundles carry the data version they were built from; callbacks fall back to computing their output when the bundle
+of a country is missing or stale.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+
+# ----- configurable variables -----
+BUNDLE_DIR = 'DA2i_Database/prerendered/'
+COUNTRY_INPUT = [{'id': 'country-dropdown', 'property': 'value'}]
+BUNDLES = 32  # bundles kept in memory; the least recently used one is evicted first
+
+
+def country_callbacks(app):
+    """
+    :param app: Dash app with the dashboard callbacks registered
+    :return: dict of {callback id: callback} for the callbacks whose only input is the country dropdown
+    """
+    return {callback_id: entry['callback'] for callback_id, entry in app.callback_map.items()
+            if entry['inputs'] == COUNTRY_INPUT and not entry['state']}
+
+
+def bundle_file(path, iso3):
+    """
+    :param path: repository root, with a trailing slash
+    :param iso3: ISO3 code of the country
+    :return: path of the country's bundle
+    """
+    return path + BUNDLE_DIR + iso3 + '.json'
+
+
+def complete(callback_id, response):
+    """
+    :param callback_id: id of the callback in app.callback_map
+    :param response: serialized response of the callback
+    :return: True if the response updates every output of the callback; a batched callback leaves out the panels
+    that failed
+    """
+    if not callback_id.startswith('..'):
+        return True
+    updates = json.loads(response)['response']
+    outputs = [output.rsplit('.', 1) for output in callback_id[2:-2].split('...')]
+    return all(prop in updates.get(component_id, {}) for component_id, prop in outputs)
+
+
+def build_bundles(app, countries, dimensions, version, path):
+    """
+    Calls every country callback for every country and writes the serialized responses, one file per country. No
+    bundle is written for a country for which any callback or panel failed, so all its callbacks are computed at
+    request time instead of serving the failure.
+
+    :param app: Dash app with the dashboard callbacks registered
+    :param countries: list of country names
+    :param dimensions: Dimensions used to map country names to ISO3 codes
+    :param version: data version the bundles are built from
+    :param path: repository root, with a trailing slash
+    """
+    if not os.path.isdir(path + BUNDLE_DIR):
+        os.makedirs(path + BUNDLE_DIR)
+
+    # compute every response, even when pre-rendered responses or other wrappers are already installed
+    callbacks = {}
+    for callback_id, callback in country_callbacks(app).items():
+        while hasattr(callback, 'original'):
+            callback = callback.original
+        callbacks[callback_id] = callback
+    for country in countries:
+        file = bundle_file(path, dimensions.country(country, 'ISO3'))
+        responses = {}
+        failed = False
+        for callback_id, callback in callbacks.items():
+            try:
+                responses[callback_id] = callback(country)
+            except Exception as e:
+                print("ERROR: pre-rendering {0} for {1} failed: {2}".format(callback_id, country, e))
+                failed = True
+                continue
+            if not complete(callback_id, responses[callback_id]):
+                print("ERROR: pre-rendering {0} for {1} failed: a panel raised".format(callback_id, country))
+                failed = True
+
+        if failed:
+            # an older bundle must not be served either
+            if os.path.exists(file):
+                os.remove(file)
+            continue
+        with open(file + '.tmp', 'w') as f:
+            json.dump({'version': version, 'country': country, 'responses': responses}, f)
+        os.replace(file + '.tmp', file)
+
+
+class PrerenderedResponses(object):
+    """
+    Serves the pre-rendered responses of the country callbacks. Bundles are read from disk on first use and the most
+    recently used ones are kept in memory, for the countries of the country dimension only; a bundle built from
+    another data version is ignored.
+
+    :param dimensions: Dimensions used to map country names to ISO3 codes
+    :param version: function returning the data version of the current request
+    :param path: repository root, with a trailing slash
+    :param maxsize: maximum number of bundles kept in memory
+    """
+
+    def __init__(self, dimensions, version, path, maxsize=BUNDLES):
+        self.dimensions = dimensions
+        self.version = version
+        self.path = path
+        self.maxsize = maxsize
+        self.bundles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def bundle(self, country):
+        """
+        :return: dict of {callback id: serialized response} for the country, empty if no fresh bundle exists
+        """
+        key = (self.version(), country)
+        with self._lock:
+            responses = self.bundles.get(key)
+            if responses is not None:
+                self.bundles.move_to_end(key)
+                return responses
+
+        try:
+            iso3 = self.dimensions.country(country, 'ISO3')
+        except (KeyError, TypeError):
+            # only known countries are kept, so requests for arbitrary strings do not evict them
+            return {}
+        responses = {}
+        try:
+            with open(bundle_file(self.path, iso3)) as f:
+                bundle = json.load(f)
+            if bundle['version'] == key[0]:
+                responses = bundle['responses']
+        except (KeyError, IOError, ValueError):
+            pass
+
+        with self._lock:
+            self.bundles[key] = responses
+            while len(self.bundles) > self.maxsize:
+                self.bundles.popitem(last=False)
+        return responses
+
+    def set_version(self, version):
+        """
+        Called when a new data version is swapped in; drops the bundles read so far, which belong to previous
+        versions.
+        """
+        with self._lock:
+            self.bundles.clear()
+
+    def install(self, app):
+        """
+        Wraps the country callbacks of the app so they return the pre-rendered response when one exists.
+
+        :param app: Dash app with the dashboard callbacks registered
+        """
+        for callback_id, callback in country_callbacks(app).items():
+            app.callback_map[callback_id]['callback'] = self._serve(callback_id, callback)
+
+    def _serve(self, callback_id, callback):
+        def serve(country):
+            response = self.bundle(country).get(callback_id)
+            return response if response is not None else callback(country)
+        serve.original = callback
+        return serve
+
+
+if __name__ == '__main__':
+    import index  # noqa: F401
+    from app import app, datasets, dimensions, path
+
+    build_bundles(app, datasets.current.countries, dimensions, datasets.version, path)
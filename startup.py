@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile(object):
+    """
+    Wall-clock time of each phase of a worker's boot: heavy imports, data loading, index building and page setup.
+    Work deferred until first use is recorded as well, when it eventually runs.
+
+    :param started: time.perf_counter() value the boot started at; defaults to now
+    """
+
+    def __init__(self, started=None):
+        self.started = started if started is not None else time.perf_counter()
+        self.finished = None
+        self.phases = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Context manager timing one phase.
+
+        :param name: name of the phase, e.g. 'load database'
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases.append((name, time.perf_counter() - start, self.finished is not None))
+
+    def import_modules(self, names):
+        """
+        Imports modules, timing each one as its own phase, without binding them in the caller's namespace.
+
+        :param names: module names, e.g. ['pandas', 'plotly.graph_objs']
+        """
+        for name in names:
+            with self.phase('import ' + name):
+                importlib.import_module(name)
+
+    def finish(self):
+        """
+        Marks the end of the boot; phases recorded afterwards are reported as deferred.
+
+        :return: the boot time in seconds
+        """
+        self.finished = time.perf_counter()
+        return self.boot_time()
+
+    def boot_time(self):
+        """
+        :return: seconds from the start of the boot to finish(), or until now if the boot is not finished
+        """
+        return (self.finished if self.finished is not None else time.perf_counter()) - self.started
+
+    def stats(self):
+        """
+        :return: dict with the boot time and a list of {'phase', 'seconds', 'deferred'} dicts, in order
+        """
+        with self._lock:
+            return {'boot_time': self.boot_time(),
+                    'phases': [{'phase': name, 'seconds': seconds, 'deferred': deferred}
+                               for name, seconds, deferred in self.phases]}
+
+    def report(self):
+        """
+        :return: human-readable table of the phases
+        """
+        stats = self.stats()
+        lines = ["Startup: {0:.3f} s".format(stats['boot_time'])]
+        for phase in stats['phases']:
+            deferred = '  (deferred)' if phase['deferred'] else ''
+            lines.append("  {0:<45} {1:8.3f} s{2}".format(phase['phase'], phase['seconds'], deferred))
+        return '\n'.join(lines)
+
+
+class Deferred(object):
+    """
+    Stand-in for an object that is only built on first use. Attribute access builds the object, once and thread-safely,
+    and forwards to it, so modules can import the name at boot without paying for the build.
+
+    :param name: name of the object in the startup report
+    :param profile: StartupProfile the build is recorded in
+    :param factory: callable building the object, e.g. a class
+    :param args: positional arguments of the factory
+    """
+
+    def __init__(self, name, profile, factory, *args):
+        self._name = name
+        self._profile = profile
+        self._factory = factory
+        self._args = args
+        self._target = None
+        self._lock = threading.Lock()
+
+    def build(self):
+        """
+        :return: the object, built now if it was not yet
+        """
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    with self._profile.phase(self._name):
+                        self._target = self._factory(*self._args)
+        return self._target
+
+    def __getattr__(self, attribute):
+        # only called for attributes the stand-in itself does not have
+        return getattr(self.build(), attribute)
+
+
+# boot profile of this process, started when the module is first imported: entry points import it before anything
+# else so that the imports of dash, pandas and plotly are timed
+profile = StartupProfile()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+import hashlib
+import os
+
+import flask
+
+# ----- configurable variables -----
+FINGERPRINT_LENGTH = 12
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+class StaticAssets(object):
+    """
+    Fingerprinted URLs for the files Dash serves from the assets folder. A URL carries a hash of the file's content,
+    so the browser may cache it for good: a changed file gets a new URL. Components reference these URLs instead of
+    inlining the files as base64 data URIs, which kept them out of the browser cache and inflated every response that
+    contained them.
+
+    :param app: Dash app serving the assets folder
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.folder = app.config.assets_folder
+        self.urls = {}
+
+    def url(self, filename):
+        """
+        :param filename: path of the file, relative to the assets folder
+        :return: URL of the file, fingerprinted with a hash of its content
+        """
+        if filename not in self.urls:
+            version = fingerprint(os.path.join(self.folder, filename))
+            self.urls[filename] = self.app.get_asset_url(filename) + '?v=' + version
+        return self.urls[filename]
+
+    def install(self, server):
+        """
+        Serves fingerprinted asset requests with long-lived, immutable cache headers.
+
+        :param server: Flask server of the Dash app
+        """
+        assets_path = self.app.get_asset_url('')
+
+        @server.after_request
+        def cache_fingerprinted_assets(response):
+            if flask.request.path.startswith(assets_path) and 'v' in flask.request.args \
+                    and response.status_code == 200:
+                response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+            return response
+
+
+def fingerprint(file):
+    """
+    :param file: path of the file
+    :return: hash of the file's content, used as the version of its URL
+    """
+    with open(file, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()[:FINGERPRINT_LENGTH]
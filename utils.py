@@ -9,8 +9,9 @@ import pandas as pd
 import numpy as np
 import math
 import json
+import re
 
-from app import df
+from app import store, latest, regional_averages, ranks, dimensions, figure_cache
 #from app import encoded_image5, encoded_image6
 FREEDOM_COLORS = [["#4a386e", "#9370DB", "#b39be6", '#c9b8ed'], ["#806200", "#FFC300", "#ffd54d", '#ffe180'], ["#086405", "#10C80A", "#58d954", '#88e485']]
 
@@ -99,6 +100,7 @@ def generate_dummy_table():
                           description="Table description")
 
 
+@figure_cache.memoize
 def generate_sparklines_slider_bar_chart(selected_country, indicator, title, categories=None):
     """
     generates a sparklines style (compact) bar chart for the selected country and indicator.
@@ -112,14 +114,11 @@ def generate_sparklines_slider_bar_chart(selected_country, indicator, title, cat
     :return: sparklines bar chart
     """
 
-    #filtered data
-    df_filtered = df[df["Country"] == selected_country]
-    df_filtered = df_filtered[df_filtered["Name"] == indicator] # filtered by selected country and indicator
-    df_filtered = df_filtered.dropna(axis="index",subset=["value"]) # drop rows with missing indicator values
+    # most recent value for the selected country and indicator
+    record = latest.get(selected_country, indicator)
 
-    df_filtered.sort_values('Year',inplace=True)
-    values = df_filtered['value'].tail(1).tolist()[0] if len(df_filtered) != 0 else 'NA'
-    years = int(df_filtered['Year'].tail(1).tolist()[0]) if len(df_filtered) != 0 else 'NA'
+    values = record.value if record is not None else 'NA'
+    years = int(record.year) if record is not None else 'NA'
 
     if years == 'NA':
         yrs_range = [2018,2018.5]
@@ -129,15 +128,8 @@ def generate_sparklines_slider_bar_chart(selected_country, indicator, title, cat
     if values != 'NA' and indicator == "FitW.total.aggregate.score":
         # udate here
 
-        df_filtered = df[df["Country"] == selected_country]
-        # filtered by selected country and indicator
-        df_filtered = df_filtered[df_filtered["Name"] == 'FitW.total.status']
-        # drop rows with missing indicator values
-        df_filtered = df_filtered.dropna(axis="index", subset=["value"])
-
-        df_filtered.sort_values('Year', inplace=True)
-        status = df_filtered['value'].tail(1).tolist(
-        )[0] if len(df_filtered) != 0 else 'NO DATA'
+        # most recent status for the selected country
+        status = latest.value(selected_country, 'FitW.total.status', 'NO DATA')
 
         if status == 1:
             colors = '#10C80A'
@@ -199,7 +191,7 @@ def generate_sparklines_slider_bar_chart(selected_country, indicator, title, cat
                                         dict(
                                             text="NO DATA AVAILABLE",
                                             showarrow=False,
-                                            visible=True if (len(df_filtered) == 0) else False
+                                            visible=True if (record is None) else False
                                         ),
                                         dict(x=0.0,
                                             y=-.85,
@@ -209,8 +201,8 @@ def generate_sparklines_slider_bar_chart(selected_country, indicator, title, cat
                                             ayref='pixel',
                                             xanchor='left',
                                             align='left',
-                                            text='Source: ' + df.loc[df['Name'] == indicator, 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                                              df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+                                            text='Source: ' + dimensions.source(indicator) + ' (' + str(int(
+                                              dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                                             showarrow=False,
                                             font=dict(family='Raleway',size=14)
                                           ),
@@ -265,7 +257,7 @@ def generate_sparklines_slider_bar_chart(selected_country, indicator, title, cat
                                         dict(
                                             text="NO DATA AVAILABLE",
                                             showarrow=False,
-                                            visible=True if (len(df_filtered) == 0) else False
+                                            visible=True if (record is None) else False
                                         ),
                                         dict(x=0.0,
                                             y=-.85,
@@ -275,8 +267,8 @@ def generate_sparklines_slider_bar_chart(selected_country, indicator, title, cat
                                             ayref='pixel',
                                             xanchor='left',
                                             align='left',
-text='Source: ' + df.loc[df['Name'] == indicator, 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                                              df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+text='Source: ' + dimensions.source(indicator) + ' (' + str(int(
+                                              dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                                             showarrow=False,
                                             font=dict(family='Raleway',size=14)
                                           ),
@@ -306,6 +298,7 @@ text='Source: ' + df.loc[df['Name'] == indicator, 'Source'].tail(1).tolist()[0]
     return go.Figure(data=[trace],layout=layout)
 
 
+@figure_cache.memoize
 def generate_sparklines_bar_chart(selected_country, indicator, title, categories=None):
     """
     generates a sparklines style (compact) bar chart for the selected country and indicator.
@@ -320,8 +313,7 @@ def generate_sparklines_bar_chart(selected_country, indicator, title, categories
     """
 
     # filter data
-    df_filtered = df[df["Country"] == selected_country]  # by selected country
-    df_filtered = df_filtered[df_filtered["Name"] == indicator]  # by indicator
+    df_filtered = store.frame(selected_country, indicator)  # by selected country and indicator
     df_filtered = df_filtered.dropna(axis="index", subset=["value"])  # drop rows with missing indicator values
 
     values = list(df_filtered["value"])
@@ -337,8 +329,8 @@ def generate_sparklines_bar_chart(selected_country, indicator, title, categories
         
         annotations=[
             dict(
-                text='Source: ' + df.loc[df['Name'] == indicator, 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                    df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+                text='Source: ' + dimensions.source(indicator) + ' (' + str(int(
+                    dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                 showarrow=False,
                 x=0.0,
                 y=-.65,
@@ -600,7 +592,8 @@ def getCountryData(selected_country, indicator):
     :param indicator: indicator to filter by
     :return: DataFrame filtered by selected_country
     """
-    filtered_df = df.loc[(df['Country'] == selected_country) & (df['Name'] == indicator) & (df['Year'] >= 2006)]
+    filtered_df = store.frame(selected_country, indicator)
+    filtered_df = filtered_df.loc[filtered_df['Year'] >= 2006]
     if (filtered_df.shape[0] == 0):
         filtered_df['Year'] = range(2006, 2017)
         filtered_df['value'] = np.nan
@@ -621,47 +614,27 @@ def getCountryRank(selected_country, region, indicator, ascending=True):
     :param region:
     :return: rank
     """
-    # get latest years data for each country in region
-    rnk = df.loc[(df['Region'] == region) & (df['Name'] == indicator)]
-    rnk.sort_values(['Country', 'Year'], inplace=True)
-    rnk = rnk.groupby('Country').tail(1)
-
-    if ascending is True:
-        rnk.sort_values('value', ascending=False, inplace=True)
-    else:
-        rnk.sort_values('value', inplace=True)
-
-    rnk['ranks'] = range(1, rnk.shape[0] + 1)
+    # look up the rank computed at data-load time from the latest years data
+    rnk = ranks.get(selected_country, region, indicator, by='Region', ascending=ascending)
+    if rnk is None:
+        return 'NA'
 
-    return str(rnk.loc[rnk['Country'] == selected_country, 'ranks'].tolist()[0]) + ' of ' + str(rnk.shape[0])
+    return str(rnk[0]) + ' of ' + str(rnk[1])
 
 
 def weightedAverage(region, indicator):
     """
-    Computes weighted average of indicator by population for the specified region and indicator.
+    Returns the weighted average of indicator by population for the specified region and indicator, read from the
+    regional averages computed at data-load time.
 
-    :return: weighted average or NaN if no data exists
+    :return: DataFrame with 'Year' and 'w_avg' columns, empty if no data exists
     """
-    rgl = df.loc[(df['Region'] == region) & (df['Name'] == indicator)]
-    ## get population data and merge in
-    rgl = rgl.merge(df.loc[(df['Region'] == region) & (df['Name'] == 'population'), ['Country', 'Year', 'value']],
-                    on=['Country', 'Year'],
-                    how='left')
-    
-    rgl['population'] = rgl.groupby('Country')['value_y'].ffill()
-    rgl['population'] = rgl.groupby('Country')['value_y'].bfill()
-
-    ## compute weighted average by year
-    rgl['w_value'] = rgl['value_x'] * rgl['population']
-
-    result = rgl.groupby('Year', as_index=False).agg({'w_value': sum}).merge(rgl.groupby('Year', as_index=False).agg({'population': sum}))
-    result['w_avg'] = result['w_value'] / result['population']
-
-    return result[['Year', 'w_avg']]
+    return regional_averages.series(region, indicator)
 
 
 # -- charts --
 
+@figure_cache.memoize
 def generate_time_series_line_chart(selected_country, indicator, title, ylabel):
     """
     This function generates a time series line chart showing the value of the selected indicator for the selected
@@ -677,12 +650,12 @@ def generate_time_series_line_chart(selected_country, indicator, title, ylabel):
     filtered_df = getCountryData(selected_country, indicator=indicator)
 
     # Compute regional average weighted by country population
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+    rgn = store.region(selected_country)
     regional = weightedAverage(rgn, indicator=indicator)
     maxValue = max([filtered_df['value'].max(), regional['w_avg'].max()]) if len(filtered_df) != 0 else 'NA'
 
 
-    sourceText = 'Source: ' + df.loc[df['Name'] == indicator, 'Source'].tail(1).tolist()[0] + ' (' + str(int(df.loc[df['Name'] == indicator, 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington'
+    sourceText = 'Source: ' + dimensions.source(indicator) + ' (' + str(int(dimensions.db_year(indicator))) + ')<br>Technology & Social Change Group, University of Washington'
 
     return {
         'data': [
@@ -750,40 +723,18 @@ def generate_time_series_line_chart(selected_country, indicator, title, ylabel):
     }
 
 
+@figure_cache.memoize
 def generate_internet_user_gender_gap_chart(selected_country):
     """
     This function generates the "internet user gender gap" chart on the connectivity dashboard.
     :param selected_country: selected country from dropdown
     :return: internet user gender gap chart
     """
-    ## Create and style traces
-    filtered_df = df.loc[(df.Country == selected_country) & \
-                         (df['Name'].isin(['ind.internet.female', 'ind.internet.male',
-                                           'Pct.internet.All.Rural', 'Pct.internet.All.Urban']))]
-    filtered_df.sort_values('Year', inplace=True)
-    
     ## safely pull data, planning for lots of missing
-    x1 = [filtered_df.loc[filtered_df['Name'] == 'ind.internet.male', 'value'].tail(1).tolist()[0] if (filtered_df.shape[
-                                                                                                   0] > 0) & (
-                                                                                                      'ind.internet.male' in
-                                                                                                      filtered_df[
-                                                                                                          'Name'].unique()) else np.nan,
-          filtered_df.loc[filtered_df['Name'] == 'ind.internet.female', 'value'].tail(1).tolist()[0] if (filtered_df.shape[
-                                                                                                     0] > 0) & (
-                                                                                                        'ind.internet.female' in
-                                                                                                        filtered_df[
-                                                                                                            'Name'].unique()) else np.nan]
-    x2 = [
-        filtered_df.loc[filtered_df['Name'] == 'Pct.internet.All.Rural', 'value'].tail(1).tolist()[0] if (filtered_df.shape[
-                                                                                                      0] > 0) & (
-                                                                                                         'Pct.internet.All.Rural' in
-                                                                                                         filtered_df[
-                                                                                                             'Name'].unique()) else np.nan,
-        filtered_df.loc[filtered_df['Name'] == 'Pct.internet.All.Urban', 'value'].tail(1).tolist()[0] if (filtered_df.shape[
-                                                                                                      0] > 0) & (
-                                                                                                         'Pct.internet.All.Urban' in
-                                                                                                         filtered_df[
-                                                                                                           'Name'].unique()) else np.nan]
+    x1 = [latest.value(selected_country, 'ind.internet.male', np.nan),
+          latest.value(selected_country, 'ind.internet.female', np.nan)]
+    x2 = [latest.value(selected_country, 'Pct.internet.All.Rural', np.nan),
+          latest.value(selected_country, 'Pct.internet.All.Urban', np.nan)]
     # Create the graph with subplots
     trace1 = go.Bar(
         x=x1,
@@ -858,13 +809,13 @@ def generate_internet_user_gender_gap_chart(selected_country):
     return fig
 
 
+@figure_cache.memoize
 def generate_mobile_broadband_cost_pie_chart(selected_country):
     pcolors = ['#ff8a5b', '#38C0E1']
-    cost = df.loc[(df.Country == selected_country) & (df.Name == 'mobile.broadband.cost')]
-    cost.sort_values('Year', inplace=True)
+    cost = latest.value(selected_country, 'mobile.broadband.cost')
 
-    if len(cost) != 0:
-        cost = round(cost['value'].iloc[-1], 2)
+    if cost is not None:
+        cost = round(cost, 2)
         gni = 100 - cost if cost < 100 else 0
     else:
         cost = 'NA'
@@ -893,8 +844,7 @@ def generate_mobile_broadband_cost_pie_chart(selected_country):
                                "font": {"family":"Raleway"},
                                "align": "left",
                                "text": 'Source: ' +
-                                       str(df.loc[df['Name'] == 'mobile.broadband.cost', 'Source'].tail(1).tolist()[
-                                           0]) + ' (' + str(int(df.loc[df['Name'] == 'mobile.broadband.cost', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+                                       str(dimensions.source('mobile.broadband.cost')) + ' (' + str(int(dimensions.db_year('mobile.broadband.cost'))) + ')<br>Technology & Social Change Group, University of Washington',
                                "x": 0.00,
                                "y": -0.3
 
@@ -942,6 +892,7 @@ def generate_mobile_broadband_cost_pie_chart(selected_country):
     # -- tables --
 
 
+@figure_cache.memoize
 def generate_most_recent_value_table(selected_country, indicator, indicator_name, format_as_rate=False):
     """
     Generates tables for all but "internet user gender gap" table on the connectivity dashboard.
@@ -953,27 +904,26 @@ def generate_most_recent_value_table(selected_country, indicator, indicator_name
     :return: most recent value table
     """
 
-    # Filter data by selected_country and indicator, then sort by year
-    ind_internet = df.loc[(df.Country == selected_country) & (df.Name == indicator)]
-    ind_internet.sort_values('Year', inplace=True)
+    # most recent and previous values for selected_country and indicator
+    record = latest.get(selected_country, indicator)
 
-    if (len(ind_internet) == 0):
+    if record is None:
         return ""
 
     # find most recent year for which there is data
-    max_year = ind_internet['Year'].tail(1).tolist()[0] if len(ind_internet) != 0 else 'NA'
+    max_year = record.year
 
     # get region of selected_country
-    region = df.loc[df.Country == selected_country, 'Region'].tolist()[0] if len(ind_internet) != 0 else 'NA'
+    region = store.region(selected_country)
 
-    # compute percent change
-    val1 = ind_internet['value'].tail(1).tolist()[0] if len(ind_internet) != 0 else 'NA'
-    val2 = ind_internet['value'].tail(2).head(1).tolist()[0] if len(ind_internet) != 0 else 'NA'
+    # compute percent change; a single observation counts as no change
+    val1 = record.value
+    val2 = record.previous_value if record.previous_value is not None else val1
     if indicator == 'GII':
-        pctChange = round(val1 - val2, 3) if len(ind_internet) != 0 else 'NA'
-        # pctChange = round(((val1 - val2) / val2) * 100, 3) if len(ind_internet) != 0 else 'NA'
+        pctChange = round(val1 - val2, 3)
+        # pctChange = round(((val1 - val2) / val2) * 100, 3)
     else:
-        pctChange = int(round(((val1 - val2) / val2) * 100, )) if len(ind_internet) != 0 else 'NA'
+        pctChange = int(round(((val1 - val2) / val2) * 100, ))
 
     if pctChange == 'NA':
         pctChange = pctChange
@@ -991,19 +941,19 @@ def generate_most_recent_value_table(selected_country, indicator, indicator_name
         pctChange = str(pctChange) + '%'
 
     # create description string  
-    description = str(df.loc[df['Name'] == indicator, 'Long.name'].tail(1).tolist()[0]) \
+    description = str(dimensions.long_name(indicator)) \
                   + '\n\n' \
-                  + str(df.loc[df['Name'] == indicator,'Description'].tail(1).tolist()[0]) \
-                  + '\n\nSource: ' + str(df.loc[df['Name'] == indicator, 'Source'].tail(1).tolist()[0]) \
-                  + ' (' + str(int(df.loc[df['Name'] == indicator, 'db_year'].tail(1).tolist()[0])) + ')'
+                  + str(dimensions.description(indicator)) \
+                  + '\n\nSource: ' + str(dimensions.source(indicator)) \
+                  + ' (' + str(int(dimensions.db_year(indicator))) + ')'
 
     if indicator == 'GII':
-        value = str(round(ind_internet['value'].tail(1).tolist()[0],3)) if len(ind_internet) != 0 else 'NO DATA'
+        value = str(round(val1, 3))
     else:
         if format_as_rate is True:
-            value = str(int(ind_internet['value'].tail(1).tolist()[0])) + '/100' if len(ind_internet) != 0 else 'NO DATA'
+            value = str(int(val1)) + '/100'
         else:
-            value = str(int(round(val1, 0))) + '%' if len(ind_internet) != 0 else 'NO DATA'
+            value = str(int(round(val1, 0))) + '%'
 
     # create table dataframe
     df_table = pd.DataFrame()
@@ -1019,6 +969,7 @@ def generate_most_recent_value_table(selected_country, indicator, indicator_name
     return indicator_table
 
 
+@figure_cache.memoize
 def generate_gender_gap_table(selected_country):
     """
     This function generates a table for the "internet user gender gap" table on the connectivity dashboard.
@@ -1028,9 +979,9 @@ def generate_gender_gap_table(selected_country):
     """
 
     # create DataFrame containing "gender_gap" indicator derived from "ind.internet.female" and "ind.internet.male"
-    dff = df.loc[(df.Country == selected_country) & (df.Name == 'ind.internet.female')]
+    dff = store.frame(selected_country, 'ind.internet.female')
     dff = dff.rename(columns={'value': 'internet.female'})
-    dfm = df.loc[(df.Country == selected_country) & (df.Name == 'ind.internet.male')]
+    dfm = store.frame(selected_country, 'ind.internet.male')
     dfm = dfm.rename(columns={'value': 'internet.male'})
     dff = dff.merge(dfm[['Country', 'Year', 'internet.male']])
     dff['gender_gap'] = ((dff['internet.male'] - dff['internet.female']) / dff['internet.male']) * 100
@@ -1091,14 +1042,14 @@ def generate_gender_gap_table(selected_country):
 # ----- freedom helper functions -----
 
 # -- charts --
+@figure_cache.memoize
 def generate_freedom_in_the_world_chart_political(selected_country, indicators, max_values,indicator_colors, years, title):
     # filter data by country and year
-    df_filtered = df[df["Country"] == selected_country]
+    df_filtered = store.country_frame(selected_country)
     df_filtered = df_filtered[[(y in years) for y in df_filtered["Year"]]]
 
     #filtered data
-    df_filtered_Agg = df[df["Country"] == selected_country]
-    df_filtered_Agg = df_filtered_Agg[df_filtered_Agg["Name"] == "FitW.total.aggregate.score"] # filtered by selected country and indicator
+    df_filtered_Agg = store.frame(selected_country, "FitW.total.aggregate.score") # filtered by selected country and indicator
     df_filtered_Agg = df_filtered_Agg.dropna(axis="index",subset=["value"]) # drop rows with missing indicator values
 
     conditions = [(df_filtered_Agg['value'] < 33.33),(df_filtered_Agg['value'] >= 33.33) & (df_filtered_Agg['value'] < 66.66),(df_filtered_Agg['value'] >= 66.66)]
@@ -1137,7 +1088,7 @@ def generate_freedom_in_the_world_chart_political(selected_country, indicators,
         df_indicator = df_filtered[df_filtered["Name"] == indicator]
         values = list(df_indicator["value"])
         yrs = [str(int(y)) for y in df_indicator["Year"]]
-        name = str(df_indicator["Long.name"].iloc[0])
+        name = str(dimensions.long_name(indicator))
 
         traces.append(go.Bar(  # value trace
             x=values,
@@ -1230,8 +1181,8 @@ def generate_freedom_in_the_world_chart_political(selected_country, indicators,
                 ayref='pixel',
                 xanchor='left',
                 align='left',
-                text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                    df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+                text='Source: ' + dimensions.source('FotN') + ' (' + str(int(
+                    dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                 showarrow=False,
                 font=dict(family='Raleway',size=14)
             )
@@ -1242,14 +1193,14 @@ def generate_freedom_in_the_world_chart_political(selected_country, indicators,
     return go.Figure(data=traces, layout=layout)
 
 
+@figure_cache.memoize
 def generate_freedom_in_the_world_chart(selected_country, indicators, max_values,indicator_colors, years, title):
     # filter data by country and year
-    df_filtered = df[df["Country"] == selected_country]
+    df_filtered = store.country_frame(selected_country)
     df_filtered = df_filtered[[(y in years) for y in df_filtered["Year"]]]
 
     #filtered data
-    df_filtered_Agg = df[df["Country"] == selected_country]
-    df_filtered_Agg = df_filtered_Agg[df_filtered_Agg["Name"] == "FitW.total.aggregate.score"] # filtered by selected country and indicator
+    df_filtered_Agg = store.frame(selected_country, "FitW.total.aggregate.score") # filtered by selected country and indicator
     df_filtered_Agg = df_filtered_Agg.dropna(axis="index",subset=["value"]) # drop rows with missing indicator values
 
     conditions = [(df_filtered_Agg['value'] < 33.33),(df_filtered_Agg['value'] >= 33.33) & (df_filtered_Agg['value'] < 66.66),(df_filtered_Agg['value'] >= 66.66)]
@@ -1286,7 +1237,7 @@ def generate_freedom_in_the_world_chart(selected_country, indicators, max_values
         df_indicator = df_filtered[df_filtered["Name"] == indicator]
         values = list(df_indicator["value"])
         yrs = [str(int(y)) for y in df_indicator["Year"]]
-        name = str(df_indicator["Long.name"].iloc[0])
+        name = str(dimensions.long_name(indicator))
         traces.append(go.Bar(  # value trace
             x=values,
             y=yrs,
@@ -1374,8 +1325,8 @@ def generate_freedom_in_the_world_chart(selected_country, indicators, max_values
                 ayref='pixel',
                 xanchor='left',
                 align='left',
-text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                    df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+text='Source: ' + dimensions.source('FotN') + ' (' + str(int(
+                    dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                 showarrow=False,
                 font=dict(family='Raleway',size=14)
             )
@@ -1385,6 +1336,7 @@ text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + '
     # a figure combining data and layout
     return go.Figure(data=traces, layout=layout)
 
+@figure_cache.memoize
 def generate_political_rights_rating_chart(selected_country):
     """
     This function generates the political rights rating chart.
@@ -1415,6 +1367,7 @@ def generate_political_rights_rating_chart(selected_country):
                                                title=title)
 
 
+@figure_cache.memoize
 def generate_civil_liberties_rating_chart(selected_country):
     """
     This function generates the civil liberties rating chart.
@@ -1451,6 +1404,7 @@ def generate_civil_liberties_rating_chart(selected_country):
                                                title=title)
 
 
+@figure_cache.memoize
 def generate_percent_using_internet_vs_freedom_on_net_chart(selected_country):
     """
     This function generates the percent using internet vs freedom on the net chart.
@@ -1459,13 +1413,14 @@ def generate_percent_using_internet_vs_freedom_on_net_chart(selected_country):
     :return: percent using internet vs freedom on the net chart.
     """
     ## Create and style traces
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
-    selected_country_year = df.loc[(df.Country == selected_country) & (df.Name == 'ind.internet'),'Year'].tolist()
+    rgn = store.region(selected_country)
+    selected_country_year = store.series(selected_country, 'ind.internet')[0].tolist()
     max_year = max(selected_country_year)
     # max_year = 2017
 
     # df.loc[df.groupby(["sp", "mt"])["count"].idxmax()]  
-    x1 = df.loc[(df['Name'] == 'FotN') & (df['Region'] == rgn)]
+    x1 = store.indicator_frame('FotN')
+    x1 = x1.loc[x1['Region'] == rgn]
 
     x1 = x1.sort_values('Year').groupby(['Country']).tail(1)
 
@@ -1473,7 +1428,7 @@ def generate_percent_using_internet_vs_freedom_on_net_chart(selected_country):
     # x1 = x1.sort_values('Year').groupby(['Country']).tail(1)
     # x1 = x1.loc(x1.groupby(['Country'])['Year'].idxmax())
 
-    x2 = df.loc[(df['Name'] == 'ind.internet')].sort_values('Year').groupby(['Country']).tail(1)
+    x2 = store.indicator_frame('ind.internet').sort_values('Year').groupby(['Country']).tail(1)
     x2.rename(columns={'value': 'internet'}, inplace=True)
     x1 = x1.merge(x2[['Country', 'internet']],
                   how='left', left_on=['Country'], right_on=['Country'])
@@ -1551,8 +1506,8 @@ def generate_percent_using_internet_vs_freedom_on_net_chart(selected_country):
                     ayref='pixel',
                     xanchor='left',
                     align='left',
-                    text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                        df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+                    text='Source: ' + dimensions.source('FotN') + ' (' + str(int(
+                        dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                     showarrow=False,
                     font=dict(family='Raleway',size=14)
                 ),
@@ -1635,8 +1590,8 @@ def generate_percent_using_internet_vs_freedom_on_net_chart(selected_country):
                     ayref='pixel',
                     # xanchor='left',
                     align='left',
-text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                        df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+text='Source: ' + dimensions.source('FotN') + ' (' + str(int(
+                        dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                     showarrow=False,
                     font=dict(family='Raleway',size=14)
                 ),
@@ -1680,6 +1635,7 @@ text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + '
         )
     }
 
+@figure_cache.memoize
 def generate_country_percent_using_internet_vs_freedom_on_net_chart(selected_country):
     """
     This function generates the percent using internet vs freedom on the net chart.
@@ -1688,8 +1644,8 @@ def generate_country_percent_using_internet_vs_freedom_on_net_chart(selected_cou
     :return: percent using internet vs freedom on the net chart.
     """
     ## Create and style traces
-    x1 = df.loc[(df.Country == selected_country) & (df['Name'] == 'FotN')]
-    x2 = df.loc[(df['Name'] == 'ind.internet')]
+    x1 = store.frame(selected_country, 'FotN')
+    x2 = store.indicator_frame('ind.internet')
     x2.rename(columns={'value': 'internet'}, inplace=True)
     x3 = x1.merge(x2[['Country', 'Year', 'internet']],how='left', left_on=['Country', 'Year'], right_on=['Country', 'Year'])
     x3.sort_values('Year',inplace=True)
@@ -1748,8 +1704,8 @@ def generate_country_percent_using_internet_vs_freedom_on_net_chart(selected_cou
                         ayref='pixel',
                         xanchor='left',
                         align='left',
-text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                            df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+text='Source: ' + dimensions.source('FotN') + ' (' + str(int(
+                            dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                         showarrow=False,
                         font=dict(family='Raleway',size=14)
                     ),
@@ -1816,8 +1772,8 @@ text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + '
                     ayref='pixel',
                     xanchor='left',
                     align='left',
-text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                        df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+text='Source: ' + dimensions.source('FotN') + ' (' + str(int(
+                        dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                     showarrow=False,
                     font=dict(family='Raleway',size=14)
                 ),
@@ -1849,17 +1805,18 @@ text='Source: ' + df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + '
         return go.Figure(data=[],layout=layout)
 
 
+@figure_cache.memoize
 def generate_freedom_on_the_net_choropleth_chart():
     """
     This function generates the freedom on the net choropleth map.
 
     :return: freedom on the net choropleth map
     """
-    dt = df.loc[df['Name'] == 'FotN']
+    dt = store.indicator_frame('FotN')
     dg = dt.groupby(['Name', 'Country']).aggregate({'Year': 'max'}).reset_index()
     dt = dg.merge(dt[['Name', 'Country', 'ISO3', 'Year', 'value']], how='left', on=['Name', 'Country', 'Year'])
 
-    blanks = df.loc[~(df['ISO3'].isin(dt['ISO3'])), ['Country', 'ISO3']].drop_duplicates()
+    blanks = store.locations.loc[~(store.locations['ISO3'].isin(dt['ISO3']))].copy()
     blanks['Name'] = 'FotN'
     blanks['Year'] = np.nan
     blanks['value'] = np.nan
@@ -1908,6 +1865,7 @@ def generate_freedom_on_the_net_choropleth_chart():
     # -- tables --
 
 
+@figure_cache.memoize
 def generate_freedom_in_the_world_table(selected_country, indicator, max_values,indicator_name):
     """
     This function generates tables associated with both "Freedom in the World Political Rights Rating" and "Freedom
@@ -1919,13 +1877,12 @@ def generate_freedom_in_the_world_table(selected_country, indicator, max_values,
     :param indicator_name: Either "Political Rights Rating" or "Civil Liberties Rating"
     :return: a Dash html.Table component
     """
-    prr = df.loc[(df.Country == selected_country) & (df.Name == indicator)]
-    prr.sort_values('Year', inplace=True)
-    if (prr.shape[0] > 0):
-        value = str(int(prr['value'].tail(1).tolist()[0]))
-        max_year = prr['Year'].tail(1).tolist()[0]
-        rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
-        change = int(prr.iloc[-1,2]) - int(prr.iloc[-2,2])
+    prr = latest.get(selected_country, indicator)
+    if prr is not None:
+        value = str(int(prr.value))
+        max_year = prr.year
+        rgn = store.region(selected_country)
+        change = int(prr.value) - int(prr.previous_value) if prr.previous_value is not None else 'NA'
         rank = getCountryRank(selected_country=selected_country,
                               region=rgn,
                               indicator=indicator,
@@ -1937,10 +1894,10 @@ def generate_freedom_in_the_world_table(selected_country, indicator, max_values,
         change = 'NA'
 
     name = indicator_name
-    description = df.loc[df['Name'] == indicator, 'Long.name'].tail(1).tolist()[0] + '\n\n' + \
-                  df.loc[df['Name'] == indicator, 'Description'].tail(1).tolist()[0] + '\n\nSource: ' + \
-                  df.loc[df['Name'] == indicator, 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-        df.loc[df['Name'] == indicator, 'db_year'].tail(1).tolist()[0])) + ')'
+    description = dimensions.long_name(indicator) + '\n\n' + \
+                  dimensions.description(indicator) + '\n\nSource: ' + \
+                  dimensions.source(indicator) + ' (' + str(int(
+        dimensions.db_year(indicator))) + ')'
 
     if change == 'NA':
         change = str(change)
@@ -1961,6 +1918,7 @@ def generate_freedom_in_the_world_table(selected_country, indicator, max_values,
                           description=description)
 
 
+@figure_cache.memoize
 def generate_percent_using_internet_vs_freedom_on_net_table(selected_country):
     """
     This function generates a table associated with the "% using the internet vs Freedom on the Net" chart.
@@ -1968,13 +1926,12 @@ def generate_percent_using_internet_vs_freedom_on_net_table(selected_country):
     :param selected_country: selected country from dropdown
     :return: a Dash html.Table component
     """
-    fotn = df.loc[(df.Country == selected_country) & (df.Name == 'FotN')]
-    fotn.sort_values('Year', inplace=True)
-    if (fotn.shape[0] > 0):
-        value = int(fotn['value'].tail(1).tolist()[0])
-        max_year = fotn['Year'].tail(1).tolist()[0]
+    fotn = latest.get(selected_country, 'FotN')
+    if fotn is not None:
+        value = int(fotn.value)
+        max_year = fotn.year
         rating = 'Not Free' if value <= 40 else ('Partly Free' if value <= 70 else 'Free')
-        rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+        rgn = store.region(selected_country)
         rank = getCountryRank(selected_country=selected_country,
                               region=rgn,
                               indicator='FotN',
@@ -1986,10 +1943,10 @@ def generate_percent_using_internet_vs_freedom_on_net_table(selected_country):
 
     value = str(value) + '/100' if value != 'NO DATA' else value
     name = 'Freedom on the Net'
-    description = df.loc[df['Name'] == 'FotN', 'Long.name'].tail(1).tolist()[0] + '\n\n' + \
-                  df.loc[df['Name'] == 'FotN', 'Description'].tail(1).tolist()[0] + '\n\nSource: ' + \
-                  df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-        df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')'
+    description = dimensions.long_name('FotN') + '\n\n' + \
+                  dimensions.description('FotN') + '\n\nSource: ' + \
+                  dimensions.source('FotN') + ' (' + str(int(
+        dimensions.db_year('FotN'))) + ')'
 
     df_table = pd.DataFrame()
     df_table[selected_country] = [value]
@@ -2000,6 +1957,7 @@ def generate_percent_using_internet_vs_freedom_on_net_table(selected_country):
                           title=name,
                           description=description)
 
+@figure_cache.memoize
 def generate_country_percent_using_internet_vs_freedom_on_net_table(selected_country):
     """
     This function generates a table associated with the "% using the internet vs Freedom on the Net" chart.
@@ -2007,13 +1965,12 @@ def generate_country_percent_using_internet_vs_freedom_on_net_table(selected_cou
     :param selected_country: selected country from dropdown
     :return: a Dash html.Table component
     """
-    fotn = df.loc[(df.Country == selected_country) & (df.Name == 'FotN')]
-    fotn.sort_values('Year', inplace=True)
-    if (fotn.shape[0] > 0):
-        value = int(fotn['value'].tail(1).tolist()[0])
-        max_year = fotn['Year'].tail(1).tolist()[0]
+    fotn = latest.get(selected_country, 'FotN')
+    if fotn is not None:
+        value = int(fotn.value)
+        max_year = fotn.year
         rating = 'Free' if value <= 30 else ('Partly Free' if value <= 60 else 'Not Free')
-        rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+        rgn = store.region(selected_country)
         rank = getCountryRank(selected_country=selected_country,
                               region=rgn,
                               indicator='FotN',
@@ -2024,10 +1981,10 @@ def generate_country_percent_using_internet_vs_freedom_on_net_table(selected_cou
         rating = 'NA'
 
     name = 'Freedom on the Net'
-    description = df.loc[df['Name'] == 'FotN', 'Long.name'].tail(1).tolist()[0] + '\n\n' + \
-                  df.loc[df['Name'] == 'FotN', 'Description'].tail(1).tolist()[0] + '\n\nSource: ' + \
-                  df.loc[df['Name'] == 'FotN', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-        df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')'
+    description = dimensions.long_name('FotN') + '\n\n' + \
+                  dimensions.description('FotN') + '\n\nSource: ' + \
+                  dimensions.source('FotN') + ' (' + str(int(
+        dimensions.db_year('FotN'))) + ')'
 
     df_table = pd.DataFrame()
     df_table["Score"] = [value]
@@ -2042,6 +1999,7 @@ def generate_country_percent_using_internet_vs_freedom_on_net_table(selected_cou
     # ----- gender helper functions -----
 
 
+@figure_cache.memoize
 def generate_technology_use_chart(selected_country,title_text):
     """
     This function generates the "technology use" chart in the gender dashboard.
@@ -2050,11 +2008,10 @@ def generate_technology_use_chart(selected_country,title_text):
     :return: technology use chart
     """
     ## Create and style traces
-    filtered_df = df.loc[(df.Country == selected_country) & \
-                         (df['Name'].isin(['ind.internet.female', 'ind.internet.male',
-                                           'Computer.use.female', 'Computer.use.male',
-                                           'mobile.use.female', 'mobile.use.male']))]
-    filtered_df.sort_values('Year', inplace=True)
+    filtered_df = store.indicators_frame(selected_country,
+                                         ['ind.internet.female', 'ind.internet.male',
+                                          'Computer.use.female', 'Computer.use.male',
+                                          'mobile.use.female', 'mobile.use.male'])
 
     ## safely pull data, planning for lots of missing
     x1 = [filtered_df.loc[filtered_df['Name'] == 'ind.internet.male', 'value'].tolist()[0] if (filtered_df.shape[
@@ -2188,12 +2145,12 @@ def generate_technology_use_chart(selected_country,title_text):
 
     return fig
 
+@figure_cache.memoize
 def generate_technology_use_table(selected_country, title_text):
-    filtered_df = df.loc[(df.Country == selected_country) & \
-                         (df['Name'].isin(['ind.internet.female', 'ind.internet.male',
-                                           'Computer.use.female', 'Computer.use.male',
-                                           'mobile.use.female', 'mobile.use.male']))]
-    filtered_df.sort_values('Year', inplace=True)
+    filtered_df = store.indicators_frame(selected_country,
+                                         ['ind.internet.female', 'ind.internet.male',
+                                          'Computer.use.female', 'Computer.use.male',
+                                          'mobile.use.female', 'mobile.use.male'])
 
     ## safely pull data, planning for lots of missing
     x1 = [filtered_df.loc[filtered_df['Name'] == 'ind.internet.male', 'value'].tolist()[0] if (filtered_df.shape[
@@ -2242,6 +2199,7 @@ def generate_technology_use_table(selected_country, title_text):
 
     return indicator_table
 
+@figure_cache.memoize
 def generate_ict_skills_chart(selected_country,title_text):
     """
     This function generates the "ict skills" chart in the gender dashboard.
@@ -2250,11 +2208,10 @@ def generate_ict_skills_chart(selected_country,title_text):
     :return: ict skills chart
     """
     ## Create and style traces
-    filtered_df = df.loc[(df.Country == selected_country) & \
-                         (df['Name'].isin(['IS.F.Using copy and p', 'IS.M.Using copy and p',
-                                           'IS.F.Using basic arit', 'IS.M.Using basic arit',
-                                           'IS.F.Writing a comput', 'IS.M.Writing a comput']))]
-    filtered_df.sort_values('Year', inplace=True)
+    filtered_df = store.indicators_frame(selected_country,
+                                         ['IS.F.Using copy and p', 'IS.M.Using copy and p',
+                                          'IS.F.Using basic arit', 'IS.M.Using basic arit',
+                                          'IS.F.Writing a comput', 'IS.M.Writing a comput'])
 
     ## safely pull data, planning for lots of missing
     x1 = [filtered_df.loc[filtered_df['Name'] == 'IS.M.Using copy and p', 'value'].tolist()[0] if (filtered_df.shape[
@@ -2392,13 +2349,13 @@ def generate_ict_skills_chart(selected_country,title_text):
     return fig
 
 
+@figure_cache.memoize
 def generate_ict_skills_table(selected_country, title_text):
     ## Create and style traces
-    filtered_df = df.loc[(df.Country == selected_country) & \
-                         (df['Name'].isin(['IS.F.Using copy and p', 'IS.M.Using copy and p',
-                                           'IS.F.Using basic arit', 'IS.M.Using basic arit',
-                                           'IS.F.Writing a comput', 'IS.M.Writing a comput']))]
-    filtered_df.sort_values('Year', inplace=True)
+    filtered_df = store.indicators_frame(selected_country,
+                                         ['IS.F.Using copy and p', 'IS.M.Using copy and p',
+                                          'IS.F.Using basic arit', 'IS.M.Using basic arit',
+                                          'IS.F.Writing a comput', 'IS.M.Writing a comput'])
 
     ## safely pull data, planning for lots of missing
     x1 = [filtered_df.loc[filtered_df['Name'] == 'IS.M.Using copy and p', 'value'].tolist()[0] if (filtered_df.shape[
@@ -2448,6 +2405,7 @@ def generate_ict_skills_table(selected_country, title_text):
     return indicator_table
 
 
+@figure_cache.memoize
 def generate_unemployment_chart(selected_country,title_text):
     """
     This function generates the UNEMPLOYMENT chart in the gender dashboard.
@@ -2459,12 +2417,12 @@ def generate_unemployment_chart(selected_country,title_text):
     women = getCountryData(selected_country, 'Unemp.Female')
     men = getCountryData(selected_country, 'Unemp.Male')
     ## Compute regional average weighted by country population
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+    rgn = store.region(selected_country)
     regional = weightedAverage(rgn, 'Unemp.Female')
     regional_male = weightedAverage(rgn, 'Unemp.Male')
     maxValue = max([women['value'].max(), regional['w_avg'].max()])
-    src_text = 'Source: ' + df.loc[df['Name'] == 'Unemp.Female', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-        df.loc[df['Name'] == 'Unemp.Female', 'db_year'].tail(1).tolist()[0]))+ ')<br>Technology & Social Change Group, University of Washington'
+    src_text = 'Source: ' + dimensions.source('Unemp.Female') + ' (' + str(int(
+        dimensions.db_year('Unemp.Female')))+ ')<br>Technology & Social Change Group, University of Washington'
     ct = women['Country'].tolist()[0]
     
     return {
@@ -2539,6 +2497,7 @@ def generate_unemployment_chart(selected_country,title_text):
     }
 
 
+@figure_cache.memoize
 def generate_neet_chart(selected_country,title_text):
     """
     This function generates the NEET chart in the gender dashboard.
@@ -2550,12 +2509,12 @@ def generate_neet_chart(selected_country,title_text):
     women = getCountryData(selected_country, 'NEET.Female')
     men = getCountryData(selected_country, 'NEET.Male')
     ## Compute regional average weighted by country population
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+    rgn = store.region(selected_country)
     regional = weightedAverage(rgn, 'NEET.Female')
     regional_male = weightedAverage(rgn, 'NEET.Male')
     maxValue = max([women['value'].max(), regional['w_avg'].max()])
-    src_text = 'Source: ' + df.loc[df['Name'] == 'NEET.Female', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-        df.loc[df['Name'] == 'NEET.Female', 'db_year'].tail(1).tolist()[0]))+ ')<br>Technology & Social Change Group, University of Washington'
+    src_text = 'Source: ' + dimensions.source('NEET.Female') + ' (' + str(int(
+        dimensions.db_year('NEET.Female')))+ ')<br>Technology & Social Change Group, University of Washington'
     ct = women['Country'].tolist()[0]
     
     return {
@@ -2630,6 +2589,7 @@ def generate_neet_chart(selected_country,title_text):
     }
 
 
+@figure_cache.memoize
 def generate_gender_inequality_choropleth():
     """
     This function generates the gender inequality choropleth chart in the gender dashboard.
@@ -2637,7 +2597,7 @@ def generate_gender_inequality_choropleth():
     :param selected_country: selected country from dropdown
     :return: gender inequality choropleth chart
     """
-    dt = df.loc[df['Name'] == 'GII']
+    dt = store.indicator_frame('GII')
     dg = dt.groupby(['Name', 'Country']).aggregate({'Year': 'max'}).reset_index()
     dt = dg.merge(dt[['Name', 'Country', 'ISO3', 'Year', 'value']], how='left', on=['Name', 'Country', 'Year'])
 
@@ -2680,6 +2640,7 @@ def generate_gender_inequality_choropleth():
     }
 
 
+@figure_cache.memoize
 def generate_gender_inequality_vs_internet_use_chart(selected_country):
     """
     This function generates the gender inequality vs internet use chart in the gender dashboard.
@@ -2687,8 +2648,9 @@ def generate_gender_inequality_vs_internet_use_chart(selected_country):
     :param selected_country: selected country from dropdown
     :return: gender inequality vs internet use chart
     """
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
-    yaxis = df.loc[(df['Name'].isin(pd.Series(['ind.internet.female', 'GII']))) & (df['Region'] == rgn)]
+    rgn = store.region(selected_country)
+    yaxis = store.indicator_frame(['ind.internet.female', 'GII'])
+    yaxis = yaxis.loc[yaxis['Region'] == rgn]
     dg = yaxis.groupby(['Name', 'Country']).aggregate({'Year': 'max'}).reset_index()
     yaxis = dg.merge(yaxis[['Name', 'Country', 'Year', 'value']], how='left', on=['Name', 'Country', 'Year'])
     yaxis = yaxis[['Name', 'Country', 'value']].pivot('Country', 'Name', 'value').reset_index()
@@ -2754,8 +2716,8 @@ def generate_gender_inequality_vs_internet_use_chart(selected_country):
                     ayref='pixel',
                     xanchor='left',
                     align='left',
-                    text='Source: ' + df.loc[df['Name'] == 'GII', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                        df.loc[df['Name'] == 'FotN', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+                    text='Source: ' + dimensions.source('GII') + ' (' + str(int(
+                        dimensions.db_year('FotN'))) + ')<br>Technology & Social Change Group, University of Washington',
                     showarrow=False,
                     font=dict(family='Raleway')
                 ),
@@ -2800,6 +2762,7 @@ def generate_gender_inequality_vs_internet_use_chart(selected_country):
         )
     }
 
+@figure_cache.memoize
 def generate_women_in_parliament_line_chart(selected_country,title_text):
     """
     This function generates the women in Parliament chart the gender dashboard.
@@ -2810,10 +2773,10 @@ def generate_women_in_parliament_line_chart(selected_country,title_text):
     ## Create and style traces
     filtered_df = getCountryData(selected_country, 'SG.GEN.PARL.ZS')
     ## Compute regional average weighted by country population
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+    rgn = store.region(selected_country)
     regional = weightedAverage(rgn, 'SG.GEN.PARL.ZS')
 
-    src_text = 'Source: ' + df.loc[df['Name'] == 'SG.GEN.PARL.ZS', 'Source'].tail(1).tolist()[0] + ' (2019)<br>Technology & Social Change Group, University of Washington'
+    src_text = 'Source: ' + dimensions.source('SG.GEN.PARL.ZS') + ' (2019)<br>Technology & Social Change Group, University of Washington'
 
     return {
         'data': [
@@ -2891,6 +2854,7 @@ def generate_women_in_parliament_line_chart(selected_country,title_text):
         )
     }
 
+@figure_cache.memoize
 def generate_women_in_stem_line_chart(selected_country,title_text):
     """
     This function generates the women in STEM chart the gender dashboard.
@@ -2901,10 +2865,10 @@ def generate_women_in_stem_line_chart(selected_country,title_text):
     ## Create and style traces
     filtered_df = getCountryData(selected_country, 'women.in.stem')
     ## Compute regional average weighted by country population
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+    rgn = store.region(selected_country)
     regional = weightedAverage(rgn, 'women.in.stem')
-    src_text = 'Source: ' + df.loc[df['Name'] == 'women.in.stem', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-        df.loc[df['Name'] == 'women.in.stem', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington'
+    src_text = 'Source: ' + dimensions.source('women.in.stem') + ' (' + str(int(
+        dimensions.db_year('women.in.stem'))) + ')<br>Technology & Social Change Group, University of Washington'
 
     return {
         'data': [
@@ -2982,6 +2946,7 @@ def generate_women_in_stem_line_chart(selected_country,title_text):
         )
     }
 
+@figure_cache.memoize
 def generate_educational_attainment_basic_level_by_gender_bar_chart(selected_country,title_text):
     """
     This function generates educational attainment basic level by gender bar chart,
@@ -2998,7 +2963,8 @@ def generate_educational_attainment_basic_level_by_gender_bar_chart(selected_cou
     primary_men = getCountryData(selected_country,'primary.male')
     men_df_final = primary_men.sort_values('Year')
     men_df_final['New_Name'] = PLOT_COLORS["men"]
-    max_val = max(df.loc[df['Name'].str.contains("primary.female")==True,'value'].tolist())
+    primary_female = [name for name in store.indicator_names() if re.search("primary.female", name)]
+    max_val = max(store.indicator_frame(primary_female)['value'].tolist())
 
 ##    primary_total = getCountryData(selected_country,'primary.total')
 ##    total_df_final = primary_total.sort_values('Year')
@@ -3105,8 +3071,8 @@ def generate_educational_attainment_basic_level_by_gender_bar_chart(selected_cou
                     ayref='pixel',
                     #xanchor='left',
                     align='left',
-text='Source: ' + df.loc[df['Name'] == 'primary.female', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-                        df.loc[df['Name'] == 'primary.female', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington',
+text='Source: ' + dimensions.source('primary.female') + ' (' + str(int(
+                        dimensions.db_year('primary.female'))) + ')<br>Technology & Social Change Group, University of Washington',
                     showarrow=False,
                     font=dict(family='Raleway')
                 )
@@ -3118,6 +3084,7 @@ text='Source: ' + df.loc[df['Name'] == 'primary.female', 'Source'].tail(1).tolis
     return fig
 
     
+@figure_cache.memoize
 def generate_educational_attainment_by_gender_bar_chart(selected_country,title_text):
     """
     This function generates the educational attainment by gender bar chart the gender dashboard.
@@ -3136,8 +3103,8 @@ def generate_educational_attainment_by_gender_bar_chart(selected_country,title_t
     bachelors_f = getCountryData(selected_country, 'bachelors.female')
     bachelors_m = getCountryData(selected_country, 'bachelors.male')
 
-    src_text = 'Source: ' + df.loc[df['Name'] == 'primary.female', 'Source'].tail(1).tolist()[0] + ' (' + str(int(
-        df.loc[df['Name'] == 'primary.female', 'db_year'].tail(1).tolist()[0])) + ')<br>Technology & Social Change Group, University of Washington'
+    src_text = 'Source: ' + dimensions.source('primary.female') + ' (' + str(int(
+        dimensions.db_year('primary.female'))) + ')<br>Technology & Social Change Group, University of Washington'
 
     # Create the graph with subplots
 
@@ -3239,12 +3206,13 @@ def generate_educational_attainment_by_gender_bar_chart(selected_country,title_t
     return fig
 
 
+@figure_cache.memoize
 def generate_3g_mobile_coverage_bar_and_line_chart(selected_country, indicator, title, ylabel):
     ## Create and style traces
     filtered_df = getCountryData(selected_country, indicator)
 
     ## Compute regional average weighted by country population
-    rgn = df.loc[df.Country == selected_country, 'Region'].tolist()[0]
+    rgn = store.region(selected_country)
     regional = weightedAverage(rgn, indicator)
     return {
         'data': [
@@ -3305,9 +3273,8 @@ def generate_3g_mobile_coverage_bar_and_line_chart(selected_country, indicator,
                     ayref='pixel',
                     xanchor='left',
                     align='left',
-text='Source: ' + df.loc[df['Name'] == 'at.least.3G.coverage', 'Source'].tail(1).tolist()[
-                        0] + ' (' + str(int(
-                        df.loc[df['Name'] == 'at.least.3G.coverage', 'db_year'].tail(1).tolist()[0])) + ') <br>Technology & Social Change Group, University of Washington',
+text='Source: ' + dimensions.source('at.least.3G.coverage') + ' (' + str(int(
+                        dimensions.db_year('at.least.3G.coverage'))) + ') <br>Technology & Social Change Group, University of Washington',
                     showarrow=False,font=dict(family='Raleway')
                 )
             ]